@@ -32,6 +32,7 @@ setup(
         'console_scripts': [
             'tigrinya-normalize = tigrinya_normalizer.cli:main',
             'tigrinya-dictgen = tigrinya_normalizer.cli_dictgen:main',
+            'tigrinya-bench = tigrinya_normalizer.cli_bench:main',
         ],
     },
 
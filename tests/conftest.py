@@ -1,4 +1,5 @@
 import os
+import shutil
 import pytest
 from tigrinya_normalizer.normalizer import TigrinyaNormalizer
 
@@ -16,4 +17,12 @@ def sample_dataset_path():
 
 @pytest.fixture
 def normalizer(dict_path, sample_dataset_path):
-    return TigrinyaNormalizer(dict_path=dict_path, dataset_file=sample_dataset_path)
\ No newline at end of file
+    return TigrinyaNormalizer(dict_path=dict_path, dataset_file=sample_dataset_path)
+
+
+@pytest.fixture
+def dict_copy(dict_path, tmp_path):
+    """A writable copy of the dictionaries directory."""
+    target = tmp_path / "dictionaries"
+    shutil.copytree(dict_path, str(target))
+    return target
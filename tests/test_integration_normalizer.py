@@ -46,3 +46,153 @@ def test_normalize_and_save_with_tempfile(full_normalizer, tmp_path):
     assert "ሃገራዊ ማሕበር መንእሰያትን ተማሃሮን ኤርትራ" in output_text
     assert "።" in output_text
     assert "ኢዮም" in output_text
+
+
+# Test 4: Integration — scanner engine matches the regex pipeline
+@pytest.mark.parametrize("text, punctuation", [
+    ("ሃ.ማ.መ.ተ.ኤ ቤ/ት ቀይሕ-ባሕሪ ባህላዊ ምርኢት ከቕርቡ ናብ ደቀምሓረ ክኸዱ እዮም ።", None),
+    ("ቤ/ት ስነ-ኪነት ማይ-ሓባር ብዙሓት ተማሃሮ ኣመሪቓ።", "።"),
+    ("ኣብ 1990 ዓመት ምሕረት ማን  ዩናይትድ ማን ዩናይትድ ሽሕ'ኳ ናይ'ቲ እውን\nሞ ሃማመተኤ", None),
+    ("Xዓመት ምሕረትY ወ ሮ\tወ ሮ ኤፍ ሲ።", "።'"),
+    ("", None),
+])
+def test_scanner_engine_matches_regex(full_normalizer, text, punctuation):
+    scanner = TigrinyaNormalizer(dict_path="dictionaries", engine="scanner")
+    assert scanner.normalize(text, punctuation) == full_normalizer.normalize(text, punctuation)
+
+
+def test_scanner_joinable_chain_stays_bounded(full_normalizer, monkeypatch):
+    # Every gap in the chain could start "ዓመት ምሕረት"; the scanner must not re-read the whole chain per token.
+    from tigrinya_normalizer.scanner import StreamingSub
+
+    text = "ምት " * 4000 + "ዓመት ምሕረት ማን ዩናይትድ " * 500 + "ምት"
+    buffered = []
+    feed = StreamingSub.feed
+
+    def recording_feed(self, piece):
+        out = feed(self, piece)
+        buffered.append(len(self.buffer))
+        return out
+
+    monkeypatch.setattr(StreamingSub, "feed", recording_feed)
+    scanner = TigrinyaNormalizer(dict_path="dictionaries", engine="scanner")
+    assert scanner.normalize(text) == full_normalizer.normalize(text)
+    assert len(buffered) > 4000 and max(buffered) < 64
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        TigrinyaNormalizer(dict_path="dictionaries", engine="fast")
+
+
+# Test 5: Integration — streaming .normalize_and_save() matches the in-memory path
+@pytest.mark.parametrize("chunk_size", [1, 5, 64])
+def test_normalize_and_save_stream(full_normalizer, tmp_path, chunk_size):
+    input_text = "ሃ.ማ.መ.ተ.ኤ ቤ/ት ቀይሕ-ባሕሪ ክኸዱ እዮም። ኣብ 1990 ዓመት\nምሕረት ማን ዩናይትድ ሽሕ'ኳ ናይ'ቲ ምርኢት፧ ሞ"
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(input_text, encoding="utf-8")
+
+    full_normalizer.dataset = str(input_file)
+    full_normalizer.output_dir = str(tmp_path)
+    full_normalizer.normalize_and_save("full.txt", punctuation_to_keep="።፧")
+    full_normalizer.normalize_and_save("stream.txt", punctuation_to_keep="።፧", stream=True, chunk_size=chunk_size)
+
+    expected = (tmp_path / "full.txt").read_text(encoding="utf-8")
+    assert (tmp_path / "stream.txt").read_text(encoding="utf-8") == expected
+    assert len(expected.splitlines()) == 3
+
+
+def test_normalize_stream_chunks_split_tokens(full_normalizer):
+    text = "ቤ/ት ቀይሕ-ባሕሪ ዓመት ምሕረት። ማን ዩናይትድ እዮም"
+    chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+    sentences = list(full_normalizer.normalize_stream(chunks, punctuation_to_keep="።"))
+    assert " ".join(sentences) == full_normalizer.normalize(text, punctuation_to_keep="።")
+    assert len(sentences) == 2
+
+
+def test_stream_memory_on_joinable_chain():
+    import tracemalloc
+
+    scanner = TigrinyaNormalizer(dict_path="dictionaries", engine="scanner").plan.scanner
+    chunks = ("ምት " * 1000 for _ in range(200))
+    words = scanner.iter_words(chunks)
+    assert next(words) == "ምት"
+    tracemalloc.start()
+    try:
+        assert sum(1 for _ in words) == 200000 - 1
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # The input is 1.2 MB; only the current chunk and a key's worth of text stay buffered.
+    assert peak < 256 * 1024
+
+
+# Test 6: Integration — parallel normalization keeps order and output
+def test_normalize_file_parallel_matches_serial(full_normalizer, tmp_path):
+    from tigrinya_normalizer.parallel import normalize_file_parallel
+
+    lines = ["ሃ.ማ.መ.ተ.ኤ ቤ/ት ቀይሕ-ባሕሪ ክኸዱ እዮም።", "ማን ዩናይትድ ሽሕ'ኳ ናይ'ቲ", "ምርኢት፧ ሞ ስነ-ኪነት"] * 40
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("\n".join(lines), encoding="utf-8")
+
+    full_normalizer.dataset = str(input_file)
+    full_normalizer.output_dir = str(tmp_path)
+    full_normalizer.normalize_and_save("serial.txt", punctuation_to_keep="።፧")
+
+    reports = normalize_file_parallel(full_normalizer, str(input_file), str(tmp_path / "parallel.txt"),
+                                      workers=2, punctuation_to_keep="።፧", chunk_size=200)
+
+    expected = (tmp_path / "serial.txt").read_text(encoding="utf-8")
+    assert (tmp_path / "parallel.txt").read_text(encoding="utf-8") == expected
+    assert sum(r["chunks"] for r in reports) > 1
+    assert sum(r["bytes"] for r in reports) == input_file.stat().st_size
+
+
+# Test 6b: Integration — without fork, workers rebuild the normalizer from its arguments
+def test_normalize_file_parallel_without_fork(dict_path, tmp_path, monkeypatch):
+    import gzip
+    import multiprocessing
+    from tigrinya_normalizer import parallel
+
+    get_context = multiprocessing.get_context
+
+    def no_fork(method=None):
+        if method == "fork":
+            raise ValueError("cannot find context for 'fork'")
+        return get_context(method)
+
+    monkeypatch.setattr(multiprocessing, "get_context", no_fork)
+    lines = ["ሃ.ማ.መ.ተ.ኤ ቤ/ት ቀይሕ-ባሕሪ ክኸዱ እዮም።", "ማን ዩናይትድ ሽሕ'ኳ ናይ'ቲ ሠላም"] * 20
+    input_file = tmp_path / "input.txt.gz"
+    input_file.write_bytes(gzip.compress("\n".join(lines).encode("utf-8")))
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, fold="phonetic")
+    normalizer.normalize_file(str(input_file), str(tmp_path / "serial.txt"))
+
+    parallel._worker_normalizer = normalizer
+    reports = parallel.normalize_file_parallel(normalizer, str(input_file), str(tmp_path / "parallel.txt"),
+                                               workers=2, chunk_size=200)
+    assert parallel._worker_normalizer is None
+    assert (tmp_path / "parallel.txt").read_text(encoding="utf-8") == \
+        (tmp_path / "serial.txt").read_text(encoding="utf-8")
+    # Both paths report decoded bytes, not the size of the compressed file.
+    decoded = len("\n".join(lines).encode("utf-8"))
+    assert sum(r["bytes"] for r in reports) == decoded
+    assert parallel.normalize_file_parallel(normalizer, str(input_file), str(tmp_path / "one.txt"),
+                                            workers=1)[0]["bytes"] == decoded
+
+    custom = TigrinyaNormalizer(dict_path=dict_path, stages=[lambda text: text, "strip_punctuation"])
+    with pytest.raises(ValueError):
+        parallel._pool(custom, 2)
+    assigned = TigrinyaNormalizer(dict_path=dict_path)
+    assigned.dictionaries["clitic_dict"] = {"ሞ": "ሞ"}
+    with pytest.raises(ValueError):
+        parallel._pool(assigned, 2)
+
+
+# Test 7: Integration — batch API matches mapping .normalize()
+def test_normalize_batch_matches_normalize(full_normalizer):
+    texts = ["ቤ/ት ቀይሕ-ባሕሪ ክኸዱ እዮም።", "", "ማን ዩናይትድ", "ሽሕ'ኳ ናይ'ቲ ሞ", "ዓመት ምሕረት ቤ/ት"] * 3
+    for punctuation in (None, "።"):
+        expected = [full_normalizer.normalize(t, punctuation) for t in texts]
+        assert full_normalizer.normalize_batch(texts, punctuation) == expected
+        assert list(full_normalizer.normalize_iter(iter(texts), punctuation)) == expected
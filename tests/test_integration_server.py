@@ -0,0 +1,81 @@
+import json
+import asyncio
+import pytest
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.server import NormalizationServer, LatencyHistogram
+
+TEXTS = ["ቤ/ት ቀይሕ-ባሕሪ ሽሕ'ኳ", "ማን ዩናይትድ ቤ/ት", "ሰላም ዓለም።", ""]
+
+
+async def request(address, method, path, payload=None):
+    reader, writer = await asyncio.open_connection(*address)
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data.decode("utf-8"))
+
+
+def run_server(normalizer, scenario, **options):
+    loop = asyncio.new_event_loop()
+    server = NormalizationServer(normalizer, **options)
+
+    async def main():
+        address = await server.start(port=0)
+        try:
+            return await scenario(address)
+        finally:
+            await server.close()
+
+    try:
+        return loop.run_until_complete(main()), server
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_concurrent_requests_are_batched(dict_path, workers):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, engine="scanner")
+    texts = TEXTS * 10
+
+    async def scenario(address):
+        return await asyncio.gather(*(request(address, "POST", "/normalize", {"text": t}) for t in texts))
+
+    responses, server = run_server(normalizer, scenario, max_batch_size=16, max_wait_ms=50, workers=workers)
+    assert [status for status, _ in responses] == [200] * len(texts)
+    assert [body["normalized"] for _, body in responses] == [normalizer.normalize(t) for t in texts]
+    stats = server.stats()
+    assert stats["texts"] == len(texts)
+    assert 1 < stats["max_batch_size"] <= 16
+    assert stats["latency"]["request"]["count"] == len(texts)
+
+
+def test_list_requests_punctuation_and_stats(dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, engine="scanner")
+
+    async def scenario(address):
+        listed = await request(address, "POST", "/normalize", {"texts": TEXTS, "punctuation": "።"})
+        bad = await request(address, "POST", "/normalize", {"texts": "ሰላም"})
+        missing = await request(address, "GET", "/nowhere")
+        stats = await request(address, "GET", "/stats")
+        return listed, bad, missing, stats
+
+    (listed, bad, missing, stats), _ = run_server(normalizer, scenario)
+    assert listed == (200, {"normalized": [normalizer.normalize(t, "።") for t in TEXTS]})
+    assert bad[0] == 400 and "error" in bad[1]
+    assert missing[0] == 404
+    assert stats[0] == 200 and stats[1]["requests"] == 1 and stats[1]["batches"] == 1
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram(bounds=(1, 10, 100))
+    for ms in (0.5, 0.7, 5, 50, 500):
+        histogram.observe(ms)
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"<=1": 2, "<=10": 1, "<=100": 1, "+Inf": 1}
+    assert snapshot["p50_ms"] == 10
+    assert snapshot["p99_ms"] == 500
@@ -0,0 +1,43 @@
+import json
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer, DEFAULT_DICT_FILES
+from tigrinya_normalizer.artifact import compile_artifact, open_artifact, ARTIFACT_NAME
+
+
+def test_compile_artifact_round_trip(dict_copy):
+    compile_artifact(str(dict_copy), DEFAULT_DICT_FILES)
+    artifact = open_artifact(str(dict_copy))
+    try:
+        for name, filename in DEFAULT_DICT_FILES.items():
+            with open(dict_copy / filename, encoding="utf-8") as f:
+                expected = json.load(f)
+            assert artifact.is_fresh(name, filename, str(dict_copy))
+            assert list(artifact.load(name).items()) == list(expected.items())
+    finally:
+        artifact.close()
+
+
+def test_normalizer_loads_fresh_artifact(dict_copy):
+    compile_artifact(str(dict_copy), DEFAULT_DICT_FILES)
+    normalizer = TigrinyaNormalizer(dict_path=str(dict_copy))
+    normalizer.dictionaries.load()
+    assert set(normalizer.dictionary_sources.values()) == {"artifact"}
+    assert normalizer.normalize("ቤ/ት ማን ዩናይትድ") == "ቤት ትምህርቲ ማንቸስተር ዩናይትድ"
+
+
+def test_stale_artifact_falls_back_to_json(dict_copy):
+    compile_artifact(str(dict_copy), DEFAULT_DICT_FILES)
+    path = dict_copy / "filtered_space_abbreviations.json"
+    path.write_text(json.dumps({"ማን ዩናይትድ": "ማን ዩ"}, ensure_ascii=False), encoding="utf-8")
+
+    normalizer = TigrinyaNormalizer(dict_path=str(dict_copy))
+    normalizer.read_dictionaries(eager=True)
+    assert normalizer.dictionary_sources["filtered_space_abbreviations"] == "json"
+    assert normalizer.dictionary_sources["clitic_dict"] == "artifact"
+    assert normalizer.dictionaries["filtered_space_abbreviations"] == {"ማን ዩናይትድ": "ማን ዩ"}
+
+
+def test_corrupt_artifact_is_ignored(dict_copy):
+    (dict_copy / ARTIFACT_NAME).write_bytes(b"not an artifact at all")
+    normalizer = TigrinyaNormalizer(dict_path=str(dict_copy))
+    normalizer.dictionaries.load()
+    assert set(normalizer.dictionary_sources.values()) == {"json"}
@@ -0,0 +1,56 @@
+import json
+import pytest
+from tigrinya_normalizer.audit import audit_table, overlaps, compact_dictionaries
+from tigrinya_normalizer.cli_dictgen import main as dictgen_main
+from tigrinya_normalizer.corpus import CorpusGenerator
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer, DEFAULT_DICT_FILES
+
+
+def test_audit_table():
+    pairs = [("ሃ.ማ.", "ሃገራዊ ማሕበር"), ("ቤ.ት.", "ቤ.ት."), ("ሃ.ማ.", "ሃገራዊ"), ("ቤት ትምህርቲ", "ቤት")]
+    report = audit_table("words_with_dots", pairs)
+    assert report["duplicates"] == ["ሃ.ማ."]
+    assert report["identity"] == ["ቤ.ት."]
+    assert report["unreachable"] == ["ቤት ትምህርቲ"]
+    assert report["compacted"] == {"ሃ.ማ.": "ሃገራዊ"}
+    # Only the keys of a membership table matter, so identity entries are not dropped there.
+    assert audit_table("cliticize_improper_words", [("ኣብቲ", "ኣብቲ")])["compacted"] == {"ኣብቲ": "ኣብቲ"}
+
+
+def test_alternation_identity_shadows_overlapping_keys():
+    assert overlaps("ማንዩ", "ዩናይትድ") and overlaps("ማንዩ", "ማን") and not overlaps("ማንዩ", "ሲቲ")
+    report = audit_table("filtered_single_abbreviations", [("ማንዩ", "ማንዩ"), ("ዩናይትድ", "ዩ"), ("ሲቲ", "ሲቲ")])
+    assert report["kept_identity"] == ["ማንዩ"]
+    assert report["compacted"] == {"ማንዩ": "ማንዩ", "ዩናይትድ": "ዩ"}
+
+
+def test_compaction_keeps_normalize_output(tmp_path, dict_path):
+    reports, conflicts = compact_dictionaries(dict_path, DEFAULT_DICT_FILES, str(tmp_path / "compact"))
+    assert sum(len(report["identity"]) for report in reports.values()) > 100
+    corpus = CorpusGenerator(dict_path, seed=7).generate(100000)
+    keys = []
+    for name, filename in DEFAULT_DICT_FILES.items():
+        with open(f"{dict_path}/{filename}", encoding="utf-8") as f:
+            keys.extend(json.load(f))
+    for options in ({}, {"engine": "scanner"}, {"fold": "phonetic"}):
+        full = TigrinyaNormalizer(dict_path=dict_path, **options)
+        compact = TigrinyaNormalizer(dict_path=str(tmp_path / "compact"), **options)
+        assert compact.normalize(corpus) == full.normalize(corpus)
+        assert compact.normalize_batch(keys) == full.normalize_batch(keys)
+
+
+def test_audit_and_compact_cli(tmp_path, dict_copy, capsys):
+    assert dictgen_main(["audit", "-d", str(dict_copy)]) is None
+    out = capsys.readouterr().out
+    assert "clitic_dict.txt: 259 entries, 177 removable" in out
+    before = (dict_copy / "words_with_dots.txt").read_text(encoding="utf-8")
+
+    dictgen_main(["compact", "-d", str(dict_copy)])
+    assert "✔ Removed" in capsys.readouterr().out
+    compacted = json.loads((dict_copy / "words_with_dots.txt").read_text(encoding="utf-8"))
+    assert len(compacted) < len(json.loads(before))
+    assert all(key != value for key, value in compacted.items())
+    dictgen_main(["audit", "-d", str(dict_copy)])
+    assert "0 entries can be removed" in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        dictgen_main(["compact", "--bogus"])
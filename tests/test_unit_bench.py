@@ -0,0 +1,65 @@
+import json
+import pytest
+from tigrinya_normalizer.corpus import CorpusGenerator
+from tigrinya_normalizer.bench import run_benchmarks, compare_results, save_results, settings_differences
+from tigrinya_normalizer.cli_bench import main as bench_main
+
+
+def test_corpus_is_seeded(dict_path):
+    first = CorpusGenerator(dict_path, seed=3).generate(2000)
+    assert first == CorpusGenerator(dict_path, seed=3).generate(2000)
+    assert first != CorpusGenerator(dict_path, seed=4).generate(2000)
+    assert 2000 <= len(first) < 4000 and first.endswith("\n")
+
+
+def test_corpus_rates(dict_path):
+    tokens = CorpusGenerator(dict_path, rates={"slashed": 1.0, "hyphenated": 0, "dotted": 0, "clitic": 0}).generate(3000).split()
+    assert all("/" in token for token in tokens)
+    plain = CorpusGenerator(dict_path, rates=dict.fromkeys(["hyphenated", "slashed", "dotted", "clitic"], 0)).generate(3000)
+    assert not any(c in plain for c in "-/'")
+    with pytest.raises(ValueError):
+        CorpusGenerator(dict_path, rates={"emoji": 0.1})
+
+
+def test_run_benchmarks_reports_throughput(dict_path):
+    results = run_benchmarks(dict_path, corpus_size=5000, short_texts=20, repeat=1)
+    assert set(results["results"]) == {
+        "cold_start", "normalize_short", "normalize_long", "normalize_and_save", "create_dictionary"
+    }
+    assert all(r["throughput"] > 0 for r in results["results"].values())
+    json.dumps(results)
+
+
+def results(**throughputs):
+    return {"version": 1, "results": {name: {"throughput": t, "unit": "MB/s"} for name, t in throughputs.items()}}
+
+
+def test_compare_flags_drops_beyond_threshold():
+    rows = compare_results(results(a=10.0, b=10.0, c=1.0), results(a=9.5, b=8.0, d=2.0), threshold=0.1)
+    assert [(row["name"], row["regressed"]) for row in rows] == [("a", False), ("b", True)]
+
+
+def test_compare_cli_exit_code(tmp_path, capsys):
+    baseline, current = str(tmp_path / "base.json"), str(tmp_path / "current.json")
+    save_results(results(normalize_long=10.0), baseline)
+    save_results(results(normalize_long=7.0), current)
+    assert bench_main(["compare", baseline, current]) == 1
+    assert "REGRESSED" in capsys.readouterr().out
+    assert bench_main(["compare", baseline, current, "--threshold", "0.5"]) == 0
+
+
+def test_compare_refuses_different_settings(tmp_path, capsys):
+    baseline, current = results(normalize_long=10.0), results(normalize_long=7.0)
+    baseline["settings"] = {"engine": "regex", "corpus_size": 1000, "seed": 0, "rates": {"clitic": 0.1}}
+    current["settings"] = dict(baseline["settings"], engine="scanner", rates={"clitic": 0.2})
+    assert list(settings_differences(baseline, current)) == ["engine", "rates"]
+    with pytest.raises(ValueError):
+        compare_results(baseline, current)
+    assert compare_results(baseline, current, force=True)[0]["regressed"]
+
+    paths = str(tmp_path / "base.json"), str(tmp_path / "current.json")
+    save_results(baseline, paths[0])
+    save_results(current, paths[1])
+    assert bench_main(["compare", *paths]) == 2
+    assert "engine 'regex' vs 'scanner'" in capsys.readouterr().out
+    assert bench_main(["compare", *paths, "--force"]) == 1
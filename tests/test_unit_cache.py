@@ -0,0 +1,51 @@
+import os
+import json
+import pytest
+from tigrinya_normalizer.cache import TokenCache
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+
+TEXTS = ["ቤ/ት ቀይሕ-ባሕሪ ሽሕ'ኳ", "ማን ዩናይትድ ቤ/ት", "ቤ/ት ቀይሕ-ባሕሪ ሽሕ'ኳ"]
+
+
+def test_cache_counts_and_evicts_least_recently_used():
+    cache = TokenCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 2, "misses": 1, "evictions": 1}
+
+
+def test_cache_size_must_be_positive(dict_path):
+    with pytest.raises(ValueError):
+        TokenCache(0)
+    with pytest.raises(ValueError):
+        TigrinyaNormalizer(dict_path=dict_path, token_cache_size=-1)
+
+
+@pytest.mark.parametrize("engine", ["regex", "scanner"])
+def test_cached_output_matches_uncached(dict_path, engine):
+    plain = TigrinyaNormalizer(dict_path=dict_path, engine=engine)
+    cached = TigrinyaNormalizer(dict_path=dict_path, engine=engine, token_cache_size=4)
+    assert plain.token_cache_stats() is None
+    for punctuation in (None, "።፧"):
+        assert [cached.normalize(t, punctuation) for t in TEXTS] == [plain.normalize(t, punctuation) for t in TEXTS]
+    stats = cached.token_cache_stats()
+    assert stats["hits"] > 0 and stats["size"] <= 4
+
+
+def test_reload_starts_an_empty_cache(dict_copy):
+    normalizer = TigrinyaNormalizer(dict_path=str(dict_copy), engine="scanner", token_cache_size=100)
+    assert normalizer.normalize("ቤ/ት") == "ቤት ትምህርቲ"
+    assert normalizer.token_cache_stats()["size"] > 0
+
+    path = dict_copy / "words_with_fwd_slash.txt"
+    st = os.stat(path)
+    path.write_text(json.dumps({"ቤ/ት": "ቤት"}, ensure_ascii=False), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+    assert normalizer.reload_dictionaries() == ["words_with_fwd_slash"]
+    assert normalizer.token_cache_stats()["size"] == 0
+    assert normalizer.normalize("ቤ/ት") == "ቤት"
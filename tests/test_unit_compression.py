@@ -0,0 +1,53 @@
+import gzip
+import json
+import pytest
+from tigrinya_normalizer.compression import FORMATS, open_text, detect_compression, compression_from_suffix
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.dictionary_generator import TiDictionary
+
+TEXT = "ቤ/ት ቀይሕ-ባሕሪ ኣብ'ቲ።\nሃ.ማ.መ.ተ.ኤ ሰላም።\n"
+
+
+@pytest.mark.parametrize("name", sorted(FORMATS))
+def test_round_trip(tmp_path, name):
+    path = str(tmp_path / ("corpus.txt" + FORMATS[name][1]))
+    with open_text(path, "w") as f:
+        f.write(TEXT)
+    assert compression_from_suffix(path) == name
+    assert detect_compression(path) == name
+    with open_text(path) as f:
+        assert f.read() == TEXT
+
+
+def test_detects_by_content(tmp_path):
+    # Reading trusts the magic bytes, not the name.
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(gzip.compress(TEXT.encode("utf-8")))
+    with open_text(str(path)) as f:
+        assert f.read() == TEXT
+    plain = tmp_path / "plain.gz"
+    plain.write_text(TEXT, encoding="utf-8")
+    assert detect_compression(str(plain)) is None
+
+
+def test_normalize_compressed_file(tmp_path, dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    (tmp_path / "in.txt").write_text(TEXT, encoding="utf-8")
+    (tmp_path / "in.txt.gz").write_bytes(gzip.compress(TEXT.encode("utf-8")))
+    normalizer.normalize_file(str(tmp_path / "in.txt"), str(tmp_path / "out.txt"))
+    for stream in (False, True):
+        normalizer.normalize_file(str(tmp_path / "in.txt.gz"), str(tmp_path / "out.txt.bz2"), stream=stream)
+        with open_text(str(tmp_path / "out.txt.bz2")) as f:
+            assert f.read() == (tmp_path / "out.txt").read_text(encoding="utf-8")
+
+
+def test_dictionary_from_compressed_corpus(tmp_path):
+    (tmp_path / "corpus.txt").write_text(TEXT * 3, encoding="utf-8")
+    with open_text(str(tmp_path / "corpus.txt.xz"), "w") as f:
+        f.write(TEXT * 3)
+    outputs = []
+    for name, workers in (("corpus.txt", 1), ("corpus.txt.xz", 2)):
+        out = tmp_path / name.replace(".", "_")
+        TiDictionary(str(tmp_path / name), str(out)).create_dictionary(workers=workers)
+        outputs.append(json.loads((out / "hyphenated_words_v2.txt").read_text(encoding="utf-8")))
+    assert outputs[0] == outputs[1] == {"ቀይሕ-ባሕሪ": "ቀይሕ ባሕሪ"}
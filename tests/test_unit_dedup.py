@@ -0,0 +1,72 @@
+import pytest
+from array import array
+from tigrinya_normalizer.dedup import Deduplicator, MinHasher, similarity, make_deduplicator
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.parallel import normalize_file_parallel
+
+SENTENCE = "ትምህርቲ ኣብ ኤርትራ ብዙሕ ምዕባለ ኣርእዩ ኣሎ።"
+OTHER = "ሰላም ንኹሉ ህዝቢ ይኹን።"
+
+
+def test_exact_and_near():
+    exact, near = Deduplicator(), Deduplicator(near_threshold=0.8)
+    sentences = [SENTENCE, OTHER, SENTENCE, SENTENCE[:-1] + "፧"]
+    assert list(exact.filter(sentences)) == [SENTENCE, OTHER, SENTENCE[:-1] + "፧"]
+    assert list(near.filter(sentences)) == [SENTENCE, OTHER]
+    assert exact.counts == {"kept": 3, "exact": 1, "near": 0}
+    assert near.counts == {"kept": 2, "exact": 1, "near": 1}
+    assert "2 kept" in near.report()
+
+
+class FixedSignatures:
+    def __init__(self, signatures):
+        self.signatures = signatures
+
+    def signature(self, text):
+        return array("I", self.signatures[text])
+
+
+def test_bucket_keeps_every_candidate():
+    # 16 values in 4 bands: B shares only A's first band, A' differs from A in one row of each other band.
+    signatures = {"A": list(range(16)), "B": list(range(4)) + [99] * 12,
+                  "A'": [0, 1, 2, 3, 99, 5, 6, 7, 99, 9, 10, 11, 99, 13, 14, 15]}
+    dedup = Deduplicator(near_threshold=0.8, num_perm=16, bands=4)
+    dedup.minhasher = FixedSignatures(signatures)
+    assert similarity(signatures["A'"], signatures["A"]) >= 0.8 > similarity(signatures["B"], signatures["A"])
+    assert [dedup.check(text) for text in ("A", "B", "A'")] == [None, None, "near"]
+
+
+def test_minhash_is_stable():
+    first, second = MinHasher(), MinHasher()
+    assert first.signature(SENTENCE) == second.signature(SENTENCE)
+    assert similarity(first.signature(SENTENCE), first.signature(OTHER)) < 0.2
+    assert len(first.signature("ሰ")) == 64
+
+
+def test_bounded_memory():
+    dedup = Deduplicator(max_entries=4)
+    sentences = [f"ሰላም {i}።" for i in range(10)]
+    assert list(dedup.filter(sentences)) == sentences
+    assert len(dedup.seen) <= 4
+    # Recent sentences are still remembered, the oldest are forgotten.
+    assert dedup.check(sentences[-1]) == "exact"
+    assert dedup.check(sentences[0]) is None
+    with pytest.raises(ValueError):
+        make_deduplicator("fuzzy")
+
+
+def test_normalize_file_with_dedup(tmp_path, dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    source = tmp_path / "in.txt"
+    source.write_text(f"{SENTENCE} {OTHER}\n{SENTENCE}\n{OTHER} ቤ/ት ኣሎ።\n" * 20, encoding="utf-8")
+    outputs = []
+    for stream in (False, True):
+        dedup = make_deduplicator("exact")
+        normalizer.normalize_file(str(source), str(tmp_path / "out.txt"), stream=stream, dedup=dedup)
+        outputs.append((tmp_path / "out.txt").read_text(encoding="utf-8"))
+        assert dedup.counts["kept"] == 3
+    normalize_file_parallel(normalizer, str(source), str(tmp_path / "par.txt"), 2, chunk_size=64,
+                            dedup=make_deduplicator("exact"))
+    outputs.append((tmp_path / "par.txt").read_text(encoding="utf-8"))
+    assert outputs[0] == outputs[1] == outputs[2]
+    assert outputs[0].splitlines() == [normalizer.normalize(SENTENCE), normalizer.normalize(OTHER), "ቤት ትምህርቲ ኣሎ።"]
@@ -0,0 +1,192 @@
+import io
+import json
+import pytest
+from tigrinya_normalizer import dictionary_generator
+from tigrinya_normalizer.cli_dictgen import main as dictgen_main
+from tigrinya_normalizer.dictionary_generator import TiDictionary, iter_text_blocks, shard_ranges, STATE_FILE
+
+CORPUS = (
+    "\ufeffቀይሕ-ባሕሪ ኣብ'ቲ ቤ/ት ሃ.ማ.መ.ተ.ኤ ናይ’ቲ (ቤ/ት) ኣብቲ ኣብቲ\r\n"
+    "ኣብ`ዚ ቀይሕ-ባሕሪ, ኪ.ሎ.ሜ. ab-c x--y ኣብቲ ኣብቲ ኣብቲ ኣብቲ ሰላም።\n"
+)
+OUTPUTS = [
+    "clitic_zipped_dict.txt", "clitic_bind_dic.txt", "words_with_fwd_slash.txt", "words_with_dots.txt",
+    "hyphenated_words_v1.txt", "hyphenated_words_v2.txt", "cliticize_improper_words.txt",
+]
+
+
+def generate(tmp_path, name, corpus_text=CORPUS, workers=1):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_bytes(corpus_text.encode("utf-8"))
+    ti_dict = TiDictionary(str(corpus), str(tmp_path / name))
+    ti_dict.create_dictionary(workers=workers)
+    ti_dict.create_improper_clitic()
+    return {f[:-4]: json.loads((tmp_path / name / f).read_text(encoding="utf-8")) for f in OUTPUTS}
+
+
+def test_text_blocks_end_on_whitespace():
+    text = "ቀይሕ-ባሕሪ  ኣብ'ቲ\nቤ/ት ሃ.ማ.መ.ተ.ኤ"
+    blocks = list(iter_text_blocks(io.StringIO(text), 4))
+    assert "".join(blocks) == text
+    assert all(block[-1].isspace() for block in blocks[:-1])
+    assert [token for block in blocks for token in block.split()] == text.split()
+
+
+def test_clean_word():
+    ti_dict = TiDictionary("unused", "unused")
+    assert ti_dict.clean_word("(ቤ/ት),") == "ቤት"
+    assert ti_dict.clean_word("(ቤ/ት),", "/") == "ቤ/ት"
+    assert ti_dict.clean_word("“ኣብ'ቲ”.", set("`’'")) == "“ኣብ'ቲ”"
+
+
+def test_generation_streams_in_one_pass(tmp_path, monkeypatch):
+    whole = generate(tmp_path, "whole")
+    assert whole["hyphenated_words_v2"] == {"ab-c": "ab c", "ቀይሕ-ባሕሪ": "ቀይሕ ባሕሪ"}
+    assert whole["clitic_zipped_dict"]["ኣብ"] == "ዚ"
+    assert whole["words_with_dots"] == {"ሃ.ማ.መ.ተ.ኤ": "ሃ.ማ.መ.ተ.ኤ", "ኪ.ሎ.ሜ.": "ኪ.ሎ.ሜ."}
+    assert whole["cliticize_improper_words"] == {"ኣብቲ": "ኣብ'ቲ"}
+
+    monkeypatch.setattr(dictionary_generator, "STREAM_BLOCK_SIZE", 5)
+    assert generate(tmp_path, "blocks") == whole
+
+
+def test_improper_clitic_counts_without_rereading(tmp_path):
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text(CORPUS, encoding="utf-8")
+    ti_dict = TiDictionary(str(corpus), str(tmp_path / "out"))
+    ti_dict.create_dictionary()
+    corpus.unlink()
+    ti_dict.create_improper_clitic()
+    assert json.loads((tmp_path / "out" / "cliticize_improper_words.txt").read_text(encoding="utf-8")) == {"ኣብቲ": "ኣብ'ቲ"}
+
+    fresh = TiDictionary(str(corpus), str(tmp_path / "out"))
+    with pytest.raises(FileNotFoundError):
+        fresh.create_improper_clitic()
+
+
+def test_shard_ranges_start_on_lines(tmp_path):
+    corpus = tmp_path / "corpus.txt"
+    data = (CORPUS * 3).encode("utf-8")
+    corpus.write_bytes(data)
+    ranges = shard_ranges(str(corpus), 4)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert all(data[start - 1:start] == b"\n" for start, _ in ranges[1:])
+
+    corpus.write_bytes(b"no line breaks at all")
+    assert shard_ranges(str(corpus), 4) == [(0, 21)]
+
+
+def test_sharded_generation_matches_single_process(tmp_path):
+    # Lines repeat with different clitic pairs so the merge has to keep the last one.
+    corpus = CORPUS + "ኣብ'ቲ ቤ/ት\n" * 3 + "ኣብ’ኡ ኣብቲ\n"
+    single = generate(tmp_path, "single", corpus)
+    assert single["clitic_zipped_dict"]["ኣብ"] == "ኡ"
+    for workers in (2, 3, 8):
+        sharded = generate(tmp_path, f"workers{workers}", corpus, workers)
+        assert {name: list(table.items()) for name, table in sharded.items()} == \
+            {name: list(table.items()) for name, table in single.items()}
+
+
+DELTA = "ኣብ'ቲ ቤ/ቲ ሕ.ጉ ኣብቲ\n" + "ናይ'ቲ ናይቲ\n" * 6 + "ቀይሕ-ባሕሪ ሰሜን-ባሕሪ\n"
+
+
+def read_outputs(directory):
+    return {f[:-4]: json.loads((directory / f).read_text(encoding="utf-8")) for f in OUTPUTS}
+
+
+def test_update_matches_full_regeneration(tmp_path):
+    history = tmp_path / "history.txt"
+    history.write_text(CORPUS, encoding="utf-8")
+    delta = tmp_path / "delta.txt"
+    delta.write_text(DELTA, encoding="utf-8")
+
+    assert TiDictionary(None, str(tmp_path / "out")).update_dictionary([str(history)]) == [str(history)]
+    assert TiDictionary(None, str(tmp_path / "out")).update_dictionary([str(history), str(delta)]) == [str(delta)]
+    updated = read_outputs(tmp_path / "out")
+
+    whole = generate(tmp_path, "whole", CORPUS + DELTA)
+    assert updated == whole
+    assert updated["cliticize_improper_words"] == {"ኣብቲ": "ኣብ'ቲ", "ናይቲ": "ናይ'ቲ"}
+    state = json.loads((tmp_path / "out" / STATE_FILE).read_text(encoding="utf-8"))
+    assert state["token_counts"]["ኣብቲ"] == 7 and len(state["sources"]) == 2
+    # Tokens that can never be a bound form are not kept.
+    assert "ቤ/ት" not in state["token_counts"] and "ሃ.ማ.መ.ተ.ኤ" not in state["token_counts"]
+
+
+def test_cli_update_matches_full_cli_run(tmp_path):
+    # ስፖርተኛታትውን is only written with a clitic mark in the delta; its plain uses before count too.
+    base = CORPUS + "ስፖርተኛታትውን ሰላም\n" * 6
+    added = DELTA + "ስፖርተኛታት'ውን ብሉጽ\n"
+    for name, text in (("base.txt", base), ("delta.txt", added), ("all.txt", base + added)):
+        (tmp_path / name).write_text(text, encoding="utf-8")
+
+    dictgen_main(["-i", str(tmp_path / "all.txt"), "-o", str(tmp_path / "full")])
+    dictgen_main(["-i", str(tmp_path / "base.txt"), "-o", str(tmp_path / "updated")])
+    dictgen_main(["update", "-i", str(tmp_path / "delta.txt"), "-o", str(tmp_path / "updated")])
+
+    files = OUTPUTS + ["clitic_dict.txt"]
+    full = {f: json.loads((tmp_path / "full" / f).read_text(encoding="utf-8")) for f in files}
+    updated = {f: json.loads((tmp_path / "updated" / f).read_text(encoding="utf-8")) for f in files}
+    assert updated == full
+    assert "ስፖርተኛታትውን" in full["cliticize_improper_words.txt"]
+
+
+def test_state_version_checked(tmp_path):
+    out = tmp_path / "out"
+    history = tmp_path / "history.txt"
+    history.write_text(CORPUS, encoding="utf-8")
+    TiDictionary(None, str(out)).update_dictionary([str(history)])
+    state_path = out / STATE_FILE
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    state_path.write_text(json.dumps(dict(state, version=99)), encoding="utf-8")
+    with pytest.raises(ValueError):
+        TiDictionary(None, str(out)).update_dictionary([])
+
+
+def test_update_keeps_curated_entries(tmp_path):
+    out = tmp_path / "out"
+    history = tmp_path / "history.txt"
+    history.write_text(CORPUS, encoding="utf-8")
+    TiDictionary(None, str(out)).update_dictionary([str(history)])
+
+    (out / "words_with_fwd_slash.txt").write_text(json.dumps({"ቤ/ት": "ቤት ትምህርቲ"}), encoding="utf-8")
+    (out / "cliticize_improper_words.txt").write_text("{}", encoding="utf-8")
+    delta = tmp_path / "delta.txt"
+    delta.write_text(DELTA, encoding="utf-8")
+    TiDictionary(None, str(out)).update_dictionary([str(delta)])
+
+    updated = read_outputs(out)
+    assert updated["words_with_fwd_slash"] == {"ቤ/ት": "ቤት ትምህርቲ", "ቤ/ቲ": "ቤ/ቲ"}
+    # ኣብቲ was listed before and removed by hand; only the newly frequent form is added.
+    assert updated["cliticize_improper_words"] == {"ናይቲ": "ናይ'ቲ"}
+
+
+def test_update_requires_recorded_counts(tmp_path):
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "clitic_bind_dic.txt").write_text("{}", encoding="utf-8")
+    with pytest.raises(FileNotFoundError):
+        TiDictionary(None, str(out)).update_dictionary([])
+
+
+def test_update_keeps_compacted_clitic_dict(tmp_path):
+    from tigrinya_normalizer.audit import audit_table, read_entries, compact_dictionaries
+
+    out = tmp_path / "out"
+    history = tmp_path / "history.txt"
+    history.write_text(CORPUS, encoding="utf-8")
+    TiDictionary(None, str(out)).update_dictionary([str(history)])
+    clitic_path = str(out / "clitic_dict.txt")
+    assert audit_table("clitic_dict", read_entries(clitic_path))["identity"]
+
+    compact_dictionaries(str(out), {"clitic_dict": "clitic_dict.txt"})
+    delta = tmp_path / "delta.txt"
+    delta.write_text(DELTA, encoding="utf-8")
+    TiDictionary(None, str(out)).update_dictionary([str(delta)])
+    assert audit_table("clitic_dict", read_entries(clitic_path))["identity"] == []
+
+    # A clitic part first seen in an update still gets a placeholder to curate.
+    delta.write_text("ምስ'ቶም\n", encoding="utf-8")
+    TiDictionary(None, str(out)).update_dictionary([str(delta)])
+    assert audit_table("clitic_dict", read_entries(clitic_path))["identity"] == ["ቶም"]
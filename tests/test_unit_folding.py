@@ -0,0 +1,75 @@
+import json
+import pytest
+from tigrinya_normalizer.folding import fold, folding_table, fold_dictionary, register_profile, FOLDING_PROFILES
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.pipeline import Pipeline, FoldingStage, DEFAULT_STAGES
+
+
+def test_profiles():
+    assert fold("ሠላም ፀሓይ ኀይሊ") == "ሰላም ጸሓይ ሐይሊ"
+    # Chains resolve in one step, so folding is idempotent.
+    assert fold("ኀይሊ ሓድሽ ዓመት", "phonetic") == "ሀይሊ ሃድሽ ኣመት"
+    assert fold(fold("ኀይሊ ዓመት", "phonetic"), "phonetic") == fold("ኀይሊ ዓመት", "phonetic")
+    assert fold("hello ሰላም 123") == "hello ሰላም 123"
+    with pytest.raises(ValueError):
+        folding_table("unknown")
+
+
+def test_custom_profile():
+    register_profile("test-glottal", rows={"ዐ": "አ"}, chars={"ኧ": "አ"})
+    try:
+        assert fold("ዓመት ኧ ሠ", "test-glottal") == "ኣመት አ ሠ"
+    finally:
+        FOLDING_PROFILES.pop("test-glottal")
+
+
+def test_fold_dictionary_keeps_first_key():
+    assert fold_dictionary({"ሠ/ላ": "ሠላ", "ሰ/ላ": "ሰላም", "n": 1}, "homophones") == {"ሰ/ላ": "ሰላ", "n": 1}
+
+
+def test_folding_stage_and_dictionaries(dict_path):
+    pipeline = Pipeline(fold="homophones")
+    assert pipeline.names == ("fold_characters",) + DEFAULT_STAGES and pipeline.fold == "homophones"
+    assert pipeline.scannable
+    assert Pipeline(["replace_clitic_dictionary", FoldingStage()]).fold is None
+    with pytest.raises(ValueError):
+        Pipeline(["fold_characters"], fold="phonetic")
+
+    # A variant spelling of a dictionary key only matches once folded.
+    plain = TigrinyaNormalizer(dict_path=dict_path)
+    folded = TigrinyaNormalizer(dict_path=dict_path, fold="homophones")
+    assert plain.normalize("ህ/ሠ") == "ህ ሠ"
+    assert folded.normalize("ህ/ሠ") == folded.normalize("ህ/ሰ") == "ህዝባዊ ሰራዊት"
+    assert folded.dictionaries["words_with_fwd_slash"] is not plain.dictionaries["words_with_fwd_slash"]
+    assert folded.normalize("ፀሓይ ኢየ") == "ጸሓይ እየ"
+
+
+def test_fold_from_config(tmp_path, dict_path):
+    config = tmp_path / "pipeline.json"
+    config.write_text(json.dumps({"fold": "phonetic", "disable": ["strip_punctuation"]}), encoding="utf-8")
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, pipeline_config=str(config))
+    assert normalizer.pipeline.fold == "phonetic"
+    assert normalizer.normalize("ዓመት ምሕረት") == "ኣመት ምህረት"
+
+
+@pytest.mark.parametrize("profile", ["homophones", "phonetic"])
+def test_fold_streams_and_runs_in_parallel(tmp_path, dict_path, profile):
+    from tigrinya_normalizer.corpus import CorpusGenerator
+    from tigrinya_normalizer.parallel import normalize_file_parallel
+    text = CorpusGenerator(dict_path, seed=4).generate(30000) + "ህ/ሠ ፀሓይ ኢየ ዓመት ምሕረት።\n"
+    regex = TigrinyaNormalizer(dict_path=dict_path, fold=profile)
+    scanner = TigrinyaNormalizer(dict_path=dict_path, fold=profile, engine="scanner")
+    assert scanner.fused and regex.line_safe()
+    expected = regex.normalize(text)
+    assert scanner.normalize(text) == expected
+    assert scanner.normalize_batch(text.splitlines()) == regex.normalize_batch(text.splitlines())
+
+    chunks = [text[i:i + 97] for i in range(0, len(text), 97)]
+    assert " ".join(regex.normalize_stream(chunks)) == expected
+
+    source = tmp_path / "in.txt"
+    source.write_text(text, encoding="utf-8")
+    regex.normalize_file(str(source), str(tmp_path / "serial.txt"))
+    reports = normalize_file_parallel(regex, str(source), str(tmp_path / "parallel.txt"), 2, chunk_size=2000)
+    assert len(reports) > 1 or sum(report["chunks"] for report in reports) > 1
+    assert (tmp_path / "parallel.txt").read_text(encoding="utf-8") == (tmp_path / "serial.txt").read_text(encoding="utf-8")
@@ -0,0 +1,68 @@
+import os
+import json
+from tigrinya_normalizer.incremental import IncrementalNormalizer, split_segments
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.corpus import CorpusGenerator
+
+
+def make_document(dict_path, paragraphs=40):
+    lines = CorpusGenerator(dict_path, seed=5).generate(60000).splitlines()
+    return "\n\n".join("\n".join(lines[i:i + 3]) for i in range(0, 3 * paragraphs, 3))
+
+
+def test_split_segments():
+    assert split_segments("ሀ\nለ\n\n \n\nሐ\n") == ["ሀ\nለ", "ሐ\n"]
+    assert split_segments(" \n\n") == []
+    long_paragraph = "\n".join(["ሰላም " * 100] * 20)
+    assert len(split_segments(long_paragraph)) == 20
+
+
+def test_edits_renormalize_only_changed_paragraphs(dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    incremental = IncrementalNormalizer(normalizer)
+    document = make_document(dict_path)
+    assert incremental.normalize(document) == normalizer.normalize(document)
+    assert incremental.stats()["last"] == {"segments": 40, "normalized": 40}
+
+    paragraphs = document.split("\n\n")
+    paragraphs[7] = "ማን ዩናይትድ ቤ/ት ኣብ'ቲ።"
+    edited = "\n\n".join(paragraphs)
+    assert incremental.normalize(edited) == normalizer.normalize(edited)
+    assert incremental.stats()["last"] == {"segments": 40, "normalized": 1}
+    assert incremental.normalize(edited, "።") == normalizer.normalize(edited, "።")
+    assert incremental.stats()["last"]["normalized"] == 40
+    assert incremental.normalize("") == normalizer.normalize("") == ""
+
+
+def test_whole_document_when_not_line_safe(dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, stages=["replace_clitic_dictionary", str.upper])
+    incremental = IncrementalNormalizer(normalizer)
+    document = "ሀ ሞ\n\nhello ዩ"
+    assert incremental.normalize(document) == normalizer.normalize(document)
+    assert incremental.stats()["last"] == {"segments": 1, "normalized": 1}
+
+
+def test_reload_and_persistence(tmp_path, dict_copy):
+    normalizer = TigrinyaNormalizer(dict_path=str(dict_copy))
+    path = str(tmp_path / "segments.json")
+    document = "ማን ዩናይትድ ኣብ ሜዳ።\n\nቤ/ት ትምህርቲ።"
+    incremental = IncrementalNormalizer(normalizer, maxsize=2, path=path)
+    incremental.normalize(document)
+    incremental.normalize("ሰላም።")
+    assert incremental.cache.stats()["size"] == 2
+    incremental.normalize(document)
+    assert incremental.save() == 2
+
+    restored = IncrementalNormalizer(normalizer, path=path)
+    assert restored.normalize(document) == normalizer.normalize(document)
+    assert restored.stats()["last"]["normalized"] == 0
+
+    # Edited dictionaries give a new version: cached results are no longer used.
+    space_file = dict_copy / "filtered_space_abbreviations.json"
+    st = os.stat(space_file)
+    space_file.write_text(json.dumps({"ማን ዩናይትድ": "ማን ዩ"}, ensure_ascii=False), encoding="utf-8")
+    os.utime(space_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    normalizer.reload_dictionaries()
+    assert restored.normalize(document) == normalizer.normalize(document) == "ማን ዩ ኣብ ሜዳ። ቤት ትምህርቲ ትምህርቲ።"
+    assert restored.stats()["last"]["normalized"] == 2
+    assert IncrementalNormalizer(normalizer, path=path).cache.stats()["size"] == 0
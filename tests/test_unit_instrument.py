@@ -0,0 +1,40 @@
+import pytest
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.instrument import format_stats
+
+TEXT = "ቤ/ት ቀይሕ-ባሕሪ ሽሕ'ኳ ማን ዩናይትድ ሃ.ማ.መ.ተ.ኤ ሰላም።"
+STAGES = [
+    "replace_clitic_dictionary", "replace_shortened_words_with_dots", "replace_hyphenated_v1",
+    "normalize_clitic_variation", "replace_improper_abbreviation", "handle_words", "strip_punctuation",
+]
+
+
+def test_stats_disabled_by_default(dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    normalizer.normalize(TEXT)
+    assert normalizer.stats() is None
+
+
+@pytest.mark.parametrize("engine", ["regex", "scanner"])
+def test_stats_record_stages_and_lookups(dict_path, engine):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, engine=engine)
+    expected = normalizer.normalize(TEXT)
+    events = []
+    normalizer.enable_stats(hook=lambda *event: events.append(event))
+
+    assert normalizer.normalize(TEXT) == expected
+    assert normalizer.normalize_batch([TEXT]) == [expected]
+    stats = normalizer.stats()
+    assert list(stats["stages"]) == STAGES
+    assert all(s["calls"] == 2 for s in stats["stages"].values())
+    assert stats["stages"]["strip_punctuation"]["bytes_out"] == 2 * len(expected.encode("utf-8"))
+    assert [event[0] for event in events] == STAGES * 2
+    assert stats["lookups"]["words_with_fwd_slash"] == {"hits": 2, "misses": 0, "hit_rate": 1.0}
+    assert stats["lookups"]["clitic_dict"]["misses"] > 0
+    assert "handle_words" in format_stats(stats)
+
+    normalizer.reset_stats()
+    assert normalizer.stats()["stages"] == {}
+    assert normalizer.stats()["lookups"]["clitic_dict"]["hits"] == 0
+    normalizer.disable_stats()
+    assert normalizer.stats() is None and normalizer.normalize(TEXT) == expected
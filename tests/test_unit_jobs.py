@@ -0,0 +1,89 @@
+import json
+import pytest
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.jobs import expand_inputs, normalize_files, dictionary_version, MANIFEST_FILE
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    root = tmp_path / "corpus"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("ቤ/ት ቀይሕ-ባሕሪ።\n", encoding="utf-8")
+    (root / "sub" / "b.txt").write_text("ሃ.ማ.መ.ተ.ኤ ሰላም።\n", encoding="utf-8")
+    (root / ".hidden").write_text("skip me", encoding="utf-8")
+    return root
+
+
+def test_expand_inputs(corpus, tmp_path):
+    assert [name for _, name in expand_inputs([str(corpus)])] == ["a.txt", "sub/b.txt"]
+    assert [name for _, name in expand_inputs([str(corpus / "**" / "*.txt")])] == ["a.txt", "sub/b.txt"]
+    assert [name for _, name in expand_inputs([str(corpus)], exclude=str(corpus / "sub"))] == ["a.txt"]
+    # The same file named twice is normalized once.
+    assert len(expand_inputs([str(corpus / "a.txt"), str(corpus)])) == 2
+
+    (tmp_path / "a.txt").write_text("x", encoding="utf-8")
+    with pytest.raises(ValueError):
+        expand_inputs([str(corpus / "a.txt"), str(tmp_path / "a.txt")])
+    with pytest.raises(FileNotFoundError):
+        expand_inputs([str(tmp_path / "missing.txt")])
+
+
+def test_normalize_files_resumes(corpus, tmp_path, dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    out = tmp_path / "out"
+    inputs = expand_inputs([str(corpus)])
+    events = []
+
+    totals = normalize_files(normalizer, inputs, str(out), progress=events.append)
+    assert (totals["done"], totals["skipped"], totals["failed"]) == (2, 0, 0)
+    assert [e["index"] for e in events] == [1, 2]
+    assert (out / "a.txt").read_text(encoding="utf-8") == normalizer.normalize("ቤ/ት ቀይሕ-ባሕሪ።") + "\n"
+    entry = json.loads((out / MANIFEST_FILE).read_text(encoding="utf-8").splitlines()[0])
+    assert entry["dictionaries"] == dictionary_version(normalizer)
+    assert entry["output"] == str(out / "a.txt")
+
+    # An interrupted append leaves a partial line; it is ignored.
+    with open(str(out / MANIFEST_FILE), "a", encoding="utf-8") as f:
+        f.write('{"input": ')
+    (corpus / "sub" / "b.txt").write_text("ኣብ'ቲ ሰላም።\n", encoding="utf-8")
+    totals = normalize_files(normalizer, inputs, str(out))
+    assert (totals["done"], totals["skipped"]) == (1, 1)
+
+    # Other settings or dictionaries invalidate every entry.
+    assert normalize_files(normalizer, inputs, str(out), punctuation_to_keep="።")["done"] == 2
+    other = TigrinyaNormalizer(dict_path=dict_path, disable_stages=["strip_punctuation"])
+    assert dictionary_version(other) != dictionary_version(normalizer)
+
+
+def test_shared_manifest_checks_output_path(corpus, tmp_path, dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    inputs = expand_inputs([str(corpus)])
+    manifest = str(tmp_path / "shared.jsonl")
+    assert normalize_files(normalizer, inputs, str(tmp_path / "first"), manifest_path=manifest)["done"] == 2
+    assert normalize_files(normalizer, inputs, str(tmp_path / "first"), manifest_path=manifest)["skipped"] == 2
+    # The same inputs into another directory are written there, not skipped for the first one's outputs.
+    assert normalize_files(normalizer, inputs, str(tmp_path / "second"), manifest_path=manifest)["done"] == 2
+    assert (tmp_path / "second" / "sub" / "b.txt").exists()
+
+
+def test_normalize_files_reports_failures(corpus, tmp_path, dict_path):
+    (corpus / "bad.txt").write_bytes(b"\xff\xfe bad")
+    out = tmp_path / "out"
+    events = []
+    totals = normalize_files(TigrinyaNormalizer(dict_path=dict_path), expand_inputs([str(corpus)]), str(out),
+                             stream=True, progress=events.append)
+    assert (totals["done"], totals["failed"]) == (2, 1)
+    assert [e["input"].endswith("bad.txt") for e in events if e["status"] == "failed"] == [True]
+    assert not (out / "bad.txt").exists() and not (out / ".partial-bad.txt").exists()
+
+
+def test_normalize_files_with_workers(corpus, tmp_path, dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    inputs = expand_inputs([str(corpus)])
+    normalize_files(normalizer, inputs, str(tmp_path / "serial"))
+    totals = normalize_files(normalizer, inputs, str(tmp_path / "pool"), workers=2)
+    assert totals["done"] == 2
+    for _, name in inputs:
+        assert (tmp_path / "pool" / name).read_text(encoding="utf-8") == \
+            (tmp_path / "serial" / name).read_text(encoding="utf-8")
+    assert normalize_files(normalizer, inputs, str(tmp_path / "pool"), workers=2)["skipped"] == 2
@@ -88,4 +88,34 @@ def test_normalize_and_save(normalizer, tmp_path):
     output_path = tmp_path / output_file
     assert output_path.exists()
     content = output_path.read_text(encoding="utf-8")
-    assert "ሓበረ" in content or "እምዎ" in content or "ኢዮም" in content
\ No newline at end of file
+    assert "ሓበረ" in content or "እምዎ" in content or "ኢዮም" in content
+
+def test_plan_patterns_compiled_once(normalizer):
+    pattern = normalizer.plan.space_abbreviations
+    normalizer.replace_improper_abbreviation("ማን ዩናይትድ")
+    assert normalizer.plan.space_abbreviations is pattern
+
+
+def test_plan_rebuilt_on_read_dictionaries(normalizer):
+    plan = normalizer.plan
+    normalizer.read_dictionaries()
+    assert normalizer.plan is not plan
+    assert normalizer.replace_improper_abbreviation("ማን ዩናይትድ") == "ማንቸስተር ዩናይትድ"
+
+
+def test_punctuation_pattern_cached():
+    from tigrinya_normalizer.plan import punctuation_pattern
+    assert punctuation_pattern("።፧") is punctuation_pattern("።፧")
+    assert punctuation_pattern(None) is punctuation_pattern("")
+
+
+def test_dictionaries_load_on_first_use(dict_path):
+    lazy = TigrinyaNormalizer(dict_path=dict_path)
+    assert not any(row["loaded"] for row in lazy.dictionary_report())
+
+    lazy.normalize("ቤ/ት ቀይሕ-ባሕሪ ሽሕ'ኳ")
+    report = {row["name"]: row for row in lazy.dictionary_report()}
+    assert report["clitic_dict"]["loaded"] and report["clitic_dict"]["bytes"] > 0
+    assert not report["clitic_bind_dic"]["loaded"]
+    assert not report["improper_abbreviations"]["loaded"]
+    assert report["clitic_bind_dic"]["entries"] is None
@@ -0,0 +1,84 @@
+import json
+import pytest
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.pipeline import Pipeline, Stage, DEFAULT_STAGES
+
+TEXT = "ቤ/ት ቀይሕ-ባሕሪ ሽሕ'ኳ ማን ዩናይትድ ሃ.ማ.መ.ተ.ኤ ሰላም።"
+
+
+def shout(text):
+    return text.replace("ሰላም", "ሰላም!")
+
+
+class StripPeriods(Stage):
+    name = "strip_periods"
+
+    def bind(self, plan):
+        return lambda text, punctuation_to_keep: text.replace(".", "")
+
+
+def test_default_pipeline_matches_passes(dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    assert normalizer.pipeline.scannable
+    assert normalizer.pipeline.names == DEFAULT_STAGES
+    explicit = TigrinyaNormalizer(dict_path=dict_path, stages=list(DEFAULT_STAGES), engine="scanner")
+    assert explicit.fused and explicit.normalize(TEXT) == normalizer.normalize(TEXT)
+
+
+def test_disabled_stages_load_nothing(dict_path):
+    normalizer = TigrinyaNormalizer(
+        dict_path=dict_path, stages=["handle_words", "strip_punctuation"], engine="scanner"
+    )
+    assert not normalizer.fused
+    normalizer.prepare()
+    assert normalizer.pipeline.compiled == ()
+    assert normalizer.normalize("ቤ/ት ሃ.ማ.መ.ተ.ኤ ማን ዩናይትድ") == "ቤት ትምህርቲ ሃ ማ መ ተ ኤ ማን ዩናይትድ"
+    loaded = {row["name"] for row in normalizer.dictionary_report() if row["loaded"]}
+    assert loaded <= set(normalizer.pipeline.dictionaries)
+    assert "words_with_dots" not in loaded and "filtered_space_abbreviations" not in loaded
+    assert normalizer.normalize_batch(["ቤ/ት"]) == ["ቤት ትምህርቲ"]
+
+
+def test_disable_and_custom_stages(dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, disable_stages=["replace_shortened_words_with_dots"])
+    assert "replace_shortened_words_with_dots" not in normalizer.pipeline.names
+    custom = TigrinyaNormalizer(dict_path=dict_path, stages=[shout, "strip_punctuation"], engine="scanner")
+    assert custom.normalize("ሰላም ዓለም") == "ሰላም! ዓለም"
+    with pytest.raises(ValueError):
+        Pipeline(disable=["no_such_stage"])
+    with pytest.raises(ValueError):
+        Pipeline(["no_such_stage"])
+
+
+def test_pipeline_config_file(dict_path, tmp_path):
+    config = tmp_path / "pipeline.json"
+    config.write_text(json.dumps({
+        "stages": ["tests.test_unit_pipeline:StripPeriods", "handle_words", "strip_punctuation"],
+    }), encoding="utf-8")
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, pipeline_config=str(config))
+    assert normalizer.pipeline.names == ("strip_periods", "handle_words", "strip_punctuation")
+    assert normalizer.normalize("ሃ.ማ.መ.ተ.ኤ ቤ/ት") == "ሃማመተኤ ቤት ትምህርቲ"
+    normalizer.enable_stats()
+    normalizer.normalize("ቤ/ት")
+    assert list(normalizer.stats()["stages"]) == ["strip_periods", "handle_words", "strip_punctuation"]
+    with pytest.raises(ValueError):
+        TigrinyaNormalizer(dict_path=dict_path, pipeline_config=str(config), stages=["handle_words"])
+
+
+def test_custom_pipelines_refuse_stream_and_workers(dict_path, tmp_path):
+    from tigrinya_normalizer.parallel import normalize_file_parallel
+
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, disable_stages=["replace_shortened_words_with_dots"])
+    input_file = tmp_path / "input.txt"
+    input_file.write_text(TEXT + "\n" + TEXT, encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(normalizer.normalize_stream([TEXT]))
+    with pytest.raises(ValueError):
+        normalizer.normalize_file(str(input_file), str(tmp_path / "stream.txt"), stream=True)
+    with pytest.raises(ValueError):
+        normalize_file_parallel(normalizer, str(input_file), str(tmp_path / "parallel.txt"), workers=2)
+
+    normalizer.normalize_file(str(input_file), str(tmp_path / "serial.txt"))
+    reports = normalize_file_parallel(normalizer, str(input_file), str(tmp_path / "single.txt"), workers=1)
+    assert (tmp_path / "single.txt").read_text(encoding="utf-8") == (tmp_path / "serial.txt").read_text(encoding="utf-8")
+    assert reports[0]["bytes"] == len(input_file.read_bytes())
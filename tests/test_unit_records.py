@@ -0,0 +1,54 @@
+import json
+import pytest
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.records import normalize_records, normalize_jsonl
+from tigrinya_normalizer.jobs import expand_inputs, normalize_files
+
+RECORDS = [
+    {"id": 1, "text": "ቤ/ት ቀይሕ-ባሕሪ።", "title": "ሃ.ማ.መ.ተ.ኤ", "meta": {"source": "ቤ/ት", "score": 0.5}},
+    {"id": 2, "title": "ኣብ'ቲ ሰላም።", "text": None},
+    {"id": 3, "text": "ሰላም። ኣብ'ቲ ቤ/ት።", "tags": ["ቀይሕ-ባሕሪ"]},
+]
+
+
+@pytest.fixture(scope="module")
+def normalizer(dict_path):
+    return TigrinyaNormalizer(dict_path=dict_path)
+
+
+def lines():
+    return [json.dumps(r, ensure_ascii=False) for r in RECORDS[:2]] + [""] + [json.dumps(RECORDS[2], ensure_ascii=False)]
+
+
+def test_only_selected_fields_change(normalizer):
+    out = list(normalize_records(normalizer, lines(), ["text", "title"], batch_size=2))
+    assert out[2] == ""
+    records = [json.loads(line) for line in out if line]
+    for before, after in zip(RECORDS, records):
+        assert list(after) == list(before)
+        for key, value in before.items():
+            if key in ("text", "title") and isinstance(value, str):
+                assert after[key] == normalizer.normalize(value)
+            else:
+                assert after[key] == value
+    assert records[0]["text"] == "ቤት ትምህርቲ ቀይሕ ባሕሪ።"
+
+
+def test_invalid_lines_are_reported(normalizer):
+    with pytest.raises(ValueError, match="Line 2"):
+        list(normalize_records(normalizer, ['{"text": "ሰላም"}', '{"text": '], ["text"]))
+    with pytest.raises(ValueError, match="not a JSON object"):
+        list(normalize_records(normalizer, ['["ሰላም"]'], ["text"]))
+
+
+def test_jsonl_files_with_workers(normalizer, tmp_path):
+    source = tmp_path / "in.jsonl"
+    source.write_text("\n".join(lines() * 20) + "\n", encoding="utf-8")
+    assert normalize_jsonl(normalizer, str(source), str(tmp_path / "serial.jsonl"), ["text"])[0] == 80
+    normalize_jsonl(normalizer, str(source), str(tmp_path / "pool.jsonl"), ["text"], workers=2, batch_size=7)
+    assert (tmp_path / "pool.jsonl").read_text(encoding="utf-8") == (tmp_path / "serial.jsonl").read_text(encoding="utf-8")
+
+    totals = normalize_files(normalizer, expand_inputs([str(source)]), str(tmp_path / "out"), fields=["text"])
+    assert totals["done"] == 1
+    assert (tmp_path / "out" / "in.jsonl").read_text(encoding="utf-8") == \
+        (tmp_path / "serial.jsonl").read_text(encoding="utf-8")
@@ -0,0 +1,58 @@
+import pytest
+from tigrinya_normalizer.script import ScriptFilter, script_ratio
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.jobs import expand_inputs, normalize_files
+from tigrinya_normalizer.utils import clean_text
+
+LINES = ["ቤ/ት ትምህርቲ ኣብ'ቲ።", "Hello, world! ሰላም", "ሰላም hello", "", "12345"]
+
+
+def test_script_ratio():
+    assert script_ratio("ሰላም ዓለም") == 1.0
+    assert script_ratio("hello world") == 0.0
+    assert script_ratio("ሰላም hello") == pytest.approx(3 / 8)
+    assert script_ratio("፩፪ ሰላም") == 1.0
+    assert script_ratio("") == script_ratio("123 ...") == 0.0
+
+
+@pytest.mark.parametrize("action", ["passthrough", "drop", "clean"])
+def test_actions(dict_path, action):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    script_filter = ScriptFilter(0.3, action)
+    outputs = list(script_filter.route(normalizer, [line + "\n" for line in LINES]))
+    first, third = normalizer.normalize_batch([LINES[0], LINES[2]])
+    bypassed = {"passthrough": LINES[1:], "clean": [clean_text(line) for line in LINES[1:]]}
+    if action == "drop":
+        assert outputs == [first, third]
+    else:
+        others = bypassed[action]
+        assert outputs == [first, others[0], third] + others[2:]
+    assert script_filter.counts["normalized"] == 2
+    assert sum(script_filter.counts.values()) == len(LINES)
+    with pytest.raises(ValueError):
+        ScriptFilter(1.5)
+
+
+def test_route_with_workers(tmp_path, dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    source = tmp_path / "mixed.txt"
+    source.write_text("\n".join(LINES * 50) + "\n", encoding="utf-8")
+    serial, pooled = ScriptFilter(), ScriptFilter()
+    serial.route_file(normalizer, str(source), str(tmp_path / "serial.txt"))
+    pooled.route_file(normalizer, str(source), str(tmp_path / "pooled.txt"), workers=2)
+    assert (tmp_path / "serial.txt").read_text(encoding="utf-8") == (tmp_path / "pooled.txt").read_text(encoding="utf-8")
+    assert serial.counts == pooled.counts == {"normalized": 50, "passthrough": 200, "dropped": 0, "cleaned": 0}
+
+
+def test_normalize_files_with_filter(tmp_path, dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    for name in ("a.txt", "b.txt"):
+        (corpus / name).write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    script_filter = ScriptFilter(0.5, "drop")
+    totals = normalize_files(normalizer, expand_inputs([str(corpus)]), str(tmp_path / "out"),
+                             script_filter=script_filter)
+    assert totals["done"] == 2
+    assert script_filter.counts == {"normalized": 2, "passthrough": 0, "dropped": 8, "cleaned": 0}
+    assert (tmp_path / "out" / "a.txt").read_text(encoding="utf-8") == normalizer.normalize(LINES[0]) + "\n"
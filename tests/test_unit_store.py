@@ -0,0 +1,82 @@
+import os
+import json
+import pytest
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer, DEFAULT_DICT_FILES
+from tigrinya_normalizer.store import DictionaryStore
+
+
+def rewrite(path, data):
+    """Rewrite a dictionary file and move its mtime forward so the change is always visible."""
+    st = os.stat(path)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+def test_instances_share_loaded_tables(dict_path):
+    first = TigrinyaNormalizer(dict_path=dict_path)
+    second = TigrinyaNormalizer(dict_path=dict_path)
+    assert first.dictionaries["hyphenated_words_v1"] is second.dictionaries["hyphenated_words_v1"]
+
+
+def test_shared_tables_are_read_only(dict_path):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    with pytest.raises(TypeError):
+        normalizer.dictionaries["clitic_dict"]["ሞ"] = "ሞ"
+
+
+def test_reload_swaps_edited_dictionaries(dict_copy):
+    normalizer = TigrinyaNormalizer(dict_path=str(dict_copy))
+    assert normalizer.normalize("ማን ዩናይትድ") == "ማንቸስተር ዩናይትድ"
+    assert normalizer.reload_dictionaries() == []
+
+    in_flight = normalizer.plan
+    rewrite(dict_copy / "filtered_space_abbreviations.json", {"ማን ዩናይትድ": "ማን ዩ"})
+
+    assert normalizer.reload_dictionaries() == ["filtered_space_abbreviations"]
+    assert normalizer.normalize("ማን ዩናይትድ") == "ማን ዩ"
+    assert in_flight.normalize_passes("ማን ዩናይትድ") == "ማንቸስተር ዩናይትድ"
+    assert normalizer.dictionaries["clitic_dict"] is in_flight.dictionaries["clitic_dict"]
+
+
+def test_deleted_tables_are_forgotten(dict_copy):
+    store = DictionaryStore(str(dict_copy), dict(DEFAULT_DICT_FILES))
+    store.load(["clitic_dict", "words_with_dots"])
+    del store["clitic_dict"]
+    assert store.loaded() == ["words_with_dots"]
+    assert "clitic_dict" not in [row["name"] for row in store.report()]
+    rewrite(dict_copy / DEFAULT_DICT_FILES["words_with_dots"], {"ቤ.ት": "ቤት"})
+    assert store.changed() == ["words_with_dots"]
+
+
+def test_sizes_measured_on_report_and_shared(dict_path, monkeypatch):
+    from tigrinya_normalizer import store as store_module
+
+    measured = []
+    table_size = store_module.table_size
+    monkeypatch.setattr(store_module, "table_size", lambda table: measured.append(1) or table_size(table))
+    store_module.clear_registry()
+    first = DictionaryStore(dict_path, dict(DEFAULT_DICT_FILES))
+    first.load(["clitic_dict"])
+    assert measured == []
+    size = {row["name"]: row["bytes"] for row in first.report()}["clitic_dict"]
+    assert size > 0 and len(measured) == 1
+
+    second = DictionaryStore(dict_path, dict(DEFAULT_DICT_FILES))
+    second.load(["clitic_dict"])
+    assert {row["name"]: row["bytes"] for row in second.report()}["clitic_dict"] == size
+    assert len(measured) == 1
+
+
+def test_reload_keeps_assigned_and_deleted_dictionaries(dict_copy):
+    normalizer = TigrinyaNormalizer(dict_path=str(dict_copy))
+    normalizer.dictionaries["hyphenated_words_v1"] = {"ቀይሕ-ባሕሪ": "ቀይሕ ባሕሪ ዓቢ"}
+    normalizer.dictionaries["extra"] = {"ሞ": "ሞ"}
+    del normalizer.dictionaries["words_with_dots"]
+    normalizer.load_dictionaries()
+    rewrite(dict_copy / "filtered_space_abbreviations.json", {"ማን ዩናይትድ": "ማን ዩ"})
+
+    assert normalizer.reload_dictionaries() == ["filtered_space_abbreviations"]
+    assert normalizer.dictionaries["hyphenated_words_v1"] == {"ቀይሕ-ባሕሪ": "ቀይሕ ባሕሪ ዓቢ"}
+    assert normalizer.dictionaries["extra"] == {"ሞ": "ሞ"}
+    assert "words_with_dots" not in normalizer.dictionaries
+    assert normalizer.normalize("ማን ዩናይትድ") == "ማን ዩ"
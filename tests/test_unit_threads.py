@@ -0,0 +1,112 @@
+import os
+import sys
+import json
+import threading
+import pytest
+from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.corpus import CorpusGenerator
+from tigrinya_normalizer.store import DictionaryStore, clear_registry
+
+THREADS = 8
+
+
+def rewrite(path, data):
+    st = os.stat(path)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def texts(dict_path):
+    return CorpusGenerator(dict_path, seed=11).texts(2000)
+
+
+@pytest.fixture
+def fast_switching():
+    # Switch threads as often as possible so races show up on GIL builds too.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_together(target, count=THREADS):
+    """Run `target(index)` in `count` threads released at the same moment; return their results."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def run(index):
+        barrier.wait()
+        results[index] = target(index)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.mark.parametrize("options", [{}, {"engine": "scanner"}, {"engine": "scanner", "token_cache_size": 500}])
+def test_normalize_many_matches_batch(dict_path, texts, options):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path, **options)
+    expected = [normalizer.normalize(text) for text in texts]
+    assert normalizer.normalize_many(texts, threads=4, batch_size=64) == expected
+    assert normalizer.normalize_many(iter(texts), punctuation_to_keep="።") == normalizer.normalize_batch(texts, "።")
+
+
+def test_concurrent_first_use(dict_path, texts, fast_switching):
+    expected = TigrinyaNormalizer(dict_path=dict_path, engine="scanner").normalize_batch(texts[:200])
+    clear_registry()
+    shared = TigrinyaNormalizer(dict_path=dict_path, engine="scanner", token_cache_size=100)
+
+    def work(index):
+        return shared.plan.scanner, [shared.normalize(text) for text in texts[:200]]
+
+    results = run_together(work)
+    assert len({id(scanner) for scanner, _ in results}) == 1
+    assert all(outputs == expected for _, outputs in results)
+
+
+def test_concurrent_loads_read_each_file_once(dict_path, monkeypatch, fast_switching):
+    clear_registry()
+    store = DictionaryStore(dict_path, {"clitic_dict": "clitic_dict.txt"})
+    reads = []
+    read = store._read
+    monkeypatch.setattr(store, "_read", lambda name: reads.append(name) or read(name))
+    tables = run_together(lambda index: store["clitic_dict"])
+    assert reads == ["clitic_dict"]
+    assert all(table is tables[0] for table in tables)
+
+
+def test_reload_while_normalizing(dict_copy, fast_switching):
+    normalizer = TigrinyaNormalizer(dict_path=str(dict_copy))
+    text = "ማን ዩናይትድ ኣብ ሜዳ።"
+    before = normalizer.normalize(text)
+    stop = threading.Event()
+    seen = set()
+
+    def work(index):
+        if index == 0:
+            rewrite(dict_copy / "filtered_space_abbreviations.json", {"ማን ዩናይትድ": "ማን ዩ"})
+            normalizer.reload_dictionaries()
+            stop.set()
+            return
+        while not stop.is_set():
+            seen.add(normalizer.normalize(text))
+        seen.add(normalizer.normalize(text))
+
+    run_together(work)
+    after = normalizer.normalize(text)
+    assert after != before and seen <= {before, after}
+    with pytest.raises(TypeError):
+        normalizer.patterns["punctuation"] = None
+
+
+def test_concurrent_stats_count_every_lookup(dict_path, fast_switching):
+    normalizer = TigrinyaNormalizer(dict_path=dict_path)
+    normalizer.enable_stats()
+    run_together(lambda index: [normalizer.normalize("ቤ/ት") for _ in range(300)])
+    stats = normalizer.stats()
+    assert stats["lookups"]["words_with_fwd_slash"]["hits"] == THREADS * 300
+    assert stats["stages"]["handle_words"]["calls"] == THREADS * 300
@@ -0,0 +1,139 @@
+# artifact.py
+import os
+import json
+import mmap
+import struct
+
+ARTIFACT_NAME = "dictionaries.bin"
+ARTIFACT_MAGIC = b"TIDICT"
+ARTIFACT_VERSION = 1
+
+# magic, format version, length of the JSON header that follows
+PREAMBLE = struct.Struct("<6sHI")
+SEPARATOR = "\0"
+
+
+def source_stamp(file_path):
+    """Return the (mtime_ns, size) pair used to decide whether a compiled table is stale."""
+    st = os.stat(file_path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _encode_strings(strings, name):
+    for s in strings:
+        if not isinstance(s, str) or SEPARATOR in s:
+            raise ValueError(f"Dictionary '{name}' contains an entry that cannot be packed: {s!r}")
+    return SEPARATOR.join(strings).encode("utf-8")
+
+
+def compile_artifact(dict_root_path, dict_files, artifact_path=None):
+    """
+    Pack the JSON dictionaries listed in `dict_files` into a single binary artifact.
+
+    Layout: a fixed preamble (magic, format version, header length), a JSON header
+    describing each table and the source file it was compiled from, then for each
+    table a block of NUL-separated keys followed by a block of NUL-separated values,
+    both in the original dictionary order. Table offsets are relative to the end of
+    the header. Missing source files are skipped.
+
+    Returns the path of the written artifact.
+    """
+    artifact_path = artifact_path or os.path.join(dict_root_path, ARTIFACT_NAME)
+    blocks = []
+    tables = {}
+    offset = 0
+    for name, filename in dict_files.items():
+        file_path = os.path.join(dict_root_path, filename)
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"Dictionary '{name}' in {file_path} is not a JSON object.")
+
+        mtime_ns, size = source_stamp(file_path)
+        keys = _encode_strings(list(data.keys()), name)
+        values = _encode_strings(list(data.values()), name)
+        tables[name] = {
+            "file": filename, "mtime_ns": mtime_ns, "size": size, "count": len(data),
+            "keys": [offset, len(keys)], "values": [offset + len(keys), len(values)],
+        }
+        blocks.extend([keys, values])
+        offset += len(keys) + len(values)
+
+    header = json.dumps({"tables": tables}, ensure_ascii=False).encode("utf-8")
+
+    tmp_path = artifact_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(PREAMBLE.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, len(header)))
+        f.write(header)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp_path, artifact_path)
+    return artifact_path
+
+
+class DictionaryArtifact:
+    """
+    Read-only view of a compiled dictionary artifact.
+
+    The file is memory-mapped, so opening it only parses the small header. Tables
+    are decoded into plain dicts on demand with load(); each process keeps its own
+    decoded copy, so only the raw pages are shared between processes.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mmap) < PREAMBLE.size:
+                raise ValueError("file is too short")
+            magic, version, header_len = PREAMBLE.unpack_from(self._mmap, 0)
+            if magic != ARTIFACT_MAGIC:
+                raise ValueError("not a dictionary artifact")
+            if version != ARTIFACT_VERSION:
+                raise ValueError(f"unsupported artifact version {version}")
+            header = self._mmap[PREAMBLE.size:PREAMBLE.size + header_len]
+            self.tables = json.loads(header.decode("utf-8"))["tables"]
+            self._data_offset = PREAMBLE.size + header_len
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def is_fresh(self, name, filename, dict_root_path):
+        """True if `name` was compiled from `filename` and that file has not changed since."""
+        table = self.tables.get(name)
+        if table is None or table["file"] != filename:
+            return False
+        try:
+            return source_stamp(os.path.join(dict_root_path, filename)) == (table["mtime_ns"], table["size"])
+        except OSError:
+            return False
+
+    def _strings(self, span):
+        offset = self._data_offset + span[0]
+        return self._mmap[offset:offset + span[1]].decode("utf-8").split(SEPARATOR)
+
+    def load(self, name):
+        table = self.tables[name]
+        if not table["count"]:
+            return {}
+        return dict(zip(self._strings(table["keys"]), self._strings(table["values"])))
+
+    def close(self):
+        self._mmap.close()
+
+
+def open_artifact(dict_root_path):
+    """
+    Open the artifact in `dict_root_path`.
+    Returns None if there is none or it cannot be read, so callers fall back to JSON.
+    """
+    path = os.path.join(dict_root_path, ARTIFACT_NAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        return DictionaryArtifact(path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not load {path}. Error: {e}")
+        return None
@@ -0,0 +1,172 @@
+# audit.py
+import json
+import os
+import re
+from .folding import FOLDING_PROFILES, folding_table
+from .scanner import DOTTED_KEY_PATTERN
+
+# How the built-in stages read each dictionary, which decides what compaction may drop:
+# LOOKUP tables replace a whole token (or word piece) with its value, so an entry
+# mapping a key to itself changes nothing; ALTERNATION tables are compiled into one
+# regex, where an identity entry still stops overlapping keys from matching; only the
+# keys of MEMBERSHIP tables matter.
+LOOKUP = "lookup"
+ALTERNATION = "alternation"
+MEMBERSHIP = "membership"
+
+# Clitic parts and joined words never contain whitespace, clitic marks, '-' or '/'.
+CLITIC_UNMATCHABLE_PATTERN = re.compile(r"[\s`’'/-]")
+WORD_PIECE_PATTERN = re.compile(r"\w+|\W+", re.UNICODE)
+WHITESPACE_PATTERN = re.compile(r"\s")
+
+
+def _clitic_key(key):
+    return bool(key) and not CLITIC_UNMATCHABLE_PATTERN.search(key)
+
+
+def _hyphenated_key(key):
+    return "-" in key and not WHITESPACE_PATTERN.search(key)
+
+
+def _slashed_key(key):
+    return "/" in key and "-" not in key and not WHITESPACE_PATTERN.search(key)
+
+
+# name -> (how it is read, which keys some stage can match)
+DICTIONARY_USES = {
+    "clitic_dict": (LOOKUP, _clitic_key),
+    "cliticize_improper_words": (MEMBERSHIP, _clitic_key),
+    "words_with_dots": (LOOKUP, lambda key: bool(DOTTED_KEY_PATTERN.fullmatch(key))),
+    "hyphenated_words_v1": (LOOKUP, lambda key: bool(WORD_PIECE_PATTERN.fullmatch(key))),
+    "hyphenated_words_v2": (LOOKUP, _hyphenated_key),
+    "words_with_fwd_slash": (LOOKUP, _slashed_key),
+    "improper_abbreviations": (ALTERNATION, bool),
+    "filtered_space_abbreviations": (ALTERNATION, bool),
+    "filtered_single_abbreviations": (ALTERNATION, bool),
+}
+
+
+def read_entries(path):
+    """Return the `(key, value)` pairs of a JSON dictionary file in file order, repeated keys included."""
+    with open(path, encoding="utf-8") as f:
+        try:
+            pairs = json.load(f, object_pairs_hook=lambda pairs: pairs)
+        except ValueError as e:
+            raise ValueError(f"{path} is not valid JSON: {e}")
+    if not isinstance(pairs, list):
+        raise ValueError(f"{path} does not hold a JSON object.")
+    return pairs
+
+
+def overlaps(key, other):
+    """Whether `other` can match starting inside a match of `key` (it then can't while `key` is there)."""
+    for start in range(len(key)):
+        shared = min(len(key) - start, len(other))
+        if key[start:start + shared] == other[:shared]:
+            return True
+    return False
+
+
+def fold_collisions(keys):
+    """The keys that fold to the same form as another key under some folding profile."""
+    colliding = set()
+    for profile in FOLDING_PROFILES:
+        table = folding_table(profile)
+        groups = {}
+        for key in keys:
+            groups.setdefault(key.translate(table), []).append(key)
+        colliding.update(key for group in groups.values() if len(group) > 1 for key in group)
+    return colliding
+
+
+def audit_table(name, pairs):
+    """
+    Audit one dictionary's `(key, value)` pairs. Returns a report with the entry
+    count and the keys that are repeated, unreachable, identity entries that are safe
+    to drop and identity entries that must stay, plus the compacted table.
+    """
+    table = dict(pairs)
+    seen, duplicates = set(), []
+    for key, _ in pairs:
+        if key in seen:
+            duplicates.append(key)
+        seen.add(key)
+
+    report = {"entries": len(pairs), "duplicates": duplicates, "identity": [], "kept_identity": [],
+              "unreachable": [], "compacted": table}
+    if name not in DICTIONARY_USES:
+        return report
+    use, reachable = DICTIONARY_USES[name]
+    report["unreachable"] = [key for key in table if not reachable(key)]
+    drop = set(report["unreachable"])
+    if use != MEMBERSHIP:
+        # Dropping a key must not let a different key win under folding (first key wins).
+        colliding = fold_collisions(table)
+        candidates = [key for key, value in table.items() if key == value and reachable(key) and key not in colliding]
+        # Dropping an alternation key can free another identity key it overlapped, so repeat until stable.
+        while True:
+            remaining = [key for key in table if key not in drop]
+            removable = {key for key in candidates if key not in drop and not (
+                use == ALTERNATION and any(other != key and overlaps(key, other) for other in remaining))}
+            if not removable:
+                break
+            drop |= removable
+        report["identity"] = [key for key in candidates if key in drop]
+        report["kept_identity"] = [key for key, value in table.items()
+                                   if key == value and reachable(key) and key not in drop]
+    report["compacted"] = {key: value for key, value in table.items() if key not in drop}
+    return report
+
+
+def find_conflicts(tables):
+    """Keys found in several lookup or alternation tables with different values: key -> {name: value}."""
+    values = {}
+    for name, table in tables.items():
+        if DICTIONARY_USES.get(name, (MEMBERSHIP,))[0] == MEMBERSHIP:
+            continue
+        for key, value in table.items():
+            values.setdefault(key, {})[name] = value
+    return {key: found for key, found in values.items()
+            if len(found) > 1 and len({json.dumps(value, ensure_ascii=False) for value in found.values()}) > 1}
+
+
+def audit_dictionaries(dict_root_path, dict_files):
+    """
+    Audit the dictionary files `dict_files` ({name: filename}) in `dict_root_path`.
+    Returns `(reports, conflicts)`: the audit_table() report of every file found,
+    by name, and the keys that conflict across files (see find_conflicts).
+    """
+    reports, tables = {}, {}
+    for name, filename in dict_files.items():
+        path = os.path.join(dict_root_path, filename)
+        if os.path.exists(path):
+            pairs = read_entries(path)
+            reports[name] = audit_table(name, pairs)
+            tables[name] = dict(pairs)
+    return reports, find_conflicts(tables)
+
+
+def removed_entries(report):
+    return report["entries"] - len(report["compacted"])
+
+
+def compact_dictionaries(dict_root_path, dict_files, output_dir=None):
+    """
+    Write every audited dictionary without its repeated keys, unreachable keys and
+    removable identity entries into `output_dir` (default: in place), in the
+    generator's JSON format. normalize() output is unchanged for any pipeline of
+    built-in stages, with or without folding. Returns the audit_dictionaries() result.
+    """
+    output_dir = output_dir or dict_root_path
+    reports, conflicts = audit_dictionaries(dict_root_path, dict_files)
+    os.makedirs(output_dir, exist_ok=True)
+    for name, report in reports.items():
+        path = os.path.join(output_dir, dict_files[name])
+        if os.path.realpath(path) == os.path.realpath(os.path.join(dict_root_path, dict_files[name])) \
+                and not removed_entries(report):
+            continue
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(report["compacted"], f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, path)
+    return reports, conflicts
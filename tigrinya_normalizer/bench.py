@@ -0,0 +1,214 @@
+# bench.py
+import io
+import os
+import sys
+import time
+import json
+import shutil
+import contextlib
+import logging
+import platform
+import tempfile
+import statistics
+from .corpus import CorpusGenerator
+from .normalizer import TigrinyaNormalizer
+from .dictionary_generator import TiDictionary
+from .store import clear_registry
+
+RESULTS_VERSION = 1
+DEFAULT_CORPUS_SIZE = 1 << 20
+DEFAULT_SHORT_TEXTS = 2000
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.10
+# Settings that change what is measured; runs are only comparable if they agree on these.
+COMPARED_SETTINGS = ("engine", "corpus_size", "short_texts", "seed", "rates")
+
+
+def _measure(run, repeat, setup=None):
+    """Call `run()` `repeat` times (after `setup()` each time) and return the timings in seconds."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _result(timings, amount, unit):
+    best = min(timings)
+    return {
+        "seconds": best,
+        "median_seconds": statistics.median(timings),
+        "throughput": amount / best if best else 0.0,
+        "unit": unit,
+        "runs": timings,
+    }
+
+
+def bench_cold_start(ctx):
+    """Construct a normalizer with nothing cached in the process and normalize one sentence."""
+    def run():
+        TigrinyaNormalizer(dict_path=ctx["dict_path"], engine=ctx["engine"]).normalize(ctx["short_texts"][0])
+    return _result(_measure(run, ctx["repeat"], setup=clear_registry), 1, "starts/s")
+
+
+def bench_normalize_short(ctx):
+    """normalize() on each of many one-sentence texts."""
+    normalizer = ctx["normalizer"]
+    texts = ctx["short_texts"]
+    return _result(_measure(lambda: [normalizer.normalize(t) for t in texts], ctx["repeat"]), len(texts), "texts/s")
+
+
+def bench_normalize_long(ctx):
+    """normalize() on the whole corpus as one string."""
+    normalizer = ctx["normalizer"]
+    text = ctx["corpus"]
+    return _result(_measure(lambda: normalizer.normalize(text), ctx["repeat"]), ctx["corpus_mb"], "MB/s")
+
+
+def bench_normalize_and_save(ctx):
+    """normalize_and_save() from the corpus file to a file in the scratch directory."""
+    normalizer = TigrinyaNormalizer(
+        dict_path=ctx["dict_path"], dataset_file=ctx["corpus_path"], output_dir=ctx["workdir"], engine=ctx["engine"]
+    )
+    normalizer.load_dictionaries()
+    run = lambda: normalizer.normalize_and_save("normalized.txt")
+    return _result(_measure(run, ctx["repeat"]), ctx["corpus_mb"], "MB/s")
+
+
+def bench_create_dictionary(ctx):
+    """TiDictionary.create_dictionary() over the corpus file, writing into a fresh directory each run."""
+    output_dir = os.path.join(ctx["workdir"], "dictgen")
+
+    def setup():
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            TiDictionary(ctx["corpus_path"], output_dir).create_dictionary()
+    return _result(_measure(run, ctx["repeat"], setup=setup), ctx["corpus_mb"], "MB/s")
+
+
+BENCHMARKS = {
+    "cold_start": bench_cold_start,
+    "normalize_short": bench_normalize_short,
+    "normalize_long": bench_normalize_long,
+    "normalize_and_save": bench_normalize_and_save,
+    "create_dictionary": bench_create_dictionary,
+}
+
+
+def run_benchmarks(dict_path, names=None, engine="regex", corpus_size=DEFAULT_CORPUS_SIZE,
+                   short_texts=DEFAULT_SHORT_TEXTS, repeat=DEFAULT_REPEAT, seed=0, rates=None, progress=None):
+    """
+    Run the named benchmarks (default: all of BENCHMARKS) on a seeded synthetic corpus.
+
+    Each result reports the best and median time over `repeat` runs and the
+    throughput of the best run. Returns a JSON-serializable dict that also records
+    the settings and environment, for save_results() and compare_results().
+    """
+    names = list(BENCHMARKS) if names is None else list(names)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}. Expected some of: {', '.join(BENCHMARKS)}")
+
+    generator = CorpusGenerator(dict_path, seed=seed, rates=rates)
+    workdir = tempfile.mkdtemp(prefix="tigrinya-bench-")
+    logger = logging.getLogger("tigrinya_normalizer.dictionary_generator")
+    level = logger.level
+    try:
+        corpus_path = generator.write(os.path.join(workdir, "corpus.txt"), corpus_size)
+        with open(corpus_path, encoding="utf-8") as f:
+            corpus = f.read()
+        normalizer = TigrinyaNormalizer(dict_path=dict_path, engine=engine)
+        normalizer.load_dictionaries()
+        ctx = {
+            "dict_path": dict_path, "engine": engine, "repeat": repeat, "workdir": workdir,
+            "corpus": corpus, "corpus_path": corpus_path, "corpus_mb": os.path.getsize(corpus_path) / 1e6,
+            "short_texts": generator.texts(short_texts), "normalizer": normalizer,
+        }
+        # create_dictionary() logs and prints on every run; keep the benchmark output readable.
+        logger.setLevel(logging.WARNING)
+        results = {}
+        for name in names:
+            if progress is not None:
+                progress(name)
+            results[name] = BENCHMARKS[name](ctx)
+    finally:
+        logger.setLevel(level)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "engine": engine, "corpus_size": corpus_size, "short_texts": short_texts,
+            "repeat": repeat, "seed": seed, "rates": generator.rates,
+        },
+        "results": results,
+    }
+
+
+def save_results(results, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION or "results" not in results:
+        raise ValueError(f"{path} is not a tigrinya-bench results file.")
+    return results
+
+
+def settings_differences(baseline, current):
+    """Return {setting: (baseline value, current value)} for the COMPARED_SETTINGS the two runs disagree on."""
+    base, cur = baseline.get("settings", {}), current.get("settings", {})
+    return {key: (base.get(key), cur.get(key)) for key in COMPARED_SETTINGS if base.get(key) != cur.get(key)}
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD, force=False):
+    """
+    Compare the throughput of every benchmark present in both result sets.
+
+    Returns one row per benchmark with the baseline and current throughput, the
+    relative change and whether it regressed, i.e. dropped by more than `threshold`
+    (a fraction, 0.10 = 10%). Raises ValueError if the runs were made with different
+    engine, corpus or seed settings, unless `force` is true.
+    """
+    differences = settings_differences(baseline, current)
+    if differences and not force:
+        described = ", ".join(f"{key} {base!r} vs {cur!r}" for key, (base, cur) in differences.items())
+        raise ValueError(f"Benchmark runs used different settings ({described}); use force=True (--force) to compare anyway.")
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        change = result["throughput"] / base["throughput"] - 1 if base["throughput"] else 0.0
+        rows.append({
+            "name": name, "unit": result["unit"],
+            "baseline": base["throughput"], "current": result["throughput"],
+            "change": change, "regressed": change < -threshold,
+        })
+    return rows
+
+
+def format_results(results, out=None):
+    out = out or sys.stdout
+    for name, result in results["results"].items():
+        out.write(f"{name:<20} {result['throughput']:>12.2f} {result['unit']:<9} "
+                  f"(best {result['seconds']:.4f}s, median {result['median_seconds']:.4f}s)\n")
+
+
+def format_comparison(rows, out=None):
+    out = out or sys.stdout
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else "ok"
+        out.write(f"{row['name']:<20} {row['baseline']:>12.2f} -> {row['current']:>12.2f} {row['unit']:<9} "
+                  f"{row['change']:+7.1%}  {flag}\n")
@@ -0,0 +1,78 @@
+# cache.py
+import threading
+from collections import OrderedDict
+
+
+class TokenCache:
+    """
+    Bounded, thread-safe LRU cache of per-token normalization results.
+
+    Holds at most `maxsize` entries, evicting the least recently used one when full,
+    and counts hits, misses and evictions. A cache belongs to one NormalizationPlan,
+    so reloading dictionaries starts a new, empty cache.
+    """
+    def __init__(self, maxsize):
+        if maxsize <= 0:
+            raise ValueError("Token cache size must be positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def items(self):
+        """A snapshot of the cached `(key, value)` pairs, least recently used first."""
+        with self._lock:
+            return list(self._data.items())
+
+    def scoped(self, scope):
+        """Return a view of this cache whose keys are implicitly paired with `scope`."""
+        return ScopedTokenCache(self, scope)
+
+    def stats(self):
+        return {
+            "size": len(self._data), "maxsize": self.maxsize,
+            "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+        }
+
+
+class ScopedTokenCache:
+    """A TokenCache view keyed by `(scope, key)`, e.g. one per punctuation pattern."""
+    __slots__ = ("cache", "scope")
+
+    def __init__(self, cache, scope):
+        self.cache = cache
+        self.scope = scope
+
+    def get(self, key, default=None):
+        return self.cache.get((self.scope, key), default)
+
+    def __setitem__(self, key, value):
+        self.cache[(self.scope, key)] = value
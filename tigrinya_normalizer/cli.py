@@ -1,16 +1,106 @@
 import argparse
 import os
+import sys
 from tigrinya_normalizer.normalizer import TigrinyaNormalizer
+from tigrinya_normalizer.parallel import normalize_file_parallel
+from tigrinya_normalizer.server import NormalizationServer, DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, serve
+from tigrinya_normalizer.instrument import format_stats
+from tigrinya_normalizer.jobs import expand_inputs, normalize_files, is_glob
+from tigrinya_normalizer.records import normalize_jsonl
+from tigrinya_normalizer.folding import FOLDING_PROFILES
+from tigrinya_normalizer.script import ScriptFilter, SCRIPT_ACTIONS
+from tigrinya_normalizer.dedup import make_deduplicator, DEDUP_MODES, DEFAULT_NEAR_THRESHOLD
+
+
+def print_progress(event):
+    status = event["status"]
+    line = f"[{event['index']}/{event['total']}] {status:<7} {event['input']}"
+    if status == "done":
+        mb_per_s = event["bytes"] / 1e6 / event["seconds"] if event["seconds"] else 0.0
+        line += f" -> {event['output']} ({event['bytes'] / 1e6:.1f} MB, {event['seconds']:.2f}s, {mb_per_s:.2f} MB/s)"
+    elif status == "failed":
+        line += f": {event['error']}"
+    print(line, flush=True)
+
+
+def normalize_many_main(normalizer, args):
+    """Normalize several inputs (files, directories, globs) into the output directory `args.output`."""
+    output_dir = args.output or "normalized_output"
+    try:
+        inputs = expand_inputs(args.input, exclude=output_dir)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    totals = normalize_files(
+        normalizer, inputs, output_dir, punctuation_to_keep=args.punctuation, stream=args.stream,
+        workers=args.workers, manifest_path=args.manifest, progress=print_progress, fields=args.field,
+        script_filter=args.script_filter
+    )
+    mb_per_s = totals["bytes"] / 1e6 / totals["seconds"] if totals["seconds"] else 0.0
+    print(f"Normalized {totals['done']} files ({totals['bytes'] / 1e6:.1f} MB, {mb_per_s:.2f} MB/s), "
+          f"skipped {totals['skipped']} unchanged, {totals['failed']} failed. Output saved to {output_dir}")
+    if args.script_filter is not None:
+        print(f"Script filter: {args.script_filter.report()}")
+    if args.stats:
+        print(format_stats(normalizer.stats()))
+    return 1 if totals["failed"] else None
+
+
+def serve_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="tigrinya-normalize serve",
+        description="Serve Tigrinya normalization over local HTTP/JSON with request micro-batching."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on (default: 8080)")
+    parser.add_argument("--unix", default=None, help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument("-d", "--dict_path", type=str, default="dictionaries", help="Path to the dictionary folder")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="Worker processes for normalization; 1 uses a single background thread (default: 1)"
+    )
+    parser.add_argument(
+        "--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE,
+        help=f"Most texts normalized together in one batch (default: {DEFAULT_MAX_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_MS,
+        help=f"Longest time a request waits for its batch to fill (default: {DEFAULT_MAX_WAIT_MS})"
+    )
+    parser.add_argument(
+        "--token-cache-size", type=int, default=0,
+        help="Entries in the per-token LRU cache, 0 to disable (default: 0)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        normalizer = TigrinyaNormalizer(
+            dict_path=args.dict_path, engine="scanner", token_cache_size=args.token_cache_size
+        )
+        server = NormalizationServer(
+            normalizer, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms, workers=args.workers
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    serve(server, args.host, args.port, args.unix)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "serve":
+        return serve_main(argv[1:])
 
-def main():
     parser = argparse.ArgumentParser(description="Normalize Tigrinya text")
     parser.add_argument(
-        "-i", "--input", type=str, required=True,
-        help="Path to the input dataset file"
+        "-i", "--input", type=str, required=True, nargs="+",
+        help="Path to the input dataset file; several files, directories or glob patterns are normalized "
+             "into the output directory"
     )
     parser.add_argument(
-        "-o", "--output", type=str, default="normalized_output.txt",
-        help="Filename for normalized output (can include path)"
+        "-o", "--output", type=str, default=None,
+        help="Filename for normalized output (can include path), or the output directory for several inputs "
+             "(default: normalized_output.txt / normalized_output)"
     )
     parser.add_argument(
         "-d", "--dict_path", type=str, default="dictionaries",
@@ -20,20 +110,147 @@ def main():
         "-p", "--punctuation", type=str, default=None,
         help="Punctuation marks to keep (optional)"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Normalize the input incrementally with bounded memory"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="Number of worker processes for parallel normalization (default: 1)"
+    )
+    parser.add_argument(
+        "--pipeline", default=None,
+        help="JSON file listing the normalization stages to run (default: all built-in stages)"
+    )
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="Print per-stage timings and dictionary hit rates after normalizing"
+    )
+    parser.add_argument(
+        "--fold", choices=sorted(FOLDING_PROFILES), default=None,
+        help="Fold Ge'ez character variants with this profile, in the text and the dictionary keys (default: off)"
+    )
+    parser.add_argument(
+        "--format", choices=("text", "jsonl"), default="text",
+        help="Input format: plain text, or JSON lines whose --field values are normalized (default: text)"
+    )
+    parser.add_argument(
+        "--field", action="append", default=None,
+        help="Field of each JSON-lines record to normalize; repeat for several fields (default: text)"
+    )
+    parser.add_argument(
+        "--script-threshold", type=float, default=None,
+        help="Normalize only lines whose share of Ge'ez letters is at least this (0-1); "
+             "other lines are handled per --non-tigrinya (default: off)"
+    )
+    parser.add_argument(
+        "--non-tigrinya", choices=SCRIPT_ACTIONS, default=None,
+        help="What to do with lines below --script-threshold (default: passthrough)"
+    )
+    parser.add_argument(
+        "--dedup", choices=DEDUP_MODES, default=None,
+        help="Drop repeated sentences from the output: exact repeats, or also near duplicates (default: off)"
+    )
+    parser.add_argument(
+        "--dedup-threshold", type=float, default=DEFAULT_NEAR_THRESHOLD,
+        help=f"Estimated Jaccard similarity from which --dedup near drops a sentence (default: {DEFAULT_NEAR_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--dedup-max-entries", type=int, default=None,
+        help="Bound dedup memory to about this many remembered sentences (default: unbounded)"
+    )
+    parser.add_argument(
+        "--manifest", default=None,
+        help="Manifest of completed inputs for several inputs (default: manifest.jsonl in the output directory)"
+    )
+    args = parser.parse_args(argv)
+    if args.stats and (args.stream or args.workers > 1):
+        parser.error("--stats cannot be combined with --stream or --workers")
+    if args.field and args.format != "jsonl":
+        parser.error("--field requires --format jsonl")
+    if args.format == "jsonl":
+        args.field = args.field or ["text"]
+    if args.non_tigrinya and args.script_threshold is None:
+        parser.error("--non-tigrinya requires --script-threshold")
+    args.script_filter = None
+    if args.script_threshold is not None:
+        if args.format == "jsonl" or args.stream:
+            parser.error("--script-threshold cannot be combined with --format jsonl or --stream")
+        try:
+            args.script_filter = ScriptFilter(args.script_threshold, args.non_tigrinya or "passthrough")
+        except ValueError as e:
+            parser.error(str(e))
+    many = len(args.input) > 1 or os.path.isdir(args.input[0]) or is_glob(args.input[0])
+    if args.manifest and not many:
+        parser.error("--manifest applies to several inputs, a directory or a glob pattern")
+    if args.dedup and (many or args.format == "jsonl" or args.script_filter is not None):
+        parser.error("--dedup applies to a single text input without --script-threshold")
+    try:
+        dedup = make_deduplicator(args.dedup, args.dedup_threshold, args.dedup_max_entries)
+    except ValueError as e:
+        parser.error(str(e))
 
-    # Extract output directory from output file path
-    output_dir = os.path.dirname(args.output) or "."
+    if many:
+        output_dir = "."
+    else:
+        args.input = args.input[0]
+        args.output = args.output or "normalized_output.txt"
+        # Extract output directory from output file path
+        output_dir = os.path.dirname(args.output) or "."
 
-    normalizer = TigrinyaNormalizer(
-        dict_path=args.dict_path,
-        dataset_file=args.input,
-        output_dir=output_dir
-    )
+    try:
+        normalizer = TigrinyaNormalizer(
+            dict_path=args.dict_path,
+            dataset_file=None if many else args.input,
+            output_dir=output_dir,
+            pipeline_config=args.pipeline,
+            fold=args.fold
+        )
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Error: {e}")
+        return
+    single_text = not many and args.format != "jsonl" and args.script_filter is None
+    if not normalizer.pipeline.scannable and (args.stream or (single_text and args.workers > 1)):
+        print("Error: --stream, and --workers on a single text file, need the default stages; "
+              "drop them or --pipeline.")
+        return
+    if args.stats:
+        normalizer.enable_stats()
+    if many:
+        return normalize_many_main(normalizer, args)
 
     try:
-        normalizer.normalize_and_save(os.path.basename(args.output), punctuation_to_keep=args.punctuation)
+        if args.format == "jsonl":
+            os.makedirs(output_dir, exist_ok=True)
+            records, seconds = normalize_jsonl(
+                normalizer, args.input, args.output, args.field,
+                punctuation_to_keep=args.punctuation, workers=args.workers
+            )
+            rate = records / seconds if seconds else 0.0
+            print(f"Normalized {records} records in {seconds:.2f}s ({rate:.0f} records/s)")
+        elif args.script_filter is not None:
+            os.makedirs(output_dir, exist_ok=True)
+            args.script_filter.route_file(
+                normalizer, args.input, args.output, punctuation_to_keep=args.punctuation, workers=args.workers
+            )
+            print(f"Script filter: {args.script_filter.report()}")
+        elif args.workers > 1:
+            os.makedirs(output_dir, exist_ok=True)
+            reports = normalize_file_parallel(
+                normalizer, args.input, args.output, args.workers, punctuation_to_keep=args.punctuation, dedup=dedup
+            )
+            for report in reports:
+                print(f"Worker {report['pid']}: {report['chunks']} chunks, "
+                      f"{report['bytes'] / 1e6:.1f} MB in {report['seconds']:.2f}s ({report['mb_per_s']:.2f} MB/s)")
+        else:
+            normalizer.normalize_and_save(
+                os.path.basename(args.output), punctuation_to_keep=args.punctuation, stream=args.stream, dedup=dedup
+            )
+        if dedup is not None:
+            print(f"Dedup: {dedup.report()}")
         print(f"Normalization complete. Output saved to {args.output}")
+        if args.stats:
+            print(format_stats(normalizer.stats()))
     except FileNotFoundError as e:
         print(f"Error: {e}")
     except Exception as e:
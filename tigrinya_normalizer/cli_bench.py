@@ -0,0 +1,142 @@
+# tigrinya_normalizer/cli_bench.py
+
+import argparse
+import sys
+from tigrinya_normalizer.bench import (
+    BENCHMARKS, DEFAULT_CORPUS_SIZE, DEFAULT_SHORT_TEXTS, DEFAULT_REPEAT, DEFAULT_THRESHOLD,
+    run_benchmarks, save_results, load_results, compare_results, format_results, format_comparison
+)
+from tigrinya_normalizer.corpus import CorpusGenerator, DEFAULT_RATES
+from tigrinya_normalizer.normalizer import ENGINES, resolve_path
+
+
+def parse_rates(values):
+    rates = {}
+    for value in values or ():
+        kind, _, rate = value.partition("=")
+        if kind not in DEFAULT_RATES:
+            raise argparse.ArgumentTypeError(f"Unknown token kind '{kind}'. Expected one of: {', '.join(DEFAULT_RATES)}")
+        try:
+            rates[kind] = float(rate)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid rate '{value}', expected KIND=FRACTION.")
+    return rates
+
+
+def add_corpus_arguments(parser):
+    parser.add_argument("-d", "--dict_path", default="dictionaries", help="Path to the dictionary folder")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic corpus (default: 0)")
+    parser.add_argument(
+        "--size", type=int, default=DEFAULT_CORPUS_SIZE,
+        help=f"Approximate corpus size in characters (default: {DEFAULT_CORPUS_SIZE})"
+    )
+    parser.add_argument(
+        "--rate", action="append", metavar="KIND=FRACTION",
+        help="Share of hyphenated, slashed, dotted or clitic tokens, e.g. --rate clitic=0.1 (repeatable)"
+    )
+
+
+def corpus_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="tigrinya-bench corpus", description="Write a seeded synthetic Tigrinya corpus built from the dictionaries."
+    )
+    parser.add_argument("-o", "--output", required=True, help="Output text file")
+    add_corpus_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        generator = CorpusGenerator(resolve_path(args.dict_path, "dictionaries"), args.seed, parse_rates(args.rate))
+    except (ValueError, argparse.ArgumentTypeError) as e:
+        print(f"Error: {e}")
+        return 2
+    generator.write(args.output, args.size)
+    print(f"✔ Corpus written to {args.output}")
+    return 0
+
+
+def compare_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="tigrinya-bench compare", description="Compare two benchmark result files."
+    )
+    parser.add_argument("baseline", help="Baseline results JSON")
+    parser.add_argument("current", help="Current results JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Largest tolerated throughput drop as a fraction (default: {DEFAULT_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Compare even if the runs used different engine, corpus or seed settings"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        baseline, current = load_results(args.baseline), load_results(args.current)
+        rows = compare_results(baseline, current, args.threshold, args.force)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 2
+    format_comparison(rows)
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "corpus":
+        return corpus_main(argv[1:])
+    if argv and argv[0] == "compare":
+        return compare_main(argv[1:])
+    if argv and argv[0] == "run":
+        argv = argv[1:]
+
+    parser = argparse.ArgumentParser(
+        prog="tigrinya-bench",
+        description="Benchmark the Tigrinya normalizer on a synthetic corpus. "
+                    "Subcommands: run (default), compare BASELINE CURRENT, corpus -o FILE."
+    )
+    add_corpus_arguments(parser)
+    parser.add_argument("--engine", choices=ENGINES, default="regex", help="Normalization engine (default: regex)")
+    parser.add_argument(
+        "--short-texts", type=int, default=DEFAULT_SHORT_TEXTS,
+        help=f"Number of one-sentence texts for normalize_short (default: {DEFAULT_SHORT_TEXTS})"
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help=f"Runs per benchmark (default: {DEFAULT_REPEAT})")
+    parser.add_argument(
+        "--only", default=None,
+        help=f"Comma-separated benchmarks to run (default: all of {', '.join(BENCHMARKS)})"
+    )
+    parser.add_argument("-o", "--output", default=None, help="Write results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Fail if throughput dropped against these results")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Largest tolerated throughput drop as a fraction (default: {DEFAULT_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Compare even if the runs used different engine, corpus or seed settings"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        baseline = load_results(args.baseline) if args.baseline else None
+        results = run_benchmarks(
+            resolve_path(args.dict_path, "dictionaries"),
+            names=args.only.split(",") if args.only else None,
+            engine=args.engine, corpus_size=args.size, short_texts=args.short_texts,
+            repeat=args.repeat, seed=args.seed, rates=parse_rates(args.rate),
+            progress=lambda name: print(f"Running {name} ...", file=sys.stderr),
+        )
+        rows = compare_results(baseline, results, args.threshold, args.force) if baseline is not None else None
+    except (OSError, ValueError, argparse.ArgumentTypeError) as e:
+        print(f"Error: {e}")
+        return 2
+
+    format_results(results)
+    if args.output:
+        save_results(results, args.output)
+        print(f"✔ Results written to {args.output}")
+    if rows is not None:
+        format_comparison(rows)
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
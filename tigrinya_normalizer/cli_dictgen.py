@@ -1,18 +1,130 @@
 # tigrinya_normalizer/cli_dictgen.py
 
 import argparse
-from tigrinya_normalizer.dictionary_generator import TiDictionary
+import os
+import sys
+from tigrinya_normalizer.dictionary_generator import TiDictionary, file_digest
+from tigrinya_normalizer.artifact import compile_artifact
+from tigrinya_normalizer.audit import audit_dictionaries, compact_dictionaries, removed_entries
+from tigrinya_normalizer.normalizer import DEFAULT_DICT_FILES, resolve_path
+
+
+def compile_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="tigrinya-dictgen compile",
+        description="Pack the normalizer dictionaries into a binary artifact for fast loading."
+    )
+    parser.add_argument("-d", "--dict_path", default="dictionaries", help="Path to the dictionary folder")
+    args = parser.parse_args(argv)
+
+    dict_root_path = resolve_path(args.dict_path, "dictionaries")
+    if not os.path.isdir(dict_root_path):
+        print(f"Error: Dictionary folder '{dict_root_path}' not found.")
+        return
+    artifact_path = compile_artifact(dict_root_path, DEFAULT_DICT_FILES)
+    print(f"✔ Dictionary artifact written to {artifact_path}")
+
+
+def print_audit(reports, conflicts, dict_files, show):
+    def sample(keys):
+        shown = ", ".join(keys[:show])
+        return f" ({shown}{', ...' if len(keys) > show else ''})" if keys and show else ""
+
+    for name, report in reports.items():
+        print(f"{dict_files[name]}: {report['entries']} entries, {removed_entries(report)} removable")
+        for label, field in (("identity entries", "identity"), ("identity entries kept, other keys depend on them",
+                             "kept_identity"), ("duplicate keys", "duplicates"), ("unreachable keys", "unreachable")):
+            if report[field]:
+                print(f"  {len(report[field])} {label}{sample(report[field])}")
+    if conflicts:
+        print(f"{len(conflicts)} keys have different values in different files:")
+        for key in list(conflicts)[:show]:
+            print(f"  {key}: " + ", ".join(f"{dict_files[name]}={value}" for name, value in conflicts[key].items()))
+
+
+def audit_main(argv, compact=False):
+    command = "compact" if compact else "audit"
+    parser = argparse.ArgumentParser(
+        prog=f"tigrinya-dictgen {command}",
+        description="Report identity entries, duplicate, conflicting and unreachable keys in the dictionaries"
+                    + (", then write them without the entries that change nothing." if compact else ".")
+    )
+    parser.add_argument("-d", "--dict_path", default="dictionaries", help="Path to the dictionary folder")
+    if compact:
+        parser.add_argument("-o", "--output", default=None,
+                            help="Directory for the compacted dictionaries (default: rewrite them in place)")
+    parser.add_argument("--show", type=int, default=5, help="Example keys to print per finding (default: 5)")
+    args = parser.parse_args(argv)
+
+    dict_root_path = resolve_path(args.dict_path, "dictionaries")
+    if not os.path.isdir(dict_root_path):
+        print(f"Error: Dictionary folder '{dict_root_path}' not found.")
+        return 1
+    try:
+        if compact:
+            reports, conflicts = compact_dictionaries(dict_root_path, DEFAULT_DICT_FILES, args.output)
+        else:
+            reports, conflicts = audit_dictionaries(dict_root_path, DEFAULT_DICT_FILES)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    print_audit(reports, conflicts, DEFAULT_DICT_FILES, args.show)
+    removed = sum(removed_entries(report) for report in reports.values())
+    if compact:
+        print(f"✔ Removed {removed} entries. Dictionaries written to {args.output or dict_root_path}")
+    else:
+        print(f"{removed} entries can be removed without changing the output; run `tigrinya-dictgen compact`.")
+
+
+def update_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="tigrinya-dictgen update",
+        description="Fold new corpus files into existing dictionaries, reading only the new text."
+    )
+    parser.add_argument("-i", "--input", required=True, nargs="+", help="New corpus files")
+    parser.add_argument("-o", "--output", required=True, help="Dictionary directory to update")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Number of processes scanning line-aligned shards of each input (default: 1)")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    ti_dict = TiDictionary(None, args.output)
+    try:
+        read = ti_dict.update_dictionary(args.input, workers=args.workers)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    print(f"✔ Dictionaries updated from {len(read)} new file(s); {len(args.input) - len(read)} already included.")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "compile":
+        return compile_main(argv[1:])
+    if argv and argv[0] == "update":
+        return update_main(argv[1:])
+    if argv and argv[0] in ("audit", "compact"):
+        return audit_main(argv[1:], compact=argv[0] == "compact")
 
-def main():
     parser = argparse.ArgumentParser(description="Generate Tigrinya normalization dictionaries.")
     parser.add_argument("-i", "--input", required=True, help="Input text file path")
     parser.add_argument("-o", "--output", required=True, help="Output directory for dictionaries")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Number of processes scanning line-aligned shards of the input (default: 1)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     ti_dict = TiDictionary(args.input, args.output)
-    ti_dict.create_dictionary("clitic_dict.txt", "words_with_fwd_slash.txt", "words_with_dots.txt")
+    # Curated dictionaries from an earlier run are kept; a fresh output directory starts empty.
+    curated = [name if os.path.exists(os.path.join(args.output, name)) else None
+               for name in ("clitic_dict.txt", "words_with_fwd_slash.txt", "words_with_dots.txt")]
+    ti_dict.create_dictionary(*curated, workers=args.workers)
     ti_dict.create_improper_clitic()
     ti_dict.write_clitic_dict(ti_dict.clitic_zipped_dict)
+    # Token counts let `tigrinya-dictgen update` fold in new text later without re-reading this corpus.
+    ti_dict.save_state({file_digest(args.input): args.input})
 
     print("✔ Dictionary generation completed.")
@@ -0,0 +1,65 @@
+# compression.py
+import importlib
+
+# Compression formats by name: (module, file suffix, magic bytes at the start of the file).
+FORMATS = {
+    "gzip": ("gzip", ".gz", b"\x1f\x8b"),
+    "bz2": ("bz2", ".bz2", b"BZh"),
+    "xz": ("lzma", ".xz", b"\xfd7zXZ\x00"),
+}
+# gzip's own default; level 9 is about twice as slow for little gain on text.
+GZIP_LEVEL = 6
+MAGIC_LENGTH = max(len(magic) for _, _, magic in FORMATS.values())
+
+try:
+    from lzma import LZMAError
+except ImportError:
+    LZMAError = OSError
+# What reading a corrupt or truncated compressed file can raise, besides UnicodeDecodeError.
+DECOMPRESSION_ERRORS = (OSError, EOFError, LZMAError)
+
+
+def compression_from_suffix(path):
+    """Return the compression format named by the suffix of `path`, or None."""
+    for name, (_, suffix, _) in FORMATS.items():
+        if path.endswith(suffix):
+            return name
+    return None
+
+
+def detect_compression(path):
+    """
+    Return the compression format of the existing file at `path`, from its magic
+    bytes, or None for an uncompressed file.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(MAGIC_LENGTH)
+    for name, (_, _, magic) in FORMATS.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def _module(name):
+    module_name = FORMATS[name][0]
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise ValueError(f"Cannot handle {name} files: this Python was built without the '{module_name}' module.")
+
+
+def open_text(path, mode='r', encoding='utf-8'):
+    """
+    Open `path` as a text stream, (de)compressing transparently.
+
+    Files opened for reading are decompressed when their magic bytes show gzip,
+    bz2 or xz data; files opened for writing or appending are compressed when their
+    name ends in .gz, .bz2 or .xz. Data is streamed, so memory use does not depend
+    on the file size.
+    """
+    name = detect_compression(path) if mode == 'r' else compression_from_suffix(path)
+    if name is None:
+        return open(path, mode, encoding=encoding)
+    if name == "gzip" and mode != 'r':
+        return _module(name).open(path, mode + 't', compresslevel=GZIP_LEVEL, encoding=encoding)
+    return _module(name).open(path, mode + 't', encoding=encoding)
@@ -0,0 +1,81 @@
+# corpus.py
+import os
+import random
+from .utils import load_json
+
+# Share of generated tokens drawn from each special vocabulary; the remainder are plain words.
+DEFAULT_RATES = {"hyphenated": 0.05, "slashed": 0.03, "dotted": 0.02, "clitic": 0.06}
+SENTENCE_LENGTH = (5, 20)
+SENTENCES_PER_LINE = (1, 4)
+
+
+def _usable(word):
+    return word and not any(c.isspace() or c == "\u200b" for c in word)
+
+
+class CorpusGenerator:
+    """
+    Seeded generator of synthetic Tigrinya text built from the shipped dictionaries.
+
+    Tokens are drawn from the hyphenated, slashed, dotted-abbreviation and clitic
+    entries at the rates given in `rates` (see DEFAULT_RATES); the rest are plain
+    words taken from the dictionary values. Sentences of 5-20 tokens end in ። or ፧
+    and 1-4 sentences make up a line. The same seed always yields the same text.
+    """
+    def __init__(self, dict_path, seed=0, rates=None):
+        unknown = set(rates or ()) - set(DEFAULT_RATES)
+        if unknown:
+            raise ValueError(f"Unknown token kinds: {', '.join(sorted(unknown))}")
+        self.rates = dict(DEFAULT_RATES, **(rates or {}))
+        if sum(self.rates.values()) > 1:
+            raise ValueError("Token rates must add up to at most 1.")
+        self.seed = seed
+
+        def table(filename):
+            return load_json(os.path.join(dict_path, filename))
+
+        clitic_forms = table("clitic_bind_dic.txt")
+        hyphenated = table("hyphenated_words_v2.txt")
+        self.vocabulary = {
+            "hyphenated": sorted(w for w in hyphenated if _usable(w) and "-" in w),
+            "slashed": sorted(w for w in table("words_with_fwd_slash.txt") if _usable(w) and "/" in w),
+            "dotted": sorted(w for w in table("words_with_dots.txt") if _usable(w) and "." in w),
+            "clitic": sorted(w for w in clitic_forms.values() if _usable(w) and any(c in w for c in "'`’")),
+        }
+        plain = {w for value in hyphenated.values() for w in value.split()}
+        plain.update(clitic_forms)
+        self.plain = sorted(w for w in plain if _usable(w))
+
+    def _token(self, rng):
+        roll = rng.random()
+        for kind, rate in self.rates.items():
+            if roll < rate and self.vocabulary[kind]:
+                return rng.choice(self.vocabulary[kind])
+            roll -= rate
+        return rng.choice(self.plain)
+
+    def _sentence(self, rng):
+        words = [self._token(rng) for _ in range(rng.randint(*SENTENCE_LENGTH))]
+        return " ".join(words) + ("፧" if rng.random() < 0.1 else "።")
+
+    def iter_lines(self, size):
+        """Yield lines (with their newline) until about `size` characters have been produced."""
+        rng = random.Random(self.seed)
+        produced = 0
+        while produced < size:
+            line = " ".join(self._sentence(rng) for _ in range(rng.randint(*SENTENCES_PER_LINE))) + "\n"
+            produced += len(line)
+            yield line
+
+    def texts(self, count):
+        """Return `count` short texts of one sentence each."""
+        rng = random.Random(self.seed)
+        return [self._sentence(rng) for _ in range(count)]
+
+    def generate(self, size):
+        return "".join(self.iter_lines(size))
+
+    def write(self, path, size):
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(self.iter_lines(size))
+        return path
@@ -0,0 +1,169 @@
+# dedup.py
+import hashlib
+import random
+import zlib
+from array import array
+
+DEFAULT_NEAR_THRESHOLD = 0.8
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+LSH_BANDS = 16
+# Signatures kept per LSH bucket, newest last: sentences that share a band without
+# being near duplicates must not push each other out of the candidates.
+BUCKET_SIZE = 8
+# Fixed seed so the same corpus always keeps the same sentences.
+MINHASH_SEED = 1
+DEDUP_MODES = ("exact", "near")
+
+
+def sentence_key(sentence):
+    """A 64-bit digest of `sentence`, stable across runs (unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(sentence.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def shingle_hashes(text, size=SHINGLE_SIZE):
+    """
+    The set of crc32 hashes of the `size`-character shingles of `text` (the whole
+    text if it is shorter). Shingles are sliced from the UTF-32 encoding, four
+    bytes per character, so the text is encoded only once.
+    """
+    data = text.encode("utf-32-le")
+    width = 4 * size
+    return set(map(zlib.crc32, [data[i:i + width] for i in range(0, max(len(data) - width, 0) + 1, 4)]))
+
+
+class MinHasher:
+    """
+    MinHash signatures of character shingles. Each of the `num_perm` hash functions
+    XORs the 32-bit shingle hashes with its own random mask, which is much cheaper
+    in pure Python than affine permutations and estimates Jaccard similarity as well
+    for near-duplicate detection.
+    """
+    def __init__(self, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, seed=MINHASH_SEED):
+        rng = random.Random(seed)
+        self.masks = [rng.getrandbits(32) for _ in range(num_perm)]
+        self.shingle_size = shingle_size
+
+    def signature(self, text):
+        hashes = shingle_hashes(text, self.shingle_size)
+        return array("I", [min(h ^ mask for h in hashes) for mask in self.masks])
+
+
+def similarity(signature, other):
+    """The estimated Jaccard similarity of two MinHash signatures."""
+    return sum(a == b for a, b in zip(signature, other)) / len(signature)
+
+
+class _Generations:
+    """
+    A dict that, given `max_entries`, keeps its newest keys in two generations of at
+    most max_entries / 2 each: when the current one fills up, the previous one is
+    dropped. Memory stays bounded and at least the latest half is remembered.
+    """
+    def __init__(self, max_entries=None):
+        self.limit = max(1, max_entries // 2) if max_entries else None
+        self.current = {}
+        self.previous = {}
+
+    def get(self, key):
+        value = self.current.get(key)
+        if value is None:
+            value = self.previous.get(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.current[key] = value
+        if self.limit is not None and len(self.current) >= self.limit:
+            self.previous = self.current
+            self.current = {}
+
+    def __len__(self):
+        return len(self.current) + len(self.previous)
+
+
+class Deduplicator:
+    """
+    Drops repeated sentences from a stream of normalized sentences.
+
+    Exact duplicates are found through a set of 64-bit sentence digests. With
+    `near_threshold`, sentences whose estimated Jaccard similarity over character
+    shingles reaches the threshold with an earlier kept sentence are dropped too,
+    found with MinHash and LSH over `bands` bands of the signature; each band bucket
+    keeps the signatures of its last BUCKET_SIZE sentences as candidates. With
+    `max_entries`, each index forgets its oldest entries to bound memory, so only
+    repeats within roughly the last `max_entries` sentences are caught.
+
+    `counts` holds how many sentences were kept and how many were dropped as exact
+    or near duplicates.
+    """
+    def __init__(self, near_threshold=None, max_entries=None, num_perm=NUM_PERM, bands=LSH_BANDS,
+                 shingle_size=SHINGLE_SIZE):
+        if near_threshold is not None and not 0.0 < near_threshold <= 1.0:
+            raise ValueError("The near-duplicate threshold must be above 0 and at most 1.")
+        if max_entries is not None and max_entries < 2:
+            raise ValueError("max_entries must be at least 2.")
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands.")
+        self.near_threshold = near_threshold
+        self.max_entries = max_entries
+        self.rows = num_perm // bands
+        self.seen = _Generations(max_entries)
+        self.buckets = _Generations(max_entries and max_entries * bands)
+        self.minhasher = MinHasher(num_perm, shingle_size) if near_threshold is not None else None
+        self.counts = {"kept": 0, "exact": 0, "near": 0}
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [bytes((band,)) + signature[start:start + rows].tobytes()
+                for band, start in enumerate(range(0, len(signature), rows))]
+
+    def check(self, sentence):
+        """Return "exact" or "near" if `sentence` repeats an earlier one, else None and remember it."""
+        key = sentence_key(sentence)
+        if self.seen.get(key):
+            self.counts["exact"] += 1
+            return "exact"
+        if self.minhasher is not None:
+            signature = self.minhasher.signature(sentence)
+            band_keys = self._band_keys(signature)
+            buckets = [self.buckets.get(band_key) or () for band_key in band_keys]
+            compared = set()
+            for bucket in buckets:
+                for candidate in bucket:
+                    if id(candidate) in compared:
+                        continue
+                    compared.add(id(candidate))
+                    if similarity(signature, candidate) >= self.near_threshold:
+                        self.counts["near"] += 1
+                        return "near"
+            for band_key, bucket in zip(band_keys, buckets):
+                self.buckets[band_key] = bucket[1 - BUCKET_SIZE:] + (signature,)
+        self.seen[key] = True
+        self.counts["kept"] += 1
+        return None
+
+    def filter(self, sentences):
+        """Yield the sentences that are not duplicates of earlier ones."""
+        check = self.check
+        for sentence in sentences:
+            if check(sentence) is None:
+                yield sentence
+
+    def report(self):
+        counts = self.counts
+        total = sum(counts.values())
+        dropped = counts["exact"] + counts["near"]
+        share = 100.0 * dropped / total if total else 0.0
+        report = f"{total} sentences: {counts['kept']} kept, {counts['exact']} exact duplicates"
+        if self.minhasher is not None:
+            report += f", {counts['near']} near duplicates"
+        return report + f" dropped ({share:.1f}%)"
+
+
+def make_deduplicator(mode, near_threshold=DEFAULT_NEAR_THRESHOLD, max_entries=None):
+    """Build a Deduplicator for one of DEDUP_MODES, or return None for no mode."""
+    if mode is None:
+        return None
+    if mode not in DEDUP_MODES:
+        raise ValueError(f"Unknown dedup mode '{mode}'. Expected one of: {', '.join(DEDUP_MODES)}")
+    return Deduplicator(near_threshold if mode == "near" else None, max_entries)
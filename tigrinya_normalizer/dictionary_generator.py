@@ -1,13 +1,134 @@
 import json
 import re
 import os
+import codecs
 import string
 import logging
+import multiprocessing
 from collections import Counter
+from .utils import file_digest
+from .compression import open_text, detect_compression
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 
+# Characters read from the corpus per block; blocks are cut after whitespace so no token is split.
+STREAM_BLOCK_SIZE = 1 << 22
+# Bound forms seen more often than this are listed in cliticize_improper_words.txt.
+IMPROPER_CLITIC_THRESHOLD = 5
+# Token counts and the corpus files they cover, kept next to the dictionaries for update_dictionary().
+STATE_FILE = "dictgen_state.json"
+STATE_VERSION = 1
+
+CLITIC_MARKS = "`’'"
+CLITIC_MARK_PATTERN = re.compile(r"[`’']")
+SHORTENED_BY_DOTS_PATTERN = re.compile(
+    r"(?<!\w)(?:[\w\u1200-\u137F]{1,2}+\.)+(?:[\w\u1200-\u137F]{1,7}+)?(?:\.)?(?!\w)"
+)
+
+_punctuation_tables = {}
+
+
+def punctuation_table(keep_punctuation=None):
+    """str.translate table deleting string.punctuation except the marks in `keep_punctuation`."""
+    key = keep_punctuation if isinstance(keep_punctuation, str) else frozenset(keep_punctuation or ())
+    table = _punctuation_tables.get(key)
+    if table is None:
+        table = _punctuation_tables[key] = {ord(c): None for c in string.punctuation if c not in key}
+    return table
+
+
+NO_PUNCTUATION_TABLE = punctuation_table()
+HYPHEN_TABLE = punctuation_table("-")
+SLASH_TABLE = punctuation_table("/")
+CLITIC_TABLE = punctuation_table(CLITIC_MARKS)
+
+
+def could_be_bound(token):
+    """
+    Whether `token` can be the bound form of a clitic, the parts of a word written with
+    a clitic mark joined together: it has at least two characters and neither a clitic
+    mark nor the punctuation the generator strips from such words.
+    """
+    return len(token) > 1 and not CLITIC_MARK_PATTERN.search(token) and \
+        token.translate(NO_PUNCTUATION_TABLE) == token
+
+
+def align_blocks(chunks):
+    """
+    Re-cut an iterable of text chunks into blocks that end on whitespace, so every
+    token (and every dotted abbreviation) lies entirely inside one block.
+    """
+    carry = ""
+    for chunk in chunks:
+        block = carry + chunk
+        cut = len(block)
+        while cut and not block[cut - 1].isspace():
+            cut -= 1
+        if cut:
+            carry = block[cut:]
+            yield block[:cut]
+        else:
+            carry = block
+    if carry:
+        yield carry
+
+
+def iter_text_blocks(f, block_size=STREAM_BLOCK_SIZE):
+    """Yield the text of `f` in whitespace-aligned blocks of about `block_size` characters."""
+    return align_blocks(iter(lambda: f.read(block_size), ""))
+
+
+def shard_ranges(path, shards):
+    """
+    Split the file at `path` into at most `shards` byte ranges `(start, end)` that
+    begin at the start of a line. A line is never divided, so a corpus without line
+    breaks gives a single range.
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, shards):
+            position = max(size * i // shards, bounds[-1])
+            f.seek(position)
+            while position < size:
+                data = f.read(1 << 16)
+                newline = data.find(b"\n")
+                if newline >= 0:
+                    position += newline + 1
+                    break
+                position += len(data)
+            bounds.append(min(position, size))
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def read_shard(path, start, end, block_size=STREAM_BLOCK_SIZE):
+    """Yield the decoded text of bytes `start` to `end` of `path` in chunks of about `block_size` bytes."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig" if start == 0 else "utf-8")()
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = f.read(min(block_size, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield decoder.decode(data)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _scan_shard(task):
+    input_file, start, end = task
+    partial = TiDictionary(input_file, None)
+    partial.token_counts = Counter()
+    for block in align_blocks(read_shard(input_file, start, end, STREAM_BLOCK_SIZE)):
+        partial.scan_block(block)
+    return partial.partial_result()
+
+
 class TiDictionary:
     """
        A dictionary class designed to process and generate dictionaries from a given input file.
@@ -46,6 +167,22 @@ class TiDictionary:
         self.clitic_dict = defaultdict(str)
         self.hyphenated_words_v1 =defaultdict(str)
         self.hyphenated_words_v2 =defaultdict(str) 
+
+        # Occurrences of every token, collected by create_dictionary() for create_improper_clitic().
+        self.token_counts = None
+
+    # Candidate tables a later occurrence overwrites, and tables that keep the first entry for a key.
+    LAST_WINS = ("hyphenated_words_v1", "hyphenated_words_v2", "clitic_zipped_dict", "clitic_bind_list")
+    FIRST_WINS = ("short_written_words", "short_written_words_v2")
+    # The file write_to_dict() writes each candidate table to.
+    TABLE_FILES = {
+        "clitic_zipped_dict": "clitic_zipped_dict.txt",
+        "clitic_bind_list": "clitic_bind_dic.txt",
+        "short_written_words": "words_with_fwd_slash.txt",
+        "short_written_words_v2": "words_with_dots.txt",
+        "hyphenated_words_v1": "hyphenated_words_v1.txt",
+        "hyphenated_words_v2": "hyphenated_words_v2.txt",
+    }
     
     def create_output_dir(self, output_dir: str):
         """
@@ -78,19 +215,9 @@ class TiDictionary:
         Returns:
             str: The cleaned word with only the specified punctuation retained (or all punctuation removed if None).
         """
-        # Define all punctuation marks
-        all_punctuation = string.punctuation
-
-        if keep_punctuation is None:
-            # If keep_punctuation is None, remove all punctuation
-            cleaned_word = ''.join(c for c in word if c not in all_punctuation)
-        else:
-            # Otherwise, retain the specified punctuation
-            cleaned_word = ''.join(c for c in word if c not in all_punctuation or c in keep_punctuation)
-
-        return cleaned_word
+        return word.translate(punctuation_table(keep_punctuation))
    
-    def create_dictionary(self, clitic_dictionary=None, words_with_fwd_slash=None, words_with_dots=None): 
+    def create_dictionary(self, clitic_dictionary=None, words_with_fwd_slash=None, words_with_dots=None, workers=1):
         self.create_output_dir(self.output_dir)
 
         if words_with_fwd_slash is not None:
@@ -103,44 +230,199 @@ class TiDictionary:
             self.clitic_dict = self.read_dict(self.output_dir + "/"+ clitic_dictionary)
   
         try: 
-            with open(self.input_file, encoding="utf-8-sig") as f:
-                data = f.read() 
-          
-            #tokens = re.findall(r'\w+', cleaned_data)
-            tokens = data.split()
- 
-            for word in tokens:
-
-                if '-' in word:  # Handle hyphenated words
-                    cleaned_word=self.clean_word(word, "-")
-                    parts = cleaned_word.split('-')
-                    if len(parts) == 2 and self._is_proper_token([parts[0], parts[1]]):
-                        self.hyphenated_words_v1[f"{parts[0]}{parts[1]}"] = cleaned_word
-                        self.hyphenated_words_v2[cleaned_word] = f"{parts[0]} {parts[1]}"
-                elif '/' in word:  # Handle words with forward slashes
-                    cleaned_word = self.clean_word(word, "/")
-                    if cleaned_word not in self.short_written_words:
-                        #proper_word = self.lookup_proper_word(word)
-                        self.short_written_words[cleaned_word] = cleaned_word
-                        #self.short_written_words[proper_word] = proper_word
-                elif "'" in word or "`" in word or "’" in word:  # Handle clitic words
-                    
-                    cleaned_word= self.clean_word(word, set("`’'"))  
-                    token_parts = re.split(r"[`’']", cleaned_word)
-                  
-                    if self._is_proper_token(token_parts):
-                        self.clitic_zipped_dict[token_parts[0]] = token_parts[1]
-                        bind_token = ''.join(token_parts[:2])
-                        self.clitic_bind_list[bind_token] = cleaned_word
-            
-            self.extract_shortened_words_By_dots(data)
-            #self.extract_shortened_words_By_fwd_slash(data)
+            self.token_counts = Counter()
+            self.scan_file(self.input_file, workers)
+
             self.write_to_dict()
 
             print('Process done. Ready for writing to a file.')
         except Exception as e:
             logging.error(f"Error creating dictionary: {str(e)}")
-  
+
+    def scan_block(self, text):
+        """
+        Collect hyphen, slash, clitic and dotted-abbreviation candidates and token counts
+        from `text` (whole tokens only), in a single pass over the block.
+        """
+        tokens = text.split()
+        self.token_counts.update(tokens)
+
+        # Every candidate contains punctuation, so plain words are skipped up front.
+        marked = [word for word in tokens if not word.isalnum()]
+        for word in marked:
+
+            if '-' in word:  # Handle hyphenated words
+                cleaned_word = word.translate(HYPHEN_TABLE)
+                parts = cleaned_word.split('-')
+                if len(parts) == 2 and self._is_proper_token([parts[0], parts[1]]):
+                    self.hyphenated_words_v1[f"{parts[0]}{parts[1]}"] = cleaned_word
+                    self.hyphenated_words_v2[cleaned_word] = f"{parts[0]} {parts[1]}"
+            elif '/' in word:  # Handle words with forward slashes
+                cleaned_word = word.translate(SLASH_TABLE)
+                if cleaned_word not in self.short_written_words:
+                    self.short_written_words[cleaned_word] = cleaned_word
+            elif "'" in word or "`" in word or "’" in word:  # Handle clitic words
+                cleaned_word = word.translate(CLITIC_TABLE)
+                token_parts = CLITIC_MARK_PATTERN.split(cleaned_word)
+
+                if self._is_proper_token(token_parts):
+                    self.clitic_zipped_dict[token_parts[0]] = token_parts[1]
+                    bind_token = ''.join(token_parts[:2])
+                    self.clitic_bind_list[bind_token] = cleaned_word
+
+        # Dotted abbreviations never span whitespace, so only tokens containing a dot are searched.
+        self.extract_shortened_words_By_dots(" ".join([word for word in marked if "." in word]))
+
+    def scan_file(self, path, workers=1):
+        """
+        Add the candidates and token counts of the corpus file at `path`.
+        Compressed corpora are decompressed as they are read; they cannot be split
+        into byte ranges, so they are always scanned by this process.
+        """
+        if workers > 1 and detect_compression(path) is None:
+            self.scan_sharded(workers, path=path)
+            return
+        with open_text(path, encoding="utf-8-sig") as f:
+            for block in iter_text_blocks(f, STREAM_BLOCK_SIZE):
+                self.scan_block(block)
+
+    def scan_sharded(self, workers, shards=None, path=None):
+        """
+        Scan the input file (or `path`) with a pool of `workers` processes, one line-aligned
+        byte range (shard) each, and merge the partial results in file order.
+
+        Merging in order makes the tables, their insertion order and the token counts
+        identical to a single-process scan, so every output file matches byte for byte.
+        """
+        path = path or self.input_file
+        ranges = shard_ranges(path, shards or workers)
+        if not ranges:
+            return
+        tasks = [(path, start, end) for start, end in ranges]
+        with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+            for partial in pool.imap(_scan_shard, tasks):
+                self.merge_partial(partial)
+
+    def partial_result(self):
+        """The candidate tables and token counts collected so far, as plain picklable objects."""
+        result = {name: dict(getattr(self, name)) for name in self.LAST_WINS + self.FIRST_WINS}
+        result["token_counts"] = self.token_counts
+        return result
+
+    def merge_partial(self, partial):
+        """Fold a partial_result() from the next part of the corpus into this dictionary."""
+        for name in self.LAST_WINS:
+            getattr(self, name).update(partial[name])
+        for name in self.FIRST_WINS:
+            table = getattr(self, name)
+            for key, value in partial[name].items():
+                if key not in table:
+                    table[key] = value
+        self.token_counts.update(partial["token_counts"])
+
+    def load_state(self):
+        """
+        Read STATE_FILE from the output directory: the accumulated counts of the tokens
+        that can be bound forms and the corpus files (by SHA-256) they cover. Returns
+        None if there is no state file.
+        """
+        path = os.path.join(self.output_dir, STATE_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"{path} was written by an incompatible version of tigrinya-dictgen.")
+        return state
+
+    def save_state(self, sources):
+        """
+        Write `sources` ({sha256: path}) and the token counts to STATE_FILE, replacing it
+        atomically. The improper clitic threshold only reads the counts of bound forms,
+        so only tokens that can be one are kept: any later text may write them with a
+        clitic mark, and the count must then include their earlier plain occurrences.
+        """
+        path = os.path.join(self.output_dir, STATE_FILE)
+        token_counts = {token: count for token, count in self.token_counts.items() if could_be_bound(token)}
+        state = {"version": STATE_VERSION, "sources": sources, "token_counts": token_counts}
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def update_dictionary(self, input_files, workers=1):
+        """
+        Fold the new corpus files `input_files` into the dictionaries in the output directory.
+
+        Only the new files are read. The candidate tables are reloaded from their files,
+        extended and written back; entries already in words_with_fwd_slash.txt,
+        words_with_dots.txt and clitic_dict.txt keep their (curated) expansions.
+        Token counts are accumulated in STATE_FILE, and bound forms whose accumulated
+        count newly exceeds IMPROPER_CLITIC_THRESHOLD are added to
+        cliticize_improper_words.txt without changing the entries already there.
+        Files whose content was folded in before are skipped.
+
+        Returns the list of files that were read.
+        """
+        self.create_output_dir(self.output_dir)
+        state = self.load_state()
+        if state is None:
+            existing = [f for f in self.TABLE_FILES.values() if os.path.exists(os.path.join(self.output_dir, f))]
+            if existing:
+                raise FileNotFoundError(
+                    f"No {STATE_FILE} in '{self.output_dir}'; regenerate the dictionaries once to record token counts."
+                )
+            state = {"sources": {}, "token_counts": {}}
+        sources = state["sources"]
+        self.token_counts = Counter(state["token_counts"])
+
+        for name, filename in self.TABLE_FILES.items():
+            path = os.path.join(self.output_dir, filename)
+            if os.path.exists(path):
+                setattr(self, name, self.read_dict(path))
+        clitic_path = os.path.join(self.output_dir, "clitic_dict.txt")
+        if os.path.exists(clitic_path):
+            self.clitic_dict = self.read_dict(clitic_path)
+        # Clitic parts seen before were offered for curation already; compaction may have dropped them since.
+        known_clitics = set(self.clitic_zipped_dict.values())
+
+        # Bound forms that already passed the threshold were written before (and may have been curated since).
+        listed = {key for key in self.clitic_bind_list if self.token_counts.get(key, 0) > IMPROPER_CLITIC_THRESHOLD}
+
+        read = []
+        for input_file in input_files:
+            digest = file_digest(input_file)
+            if digest in sources:
+                self.logger.info(f"Skipping '{input_file}': already included as '{sources[digest]}'.")
+                continue
+            self.scan_file(input_file, workers)
+            sources[digest] = input_file
+            read.append(input_file)
+
+        self.write_to_dict()
+        self.update_improper_clitic(listed)
+        # A full run only offers the clitic parts still in clitic_zipped_dict; drop the
+        # uncurated placeholders of parts the new text replaced.
+        for value in known_clitics - set(self.clitic_zipped_dict.values()):
+            if self.clitic_dict.get(value) == value:
+                del self.clitic_dict[value]
+        self.write_clitic_dict(self.clitic_zipped_dict, known_clitics)
+        self.save_state(sources)
+        return read
+
+    def update_improper_clitic(self, listed):
+        """
+        Add to cliticize_improper_words.txt the bound forms whose count exceeds
+        IMPROPER_CLITIC_THRESHOLD and that are not in `listed` (already written once).
+        """
+        path = os.path.join(self.output_dir, "cliticize_improper_words.txt")
+        improper = self.read_dict(path) if os.path.exists(path) else {}
+        counts = self.token_counts
+        for key in sorted(sorted(self.clitic_bind_list), key=lambda k: counts.get(k, 0), reverse=True):
+            if counts.get(key, 0) > IMPROPER_CLITIC_THRESHOLD and key not in listed and key not in improper:
+                improper[key] = self.clitic_bind_list[key]
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(json.dumps(improper, ensure_ascii=False, indent=1))
+
     def read_dict(self, filename):
        # Read the dictionary from the text file
         with open(filename, 'r', encoding="utf-8") as file:
@@ -160,11 +442,8 @@ class TiDictionary:
         Returns:
             dict: A dictionary with shortened words as keys and empty strings as values.
         """
-        # Updated regex to include patterns for Tigrinya words like ኪ., ምም., ቤ.ት, ሃ.ማ.መ.ተ.ኤ
-        pattern = r"(?<!\w)(?:[\w\u1200-\u137F]{1,2}+\.)+(?:[\w\u1200-\u137F]{1,7}+)?(?:\.)?(?!\w)" # Matches sequences of at least 2 dot-separated letters
-       
-        # Find all matches
-        shortened_words = re.findall(pattern, text) 
+        # Matches Tigrinya words like ኪ., ምም., ቤ.ት, ሃ.ማ.መ.ተ.ኤ (see SHORTENED_BY_DOTS_PATTERN)
+        shortened_words = SHORTENED_BY_DOTS_PATTERN.findall(text)
         # Create a dictionary with empty strings as values
         shortened_dict = {word: word for word in shortened_words if word not in self.short_written_words_v2}
         #print(shortened_dict)
@@ -215,7 +494,7 @@ class TiDictionary:
     
     def create_improper_clitic(self):
         """
-        Create a dictionary of improper clitics from 'clitic_bind_list' and update it based on the text in 'infile'.
+        Create a dictionary of improper clitics from 'clitic_bind_list' and update it based on the text in 'input_file'.
         
         The resulting dictionary is written to 'cliticize_improper_words.txt' in JSON format.
         """
@@ -232,33 +511,43 @@ class TiDictionary:
             clitic_counts[key] = 0
         
         try:
-            with open(self.input_file, encoding='utf-8-sig') as f:
-                data = f.read()
-                
-                # Split the data into individual words
-                for word in data.split():
-                    if word in clitic_counts:
-                        clitic_counts[word] += 1
-                
-                # Sort the clitic counts dictionary by value in descending order
-                sorted_by_value = dict(sorted(clitic_counts.items(), key=lambda kv: kv[1], reverse=True))
-                
-                # Filter out words with higher than 5 occurrences and update the improper words dictionary
-                for key, value in sorted_by_value.items():
-                    if value > 5:
-                        cliticize_improper_words[key] = self.clitic_concat_words[key]
-
-                # Write the improper words dictionary to a file
+            # Tokens were counted by create_dictionary(); otherwise stream the corpus once to count them.
+            token_counts = self.token_counts if self.token_counts is not None else self.count_tokens(clitic_counts)
+            for key in clitic_counts:
+                clitic_counts[key] = token_counts.get(key, 0)
+
+            # Sort the clitic counts dictionary by value in descending order
+            sorted_by_value = dict(sorted(clitic_counts.items(), key=lambda kv: kv[1], reverse=True))
+
+            # Filter out words with higher than 5 occurrences and update the improper words dictionary
+            for key, value in sorted_by_value.items():
+                if value > IMPROPER_CLITIC_THRESHOLD:
+                    cliticize_improper_words[key] = self.clitic_concat_words[key]
+
+            # Write the improper words dictionary to a file
             with open(self.output_dir + '/' + 'cliticize_improper_words.txt', 'w', encoding='utf-8') as file:
                 file.write(json.dumps(cliticize_improper_words, ensure_ascii=False, indent=1))
             
             print("Done!")
 
         except FileNotFoundError as e:
-            print(f"Error: File '{self.infile}' not found.")
+            print(f"Error: File '{self.input_file}' not found.")
             raise
 
-    def write_clitic_dict(self, input_dict): 
+    def count_tokens(self, words):
+        """Count how often each of `words` occurs as a whole token in the input file, streaming it."""
+        counts = Counter()
+        with open_text(self.input_file, encoding='utf-8-sig') as f:
+            for block in iter_text_blocks(f, STREAM_BLOCK_SIZE):
+                counts.update(word for word in block.split() if word in words)
+        return counts
+
+    def write_clitic_dict(self, input_dict, known=()):
+        """
+        Write clitic_dict.txt: the curated entries, plus a placeholder mapping each clitic
+        part of `input_dict` to itself, most frequent first. Parts in `known` get no
+        placeholder, so entries dropped by hand or by `tigrinya-dictgen compact` stay out.
+        """
 
         # Count the frequency of each value in the input dictionary
         value_counts = Counter(input_dict.values())
@@ -269,7 +558,7 @@ class TiDictionary:
         # Create a new dictionary with sorted values (empty string as value)
         sorted_dict = {value: value for value in sorted_values}
         
-        self.clitic_dict.update({v:v for v in sorted_dict if not self.clitic_dict.get(v)})
+        self.clitic_dict.update({v:v for v in sorted_dict if not self.clitic_dict.get(v) and v not in known})
  
         # Create a new dictionary where values from the input dict become keys, with empty strings as their values
         #output_dict = {value: "" for value in set(input_dict.values())}
@@ -0,0 +1,119 @@
+# incremental.py
+import hashlib
+import json
+import os
+import re
+from .cache import TokenCache
+from .jobs import dictionary_version
+
+DEFAULT_SEGMENT_CACHE_SIZE = 10000
+# Paragraphs longer than this are cached line by line, so editing one line of a long
+# paragraph re-normalizes only that line.
+SEGMENT_MAX_CHARS = 4096
+PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n")
+CACHE_FILE_VERSION = 1
+
+
+def split_segments(text):
+    """
+    Split `text` at line breaks into segments: its paragraphs (separated by blank
+    lines), with paragraphs over SEGMENT_MAX_CHARS split into their lines.
+    Whitespace-only segments are left out.
+    """
+    segments = []
+    for paragraph in PARAGRAPH_BREAK_PATTERN.split(text):
+        if len(paragraph) > SEGMENT_MAX_CHARS:
+            segments.extend(line for line in paragraph.split("\n") if line.strip())
+        elif paragraph.strip():
+            segments.append(paragraph)
+    return segments
+
+
+def segment_digest(segment):
+    return hashlib.blake2b(segment.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class IncrementalNormalizer:
+    """
+    Re-normalizes edited documents segment by segment for a TigrinyaNormalizer.
+
+    A document is split into paragraphs (see split_segments) and the normalized
+    output of each is kept in an LRU cache of at most `maxsize` segments, keyed by
+    the segment's content hash, the punctuation kept and the dictionary version. A
+    later call only normalizes the segments not in the cache and splices the results
+    together, so its cost follows the size of the edit rather than the document.
+
+    The result always equals `normalizer.normalize(text)`: segments are cut at line
+    breaks only, and only when the normalizer is line safe (see line_safe()); other
+    pipelines cache the whole document as one segment. Reloading dictionaries changes
+    the version, so stale results are never used. With `path`, the cache is read from
+    that file and save() writes it back.
+    """
+    def __init__(self, normalizer, maxsize=DEFAULT_SEGMENT_CACHE_SIZE, path=None):
+        self.normalizer = normalizer
+        self.cache = TokenCache(maxsize)
+        self.path = path
+        self.last = {"segments": 0, "normalized": 0}
+        self._version = (None, None)
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    @property
+    def version(self):
+        """The dictionary version of the normalizer's current plan, computed once per plan."""
+        plan, version = self._version
+        if plan is not self.normalizer.plan:
+            plan = self.normalizer.plan
+            version = dictionary_version(self.normalizer)
+            self._version = (plan, version)
+        return version
+
+    def normalize(self, text, punctuation_to_keep=None):
+        normalizer = self.normalizer
+        segments = split_segments(text) if normalizer.line_safe() else [text]
+        version = self.version
+        keys = [(version, punctuation_to_keep, segment_digest(segment)) for segment in segments]
+        results = [self.cache.get(key) for key in keys]
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            normalized = normalizer.normalize_batch([segments[i] for i in missing], punctuation_to_keep)
+            for i, result in zip(missing, normalized):
+                results[i] = self.cache[keys[i]] = result
+        self.last = {"segments": len(segments), "normalized": len(missing)}
+        return " ".join([result for result in results if result])
+
+    def stats(self):
+        """Cache size and counters, plus the segments and re-normalized segments of the last call."""
+        return dict(self.cache.stats(), last=dict(self.last))
+
+    def clear(self):
+        self.cache.clear()
+
+    def load(self, path):
+        """Add the cached segments stored in `path` for the current dictionary version."""
+        with open(path, encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise ValueError(f"{path} is not a valid segment cache: {e}")
+        if data.get("format") != CACHE_FILE_VERSION or data.get("version") != self.version:
+            return 0
+        for punctuation, digest, result in data["entries"]:
+            self.cache[(data["version"], punctuation, digest)] = result
+        return len(data["entries"])
+
+    def save(self, path=None):
+        """Write the cached segments of the current dictionary version to `path` (default: self.path)."""
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path to save the segment cache to.")
+        version = self.version
+        entries = [[punctuation, digest, result]
+                   for (entry_version, punctuation, digest), result in self.cache.items()
+                   if entry_version == version]
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"format": CACHE_FILE_VERSION, "version": version, "entries": entries}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+        return len(entries)
@@ -0,0 +1,178 @@
+# instrument.py
+import threading
+from time import perf_counter
+from collections.abc import Mapping
+from .plan import NormalizationPlan
+
+_MISSING = object()
+
+
+class CountingTable(Mapping):
+    """
+    Read-through view of a dictionary that counts lookup hits and misses into `counts`
+    ([hits, misses]), under `lock` so that threads sharing the view never lose a count.
+    """
+    __slots__ = ("table", "counts", "lock")
+
+    def __init__(self, table, counts, lock):
+        self.table = table
+        self.counts = counts
+        self.lock = lock
+
+    def _count(self, found):
+        with self.lock:
+            self.counts[0 if found else 1] += 1
+
+    def get(self, key, default=None):
+        value = self.table.get(key, _MISSING)
+        if value is _MISSING:
+            self._count(False)
+            return default
+        self._count(True)
+        return value
+
+    def __getitem__(self, key):
+        try:
+            value = self.table[key]
+        except KeyError:
+            self._count(False)
+            raise
+        self._count(True)
+        return value
+
+    def __contains__(self, key):
+        found = key in self.table
+        self._count(found)
+        return found
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self):
+        return len(self.table)
+
+
+class CountingDictionaries(Mapping):
+    """View of a DictionaryStore whose tables are wrapped in CountingTable, counting into `recorder`."""
+    def __init__(self, dictionaries, recorder):
+        self._dictionaries = dictionaries
+        self._recorder = recorder
+        self._tables = {}
+
+    def get(self, name, default=None):
+        table = self._tables.get(name)
+        if table is None:
+            source = self._dictionaries.get(name)
+            if source is None:
+                return default
+            recorder = self._recorder
+            with recorder._lock:
+                counts = recorder.lookups.setdefault(name, [0, 0])
+            table = self._tables[name] = CountingTable(source, counts, recorder._lock)
+        return table
+
+    def __getitem__(self, name):
+        table = self.get(name)
+        if table is None:
+            raise KeyError(name)
+        return table
+
+    def __iter__(self):
+        return iter(self._dictionaries)
+
+    def __len__(self):
+        return len(self._dictionaries)
+
+
+class StageRecorder:
+    """
+    Accumulates per-stage wall time and UTF-8 bytes in/out, and per-dictionary
+    lookup hits and misses, for an instrumented normalizer.
+
+    If `hook` is given it is called after every stage as
+    `hook(stage, seconds, bytes_in, bytes_out)`, e.g. to feed a metrics exporter.
+    """
+    def __init__(self, hook=None):
+        self.hook = hook
+        self.stages = {}
+        self.lookups = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name, func, text, *args):
+        start = perf_counter()
+        result = func(text, *args)
+        seconds = perf_counter() - start
+        bytes_in = len(text.encode("utf-8"))
+        bytes_out = len(result.encode("utf-8"))
+        with self._lock:
+            totals = self.stages.get(name)
+            if totals is None:
+                totals = self.stages[name] = {"calls": 0, "seconds": 0.0, "bytes_in": 0, "bytes_out": 0}
+            totals["calls"] += 1
+            totals["seconds"] += seconds
+            totals["bytes_in"] += bytes_in
+            totals["bytes_out"] += bytes_out
+        if self.hook is not None:
+            self.hook(name, seconds, bytes_in, bytes_out)
+        return result
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            # Counting tables hold these lists, so they are zeroed in place.
+            for counts in self.lookups.values():
+                counts[0] = counts[1] = 0
+
+    def snapshot(self):
+        with self._lock:
+            stages = {name: dict(totals) for name, totals in self.stages.items()}
+            counts = [(name, hits, misses) for name, (hits, misses) in self.lookups.items()]
+        lookups = {}
+        for name, hits, misses in counts:
+            total = hits + misses
+            lookups[name] = {"hits": hits, "misses": misses, "hit_rate": hits / total if total else None}
+        return {"stages": stages, "lookups": lookups}
+
+
+class InstrumentedPlan(NormalizationPlan):
+    """
+    A NormalizationPlan that runs each pipeline stage of `plan` through a StageRecorder.
+
+    It shares the compiled patterns and token cache of `plan` and reads the same
+    dictionaries through counting views, so output is identical. Words answered by
+    the token cache do not reach the dictionaries and are not counted as lookups.
+    """
+    def __init__(self, plan, recorder):
+        self.base = plan
+        self.recorder = recorder
+        self.dictionaries = CountingDictionaries(plan.dictionaries, recorder)
+        self.token_cache = plan.token_cache
+        self.pipeline = plan.pipeline
+        self._compiled = plan._compiled
+        self._lock = plan._lock
+        self.steps = [(stage.name, stage.bind(self)) for stage in self.pipeline.stages]
+
+    @property
+    def scanner(self):
+        return self.base.scanner
+
+    def normalize_passes(self, text, punctuation_to_keep=None):
+        stage = self.recorder.stage
+        for name, step in self.steps:
+            text = stage(name, step, text, punctuation_to_keep)
+        return text
+
+
+def format_stats(stats):
+    """Render a stats() snapshot as a per-stage and per-dictionary text table."""
+    total = sum(s["seconds"] for s in stats["stages"].values()) or 1.0
+    lines = [f"{'Stage':<34} {'Calls':>7} {'Time (s)':>10} {'Share':>7} {'Bytes in':>12} {'Bytes out':>12}"]
+    for name, s in stats["stages"].items():
+        lines.append(f"{name:<34} {s['calls']:>7} {s['seconds']:>10.4f} {s['seconds'] / total:>7.1%} "
+                     f"{s['bytes_in']:>12} {s['bytes_out']:>12}")
+    lines.append("")
+    lines.append(f"{'Dictionary':<34} {'Hits':>10} {'Misses':>10} {'Hit rate':>9}")
+    for name, d in sorted(stats["lookups"].items()):
+        rate = f"{d['hit_rate']:.1%}" if d["hit_rate"] is not None else "-"
+        lines.append(f"{name:<34} {d['hits']:>10} {d['misses']:>10} {rate:>9}")
+    return "\n".join(lines)
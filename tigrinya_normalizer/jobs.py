@@ -0,0 +1,232 @@
+# jobs.py
+import os
+import glob
+import json
+import time
+import hashlib
+from .utils import file_digest
+from .compression import DECOMPRESSION_ERRORS
+from .records import normalize_jsonl
+
+MANIFEST_FILE = "manifest.jsonl"
+GLOB_CHARACTERS = "*?["
+
+
+def is_glob(spec):
+    return any(c in spec for c in GLOB_CHARACTERS)
+
+
+def _glob_root(pattern):
+    """The directory part of `pattern` before its first wildcard."""
+    parts = []
+    for part in pattern.replace(os.sep, "/").split("/"):
+        if is_glob(part):
+            break
+        parts.append(part)
+    return "/".join(parts) or "."
+
+
+def _inside(path, directory):
+    return os.path.commonpath([path, directory]) == directory
+
+
+def expand_inputs(specs, exclude=None):
+    """
+    Turn input specifications (files, directories and glob patterns) into a sorted
+    list of `(path, name)` pairs, where `name` is the output path relative to the
+    output directory: the file name for a file, and the path below the directory or
+    the pattern's fixed prefix otherwise. Directories are walked recursively,
+    skipping hidden entries. Files inside `exclude` (e.g. the output directory) are left out.
+    """
+    exclude = os.path.abspath(exclude) if exclude else None
+    found = {}
+    for spec in specs:
+        if os.path.isdir(spec):
+            pairs = []
+            for root, dirs, files in os.walk(spec):
+                dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+                pairs.extend(os.path.join(root, f) for f in files if not f.startswith("."))
+            pairs = [(path, os.path.relpath(path, spec)) for path in pairs]
+        elif is_glob(spec):
+            root = _glob_root(spec)
+            pairs = [(path, os.path.relpath(path, root))
+                     for path in glob.glob(spec, recursive=True) if os.path.isfile(path)]
+        elif os.path.isfile(spec):
+            pairs = [(spec, os.path.basename(spec))]
+        else:
+            raise FileNotFoundError(f"Input '{spec}' not found.")
+        for path, name in pairs:
+            key = os.path.abspath(path)
+            if exclude is None or not _inside(key, exclude):
+                found.setdefault(key, (path, name))
+
+    inputs = sorted(found.values(), key=lambda pair: pair[1])
+    names = {}
+    for path, name in inputs:
+        if name in names:
+            raise ValueError(f"Inputs '{names[name]}' and '{path}' would both be written to '{name}'.")
+        names[name] = path
+    return inputs
+
+
+def dictionary_version(normalizer):
+    """
+    A digest of the normalizer's dictionary files and pipeline stages: it changes
+    whenever normalize() could give a different result for the same input.
+    """
+    digest = hashlib.sha256()
+    for name, filename in sorted(normalizer.dict_files.items()):
+        path = os.path.join(normalizer.dict_root_path, filename)
+        digest.update(f"{name}={filename}:{file_digest(path) if os.path.exists(path) else '-'}\n".encode("utf-8"))
+    digest.update(" ".join(normalizer.pipeline.names).encode("utf-8"))
+    if normalizer.pipeline.fold is not None:
+        digest.update(f" fold={normalizer.pipeline.fold}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class Manifest:
+    """
+    Record of the inputs a multi-file run has completed, as one JSON line per file:
+    input path, content hash, dictionary version, settings and output path.
+
+    Lines are appended (and flushed) as each file completes, so an interrupted run
+    keeps everything finished so far. A later line for the same input replaces an
+    earlier one, and a truncated last line is ignored.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.entries[entry["input"]] = entry
+
+    def is_current(self, input_path, sha256, version, settings, output_path):
+        """
+        True if `input_path` was normalized into `output_path` with the same content,
+        dictionaries and settings, and that output exists.
+        """
+        entry = self.entries.get(os.path.abspath(input_path))
+        return (entry is not None and entry["sha256"] == sha256 and entry["dictionaries"] == version
+                and entry["settings"] == settings and entry["output"] == os.path.abspath(output_path)
+                and os.path.exists(entry["output"]))
+
+    def record(self, input_path, sha256, version, settings, output_path, size, seconds):
+        entry = {
+            "input": os.path.abspath(input_path), "sha256": sha256, "dictionaries": version,
+            "settings": settings, "output": os.path.abspath(output_path), "bytes": size, "seconds": seconds,
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.entries[entry["input"]] = entry
+        return entry
+
+
+def _normalize_one(normalizer, input_path, output_path, punctuation_to_keep, stream, fields=None, script_filter=None):
+    """
+    Normalize one input (the `fields` of each record of a JSON-lines file, if given,
+    or its lines routed by `script_filter`) into `output_path` via a temporary file.
+    Returns (seconds, error, script filter counts or None).
+    """
+    start = time.perf_counter()
+    counts = script_filter.empty_counts() if script_filter is not None else None
+    # Hidden, so expand_inputs() never picks it up, and with the output's suffix, so it is compressed alike.
+    head, tail = os.path.split(output_path)
+    partial = os.path.join(head, ".partial-" + tail)
+    try:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        if fields:
+            normalize_jsonl(normalizer, input_path, partial, fields, punctuation_to_keep)
+        elif script_filter is not None:
+            script_filter.route_file(normalizer, input_path, partial, punctuation_to_keep, counts=counts)
+        else:
+            normalizer.normalize_file(input_path, partial, punctuation_to_keep, stream)
+        os.replace(partial, output_path)
+    except DECOMPRESSION_ERRORS + (UnicodeDecodeError, ValueError) as e:
+        if os.path.exists(partial):
+            os.remove(partial)
+        return time.perf_counter() - start, str(e), None
+    return time.perf_counter() - start, None, counts
+
+
+def normalize_files(normalizer, inputs, output_dir, punctuation_to_keep=None, stream=False, workers=1,
+                    manifest_path=None, progress=None, fields=None, script_filter=None):
+    """
+    Normalize every `(path, name)` pair from expand_inputs() into `output_dir/name`.
+
+    Completed files are recorded in the manifest (default: `output_dir/manifest.jsonl`),
+    and inputs whose content hash, dictionary version and settings match their
+    manifest entry are skipped, so a rerun resumes after an interruption. Each
+    output is written to a temporary file and renamed when complete. With
+    `workers` > 1 whole files are normalized by a process pool. With `fields`, the
+    inputs are JSON-lines files and only those fields are normalized. With a
+    `script_filter` (script.ScriptFilter), the lines of text inputs are routed by
+    script and its counts cover every file. A file that fails is reported and the
+    run continues.
+
+    `progress(event)` is called once per input with a dict holding `status`
+    ("done", "skipped" or "failed"), `input`, `output`, `index` (inputs finished so
+    far), `total`, `bytes`, `seconds` and `error`. Returns the totals: done, skipped,
+    failed, bytes and seconds.
+    """
+    from .parallel import _pool, _normalize_file_task
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = Manifest(manifest_path or os.path.join(output_dir, MANIFEST_FILE))
+    version = dictionary_version(normalizer)
+    settings = {"punctuation": punctuation_to_keep}
+    if fields:
+        settings["fields"] = list(fields)
+    if script_filter is not None:
+        settings["script"] = {"threshold": script_filter.threshold, "action": script_filter.action}
+    totals = {"done": 0, "skipped": 0, "failed": 0, "bytes": 0, "seconds": 0.0}
+    start = time.perf_counter()
+
+    def finish(input_path, output_path, status, seconds=0.0, error=None, sha256=None, counts=None):
+        size = 0
+        if counts is not None:
+            script_filter.merge(counts)
+        if status == "done":
+            size = os.path.getsize(input_path)
+            manifest.record(input_path, sha256, version, settings, output_path, size, seconds)
+            totals["bytes"] += size
+        totals[status] += 1
+        if progress is not None:
+            progress({"status": status, "input": input_path, "output": output_path,
+                      "index": totals["done"] + totals["skipped"] + totals["failed"], "total": len(inputs),
+                      "bytes": size, "seconds": seconds, "error": error})
+
+    pending = []
+    for input_path, name in inputs:
+        output_path = os.path.join(output_dir, name)
+        try:
+            sha256 = file_digest(input_path)
+        except OSError as e:
+            finish(input_path, output_path, "failed", error=str(e))
+            continue
+        if manifest.is_current(input_path, sha256, version, settings, output_path):
+            finish(input_path, output_path, "skipped")
+        else:
+            pending.append((input_path, output_path, sha256))
+
+    if workers > 1 and len(pending) > 1:
+        digests = {input_path: sha256 for input_path, _, sha256 in pending}
+        tasks = [(input_path, output_path, punctuation_to_keep, stream, fields, script_filter)
+                 for input_path, output_path, _ in pending]
+        with _pool(normalizer, min(workers, len(tasks))) as pool:
+            for input_path, output_path, seconds, error, counts in pool.imap_unordered(_normalize_file_task, tasks):
+                status = "failed" if error else "done"
+                finish(input_path, output_path, status, seconds, error, digests[input_path], counts)
+    else:
+        for input_path, output_path, sha256 in pending:
+            seconds, error, counts = _normalize_one(
+                normalizer, input_path, output_path, punctuation_to_keep, stream, fields, script_filter
+            )
+            finish(input_path, output_path, "failed" if error else "done", seconds, error, sha256, counts)
+
+    totals["seconds"] = time.perf_counter() - start
+    return totals
@@ -1,10 +1,38 @@
 # normalizer.py
 import re
 import os
-from .utils import load_json, remove_extra_spaces
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from .utils import remove_extra_spaces
+from .store import DictionaryStore
+from .plan import NormalizationPlan
+from .instrument import StageRecorder, InstrumentedPlan
+from .pipeline import Pipeline
+from .compression import open_text
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 
+SENTENCE_ENDINGS = "።፧?!"
+STREAM_CHUNK_SIZE = 1 << 20
+# Texts per task in normalize_many(); tokens repeated within a task are processed once.
+THREAD_BATCH_SIZE = 256
+
+DEFAULT_DICT_FILES = {
+    'clitic_dict': 'clitic_dict.txt',
+    'clitic_bind_dic': 'clitic_bind_dic.txt',
+    'cliticize_improper_words': 'cliticize_improper_words.txt',
+    'words_with_fwd_slash': 'words_with_fwd_slash.txt',
+    'words_with_dots': 'words_with_dots.txt',
+    'hyphenated_words_v1': 'hyphenated_words_v1.txt',
+    'hyphenated_words_v2': 'hyphenated_words_v2.txt',
+    'improper_abbreviations': 'improper_abbreviations.txt',
+    'filtered_space_abbreviations': 'filtered_space_abbreviations.json',
+    'filtered_single_abbreviations': 'filtered_single_abbreviations.json'
+}
+
+# Dictionaries read by the default pipeline; the rest are only loaded if another method asks for them.
+NORMALIZE_DICTIONARIES = Pipeline().dictionaries
+
 def resolve_path(path, default_relative_path):
     if path is None:
         path = default_relative_path
@@ -12,135 +40,292 @@ def resolve_path(path, default_relative_path):
         path = os.path.join(base_dir, path)
     return path
 
+ENGINES = ("regex", "scanner")
+
 class TigrinyaNormalizer:
-    def __init__(self, files=None, dict_path=None, dataset_file=None, output_dir=None):
-        
+    """
+    Normalizes Tigrinya text with the dictionaries in `dict_path`.
+
+    One instance can be shared by any number of threads. Its compiled state (the
+    plan: dictionaries, patterns and scanner) is read-only once built, and lazy
+    parts are built under a lock; reload_dictionaries() swaps in a whole new plan.
+    The token cache and stats recorder are locked. `dataset` and `output_dir` only
+    configure normalize_and_save() and are not read by normalize().
+    """
+    def __init__(self, files=None, dict_path=None, dataset_file=None, output_dir=None, engine="regex",
+                 token_cache_size=0, stages=None, disable_stages=(), pipeline_config=None, fold=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Expected one of: {', '.join(ENGINES)}")
+        if token_cache_size < 0:
+            raise ValueError("token_cache_size must be zero (disabled) or positive.")
+        if pipeline_config is not None and (stages is not None or disable_stages or fold is not None):
+            raise ValueError("Pass either pipeline_config or stages/disable_stages/fold, not both.")
+        self.engine = engine
+        self.token_cache_size = token_cache_size
+        self.pipeline = (Pipeline.from_config(pipeline_config) if pipeline_config
+                         else Pipeline(stages, disable_stages, fold))
+        # The scanner fuses the default stages into one pass; other pipelines run stage by stage.
+        self.fused = engine == "scanner" and self.pipeline.scannable
+        self.recorder = None
+        self._instrumented = None
+
         self.dict_root_path = resolve_path(dict_path, 'dictionaries')
         self.dataset = resolve_path(dataset_file, 'data/cleaned_text.txt')
         self.output_dir = resolve_path(output_dir, 'data')
 
-        self.dict_files = files or {
-            'clitic_dict': 'clitic_dict.txt',
-            'clitic_bind_dic': 'clitic_bind_dic.txt',
-            'cliticize_improper_words': 'cliticize_improper_words.txt',
-            'words_with_fwd_slash': 'words_with_fwd_slash.txt',
-            'words_with_dots': 'words_with_dots.txt',
-            'hyphenated_words_v1': 'hyphenated_words_v1.txt',
-            'hyphenated_words_v2': 'hyphenated_words_v2.txt',
-            'improper_abbreviations': 'improper_abbreviations.txt',
-            'filtered_space_abbreviations': 'filtered_space_abbreviations.json',
-            'filtered_single_abbreviations': 'filtered_single_abbreviations.json'
-        }
-
-        self.dictionaries = {}
+        self.dict_files = files or dict(DEFAULT_DICT_FILES)
+
         self.read_dictionaries()
 
-        self.patterns = {
+        self.patterns = MappingProxyType({
             "punctuation": re.compile(r"[^\w\s\u1367\u1362?!]", re.UNICODE),
             "multi_spaces": re.compile(r"\s+", re.UNICODE),
             "shortened_words": re.compile(r"(?<!\w)([\w\u1200-\u137F]{1,3}\.)+", re.UNICODE)
-        }
+        })
+
+    def read_dictionaries(self, eager=False):
+        # Each dictionary is read on first access unless `eager` loads them all up front.
+        dictionaries = DictionaryStore(self.dict_root_path, self.dict_files, self.pipeline.fold)
+        if eager:
+            dictionaries.load()
+        self.plan = NormalizationPlan(dictionaries, self.token_cache_size, self.pipeline)
+
+    def reload_dictionaries(self):
+        """
+        Pick up dictionary files edited on disk since they were loaded.
+
+        The new dictionaries and patterns are built aside and swapped in with one
+        assignment, so normalize() calls already running finish on the old ones.
+        Dictionaries assigned in memory are carried over unchanged, and deleted ones stay deleted.
+        Returns the names of the dictionaries that changed.
+        """
+        current = self.plan
+        changed = current.dictionaries.changed()
+        if not changed:
+            return []
+        dictionaries = DictionaryStore(self.dict_root_path, current.dictionaries.dict_files, self.pipeline.fold)
+        dictionaries.load(current.dictionaries.loaded())
+        for name in current.dictionaries.assigned():
+            dictionaries[name] = current.dictionaries[name]
+        plan = NormalizationPlan(dictionaries, self.token_cache_size, self.pipeline)
+        if self.fused:
+            plan.scanner
+        self.plan = plan
+        return changed
+
+    @property
+    def dictionaries(self):
+        return self.plan.dictionaries
+
+    def token_cache_stats(self):
+        """
+        Return size, maxsize, hits, misses and evictions of the token cache, or None if it
+        is disabled. Counters start again from zero whenever the dictionaries are reloaded.
+        """
+        cache = self.plan.token_cache
+        return cache.stats() if cache is not None else None
+
+    @property
+    def dictionary_sources(self):
+        return self.dictionaries.sources
+
+    def load_dictionaries(self, names=None):
+        """
+        Load the dictionaries normalize() needs now (those of the pipeline's stages, unless
+        `names` is given), e.g. before forking worker processes.
+        """
+        self.dictionaries.load(self.pipeline.dictionaries if names is None else names)
+
+    def dictionary_report(self):
+        """Return which dictionaries are loaded, their source, entry count and approximate size in bytes."""
+        return self.dictionaries.report()
+
+    def enable_stats(self, hook=None):
+        """
+        Start recording per-stage wall time, bytes in and out, and dictionary lookup
+        hits and misses. `hook(stage, seconds, bytes_in, bytes_out)` is called after
+        every stage if given.
+
+        While stats are enabled normalize() runs the staged regex passes for either
+        engine, so each stage can be timed on its own; the output does not change.
+        """
+        self.recorder = StageRecorder(hook)
+
+    def disable_stats(self):
+        self.recorder = None
+        self._instrumented = None
 
-    def read_dictionaries(self):
-        for key, filename in self.dict_files.items():
-            file_path = os.path.join(self.dict_root_path, filename)
-            self.dictionaries[key] = load_json(file_path)
+    def stats(self):
+        """Snapshot of the recorded stage timings and lookup counts, or None if stats are disabled."""
+        return self.recorder.snapshot() if self.recorder is not None else None
+
+    def reset_stats(self):
+        if self.recorder is not None:
+            self.recorder.reset()
+
+    def _instrumented_plan(self, plan, recorder):
+        instrumented = self._instrumented
+        if instrumented is None or instrumented.base is not plan or instrumented.recorder is not recorder:
+            instrumented = self._instrumented = InstrumentedPlan(plan, recorder)
+        return instrumented
 
     def normalize(self, text, punctuation_to_keep=None):
-        text = self.replace_clitic_dictionary(text)
-        text = self.replace_shortened_words_with_dots(text)
-        text = self.replace_hyphenated_v1(text)
-        text = self.normalize_clitic_variation(text)
-        text = self.replace_improper_abbreviation(text)
+        plan = self.plan
+        recorder = self.recorder
+        if recorder is not None:
+            return self._instrumented_plan(plan, recorder).normalize_passes(text, punctuation_to_keep)
+        if self.fused:
+            return plan.scanner.normalize(text, punctuation_to_keep)
+        return plan.normalize_passes(text, punctuation_to_keep)
+
+    def line_safe(self):
+        """True if normalizing line-aligned pieces separately gives the same result as the whole text."""
+        return self.pipeline.scannable and self.plan.scanner.line_safe
+
+    def normalize_iter(self, texts, punctuation_to_keep=None):
+        """
+        Lazily normalize every text in `texts`; yields the same strings as mapping normalize().
+
+        The dictionaries, patterns and per-token results are shared across the whole
+        iterable, so repeated tokens in a stream of short texts are only processed once.
+        """
+        if self.recorder is not None or not self.pipeline.scannable:
+            return (self.normalize(text, punctuation_to_keep) for text in texts)
+        return self.plan.scanner.normalize_many(texts, punctuation_to_keep)
+
+    def normalize_batch(self, texts, punctuation_to_keep=None):
+        """Normalize a list of texts at once; equivalent to `[normalize(t) for t in texts]`."""
+        return list(self.normalize_iter(texts, punctuation_to_keep))
+
+    def prepare(self):
+        """Load the dictionaries and compile the patterns normalize() needs, so no call has to build them."""
+        self.plan.prepare()
+        return self
+
+    def normalize_many(self, texts, punctuation_to_keep=None, threads=1, batch_size=THREAD_BATCH_SIZE):
+        """
+        Normalize `texts` with a pool of `threads` threads sharing this normalizer and
+        return the results in order, equal to normalize_batch(texts).
+
+        The plan is prepared first, so the threads only read shared state. Each thread
+        normalizes `batch_size` texts at a time with normalize_batch(). On free-threaded
+        CPython builds the threads run in parallel; with the GIL they take turns, so
+        use worker processes (parallel.py) to scale there.
+        """
+        texts = list(texts)
+        if threads <= 1 or len(texts) <= batch_size:
+            return self.normalize_batch(texts, punctuation_to_keep)
+        self.prepare()
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = executor.map(lambda batch: self.normalize_batch(batch, punctuation_to_keep), batches)
+            return [text for batch in results for text in batch]
 
-        words = text.split()
-        normalized_words = [self._handle_word(word) for word in words]
+    def normalize_stream(self, chunks, punctuation_to_keep=None):
+        """
+        Normalize an iterable of text chunks (e.g. lines or fixed-size reads) and yield
+        sentences as soon as they are complete.
 
-        if punctuation_to_keep:
-            pattern = re.compile(rf"[^\w\s{re.escape(punctuation_to_keep)}]", re.UNICODE)
+        Chunks may split tokens and sentences anywhere; joining the yielded sentences
+        with spaces gives `normalize("".join(chunks))`. Memory stays bounded by the
+        longest token and sentence rather than the size of the input.
+
+        Streaming needs the default stages (with or without folding), which the
+        single-pass scanner runs; other pipelines raise ValueError, as their stages
+        may depend on the whole text. If the dictionaries hold keys with whitespace at
+        an edge, which the scanner cannot handle, the chunks are joined instead.
+        """
+        if not self.pipeline.scannable:
+            raise ValueError("Streaming needs the default stages (optionally with fold); "
+                             "normalize this pipeline without stream=True.")
+        plan = self.plan
+        if plan.scanner.supported:
+            words = plan.scanner.iter_words(chunks, punctuation_to_keep)
         else:
-            pattern = self.patterns["punctuation"]
+            words = plan.normalize_passes("".join(chunks), punctuation_to_keep).split()
+
+        sentence = []
+        for word in words:
+            sentence.append(word)
+            if word[-1] in SENTENCE_ENDINGS:
+                yield " ".join(sentence)
+                sentence = []
+        if sentence:
+            yield " ".join(sentence)
 
-        cleaned_text = pattern.sub(" ", " ".join(normalized_words)).strip()
-        return remove_extra_spaces(cleaned_text)
+    def normalize_passes(self, text, punctuation_to_keep=None):
+        return self.plan.normalize_passes(text, punctuation_to_keep)
 
     def _handle_word(self, word):
-        if "-" in word:
-            return self._handle_hyphen(word)
-        if "/" in word:
-            return self._handle_forward_slash(word)
-        if any(c in word for c in ["'", "`", "’"]):
-            return self._handle_clitic(word)
-        return word
+        return self.plan._handle_word(word)
 
     def _handle_hyphen(self, word):
-        return self.dictionaries.get("hyphenated_words_v2", {}).get(word, word)
+        return self.plan._handle_hyphen(word)
 
     def _handle_forward_slash(self, word):
-        return self.dictionaries.get("words_with_fwd_slash", {}).get(word, word)
+        return self.plan._handle_forward_slash(word)
 
     def _handle_clitic(self, word):
-        token = re.split(r"[`’']", word)
-        bind_token = "".join(token[:2])
-
-        if bind_token in self.dictionaries.get("cliticize_improper_words", {}):
-            return bind_token
-        if len(token) > 1 and token[1] in self.dictionaries.get("clitic_dict", {}):
-            token[1] = self.dictionaries["clitic_dict"][token[1]]
-
-        return " ".join(token).strip()
+        return self.plan._handle_clitic(word)
 
     def replace_abbreviations(self, text):
-        abbr_dict = self.dictionaries.get("improper_abbreviations", {})
-        sorted_replacements = sorted(abbr_dict.items(), key=lambda x: len(x[0]), reverse=True)
-        pattern = re.compile(r'(' + r'|'.join(re.escape(word) for word, _ in sorted_replacements) + r')')
-        return pattern.sub(lambda m: abbr_dict[m.group()], text)
+        return self.plan.replace_abbreviations(text)
 
     def replace_shortened_words_with_dots(self, text):
-        short_dict = self.dictionaries.get("words_with_dots", {})
-        pattern = re.compile(r'(?<!\S)(?:[\w\u1200-\u137F]+(?:\.[\w\u1200-\u137F]+)*\.?)(?!\S)', re.UNICODE)
-        return pattern.sub(lambda m: short_dict.get(m.group(0), m.group(0)), text)
+        return self.plan.replace_shortened_words_with_dots(text)
 
     def replace_hyphenated_v1(self, text):
-        words = re.split(r"(\W+)", text, flags=re.UNICODE)
-        hyphen_dict = self.dictionaries.get("hyphenated_words_v1", {})
-        return "".join([hyphen_dict.get(word, word) for word in words])
+        return self.plan.replace_hyphenated_v1(text)
 
     def replace_clitic_dictionary(self, text):
-        clitic_dict = self.dictionaries.get("clitic_dict", {})
-        pattern = re.compile(r'(^|\s)([\w\u1200-\u137F]+)(?=\s|$)', re.UNICODE)
-        return pattern.sub(lambda m: m.group(1) + clitic_dict.get(m.group(2), m.group(2)), text)
+        return self.plan.replace_clitic_dictionary(text)
 
     def normalize_clitic_variation(self, text):
-        replacements = {
-            "ኢየ": "እየ", "እዩ": "ኢዩ", "እያ": "ኢያ", "እየን": "ኢየን",
-            "እዮም": "ኢዮም", "ዓመት ምሕረት": "ዓመት ምህረት", "እውን": "ውን"
-        }
-        pattern = re.compile(r'(' + r'|'.join(map(re.escape, replacements.keys())) + r')')
-        return pattern.sub(lambda m: replacements[m.group()], text)
+        return self.plan.normalize_clitic_variation(text)
 
     def replace_improper_abbreviation(self, text):
-        space_dict = self.dictionaries.get("filtered_space_abbreviations", {})
-        single_dict = self.dictionaries.get("filtered_single_abbreviations", {})
+        return self.plan.replace_improper_abbreviation(text)
 
-        space_pat = re.compile(r'\b(?:' + '|'.join(map(re.escape, space_dict.keys())) + r')\b')
-        single_pat = re.compile(r'\b(?:' + '|'.join(map(re.escape, single_dict.keys())) + r')\b')
-
-        text = space_pat.sub(lambda m: space_dict[m.group()], text)
-        return single_pat.sub(lambda m: single_dict[m.group()], text)
-
-    def normalize_and_save(self, output_file, punctuation_to_keep=None):
+    def normalize_and_save(self, output_file, punctuation_to_keep=None, stream=False, chunk_size=STREAM_CHUNK_SIZE,
+                           dedup=None):
         if not self.dataset:
             raise FileNotFoundError("Dataset file not specified.")
 
         os.makedirs(self.output_dir, exist_ok=True)
         output_path = os.path.join(self.output_dir, output_file)
+        self.normalize_file(self.dataset, output_path, punctuation_to_keep, stream, chunk_size, dedup)
+
+    def split_sentences(self, normalized_text):
+        """Split normalized text into its sentences, as written one per line by normalize_file()."""
+        return re.split(r'(?<=[።፧?!]) +', remove_extra_spaces(normalized_text.strip()))
+
+    def normalize_file(self, input_path, output_path, punctuation_to_keep=None, stream=False,
+                       chunk_size=STREAM_CHUNK_SIZE, dedup=None):
+        """
+        Normalize the file at `input_path` into `output_path`, one sentence per line.
+        Compressed input is detected and decompressed, and output named *.gz, *.bz2 or
+        *.xz is compressed (see compression.open_text). With `dedup` (a
+        dedup.Deduplicator), repeated sentences are left out.
+        """
+        if stream:
+            with open_text(input_path) as src, open_text(output_path, 'w') as dst:
+                written = False
+                sentences = self.normalize_stream(iter(lambda: src.read(chunk_size), ""), punctuation_to_keep)
+                if dedup is not None:
+                    sentences = dedup.filter(sentences)
+                for sentence in sentences:
+                    dst.write(sentence + "\n")
+                    written = True
+                if not written:
+                    dst.write("\n")
+            return
 
-        with open(self.dataset, 'r', encoding='utf-8') as f:
+        with open_text(input_path) as f:
             raw_text = f.read()
 
-        normalized_text = self.normalize(raw_text, punctuation_to_keep)
-        sentences = re.split(r'(?<=[።፧?!]) +', remove_extra_spaces(normalized_text.strip()))
+        sentences = self.split_sentences(self.normalize(raw_text, punctuation_to_keep))
+        if dedup is not None:
+            sentences = list(dedup.filter(sentences))
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open_text(output_path, 'w') as f:
             f.write("\n".join(sentences) + "\n")
@@ -0,0 +1,204 @@
+# parallel.py
+import os
+import re
+import time
+import pickle
+import logging
+import multiprocessing
+from collections import deque
+from .normalizer import SENTENCE_ENDINGS
+from .pipeline import BUILTIN_STAGES
+from .compression import open_text
+
+PARALLEL_CHUNK_SIZE = 4 << 20
+SENTENCE_SPLIT_PATTERN = re.compile(rf'(?<=[{SENTENCE_ENDINGS}]) ')
+
+# Set in the parent before forking so workers inherit the loaded dictionaries.
+_worker_normalizer = None
+
+
+def _init_worker(normalizer_args):
+    global _worker_normalizer
+    if normalizer_args is not None:
+        from .normalizer import TigrinyaNormalizer
+        _worker_normalizer = TigrinyaNormalizer(**normalizer_args)
+
+
+def _normalize_chunk(task):
+    chunk, punctuation_to_keep = task
+    start = time.perf_counter()
+    normalized = _worker_normalizer.normalize(chunk, punctuation_to_keep)
+    return os.getpid(), len(chunk.encode("utf-8")), time.perf_counter() - start, normalized
+
+
+def _normalize_texts(task):
+    texts, punctuation_to_keep = task
+    return _worker_normalizer.normalize_batch(texts, punctuation_to_keep)
+
+
+def _normalize_file_task(task):
+    from .jobs import _normalize_one
+    input_path, output_path, punctuation_to_keep, stream, fields, script_filter = task
+    seconds, error, counts = _normalize_one(
+        _worker_normalizer, input_path, output_path, punctuation_to_keep, stream, fields, script_filter
+    )
+    return input_path, output_path, seconds, error, counts
+
+
+def _rebuild_args(normalizer):
+    """
+    The TigrinyaNormalizer arguments that rebuild `normalizer` in a spawned worker.
+    Raises ValueError if it cannot be rebuilt: its stages do not pickle (lambdas,
+    local functions) or dictionaries were assigned in memory instead of read from files.
+    """
+    assigned = [row["name"] for row in normalizer.dictionary_report() if row["source"] == "assigned"]
+    if assigned:
+        raise ValueError(f"Worker processes cannot rebuild the in-memory dictionaries {', '.join(assigned)}; "
+                         "write them to files or use one worker.")
+    pipeline = normalizer.pipeline
+    stages = pipeline.stages[1:] if pipeline.fold is not None else pipeline.stages
+    normalizer_args = {
+        "files": normalizer.dict_files,
+        "dict_path": normalizer.dict_root_path,
+        "engine": normalizer.engine,
+        "token_cache_size": normalizer.token_cache_size,
+        # Built-in stages by name, so the rebuilt pipeline is recognized as scannable.
+        "stages": [stage.name if stage is BUILTIN_STAGES.get(stage.name) else stage for stage in stages],
+        "fold": pipeline.fold,
+    }
+    try:
+        pickle.dumps(normalizer_args)
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        raise ValueError(f"Worker processes cannot rebuild the pipeline {list(pipeline.names)}: {e}; "
+                         "define custom stages at module level or use one worker.")
+    return normalizer_args
+
+
+def _pool(normalizer, workers):
+    """
+    Create a process pool whose workers share `normalizer`.
+    With fork the workers inherit it copy-on-write; otherwise each worker builds its own
+    from the arguments in _rebuild_args(), which raises ValueError if that is not possible.
+    """
+    global _worker_normalizer
+    normalizer.load_dictionaries()
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        context = None
+    if context is not None:
+        _worker_normalizer = normalizer
+        return context.Pool(workers, _init_worker, (None,))
+    try:
+        return multiprocessing.get_context("spawn").Pool(workers, _init_worker, (_rebuild_args(normalizer),))
+    finally:
+        # Spawned workers build their own; do not keep a normalizer a fork pool left behind.
+        _worker_normalizer = None
+
+
+def iter_line_chunks(f, chunk_size=PARALLEL_CHUNK_SIZE):
+    """Yield the contents of `f` in chunks of roughly `chunk_size` characters that end on line breaks."""
+    while True:
+        lines = f.readlines(chunk_size)
+        if not lines:
+            return
+        yield "".join(lines)
+
+
+def _normalize_file_serial(normalizer, input_path, output_path, punctuation_to_keep, chunk_size, dedup):
+    start = time.perf_counter()
+    size = 0
+    with open_text(input_path) as src, open_text(output_path, 'w') as dst:
+        def chunks():
+            # Decoded bytes, as the parallel path counts them, also for compressed input.
+            nonlocal size
+            for chunk in iter(lambda: src.read(chunk_size), ""):
+                size += len(chunk.encode("utf-8"))
+                yield chunk
+
+        written = False
+        if normalizer.pipeline.scannable:
+            sentences = normalizer.normalize_stream(chunks(), punctuation_to_keep)
+        else:
+            sentences = normalizer.split_sentences(normalizer.normalize("".join(chunks()), punctuation_to_keep))
+        if dedup is not None:
+            sentences = dedup.filter(sentences)
+        for sentence in sentences:
+            dst.write(sentence + "\n")
+            written = True
+        if not written:
+            dst.write("\n")
+    seconds = time.perf_counter() - start
+    return [{"pid": os.getpid(), "chunks": 1, "bytes": size, "seconds": seconds,
+             "mb_per_s": size / 1e6 / seconds if seconds else 0.0}]
+
+
+def normalize_file_parallel(normalizer, input_path, output_path, workers,
+                            punctuation_to_keep=None, chunk_size=PARALLEL_CHUNK_SIZE, dedup=None):
+    """
+    Normalize `input_path` into `output_path` with a pool of `workers` processes.
+
+    The input is cut into line-aligned chunks that are normalized in parallel and written
+    back in their original order, one sentence per line, exactly as normalize_and_save()
+    would. At most two chunks per worker are in flight, so memory stays bounded.
+    With `dedup` (a dedup.Deduplicator), repeated sentences are dropped in this
+    process as the chunks are written.
+
+    Returns a list of per-worker reports (pid, chunks, bytes, seconds, mb_per_s), with
+    bytes counted after decompression. Raises ValueError for `workers` > 1 with a
+    pipeline other than the default stages (optionally with folding), whose stages may
+    depend on the whole text. If the dictionaries could join words across a line
+    break, a warning is logged and the file is normalized in this process instead.
+    """
+    if workers > 1 and not normalizer.pipeline.scannable:
+        raise ValueError("Parallel normalization needs the default stages (optionally with fold); "
+                         "normalize this pipeline with one worker.")
+    if workers > 1 and not normalizer.line_safe():
+        logging.warning(f"Dictionary keys can join words across line breaks; normalizing {input_path} "
+                        f"in one process instead of {workers}.")
+    if workers <= 1 or not normalizer.line_safe():
+        return _normalize_file_serial(normalizer, input_path, output_path, punctuation_to_keep, chunk_size, dedup)
+
+    reports = {}
+    carry = None
+    written = False
+    with open_text(input_path) as src, open_text(output_path, 'w') as dst, \
+            _pool(normalizer, workers) as pool:
+        in_flight = deque()
+        chunks = iter_line_chunks(src, chunk_size)
+        while True:
+            while len(in_flight) < 2 * workers:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                in_flight.append(pool.apply_async(_normalize_chunk, ((chunk, punctuation_to_keep),)))
+            if not in_flight:
+                break
+
+            pid, size, seconds, normalized = in_flight.popleft().get()
+            report = reports.setdefault(pid, {"pid": pid, "chunks": 0, "bytes": 0, "seconds": 0.0})
+            report["chunks"] += 1
+            report["bytes"] += size
+            report["seconds"] += seconds
+
+            if not normalized:
+                continue
+            sentences = SENTENCE_SPLIT_PATTERN.split(normalized)
+            if carry is not None:
+                sentences[0] = carry + " " + sentences[0]
+            carry = None if normalized[-1] in SENTENCE_ENDINGS else sentences.pop()
+            if dedup is not None:
+                sentences = dedup.filter(sentences)
+            for sentence in sentences:
+                dst.write(sentence + "\n")
+                written = True
+
+        if carry is not None and (dedup is None or dedup.check(carry) is None):
+            dst.write(carry + "\n")
+            written = True
+        if not written:
+            dst.write("\n")
+
+    for report in reports.values():
+        report["mb_per_s"] = report["bytes"] / 1e6 / report["seconds"] if report["seconds"] else 0.0
+    return sorted(reports.values(), key=lambda r: r["pid"])
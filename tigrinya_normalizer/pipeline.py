@@ -0,0 +1,190 @@
+# pipeline.py
+import json
+import importlib
+from .folding import folding_table
+
+
+class Stage:
+    """
+    One step of the normalization pipeline.
+
+    `name` identifies the stage (in configs and stats) and `dictionaries` lists the
+    dictionaries it reads; they are only loaded if the stage is part of a pipeline.
+    `compiled` names the NormalizationPlan attributes the stage uses, which
+    NormalizationPlan.prepare() builds up front.
+    Subclasses implement bind(plan), returning a function
+    `(text, punctuation_to_keep) -> text` that may use `plan.dictionaries`.
+    """
+    name = None
+    dictionaries = ()
+    compiled = ()
+
+    def bind(self, plan):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class PlanStage(Stage):
+    """A built-in stage: calls the NormalizationPlan method of the same name."""
+    def __init__(self, name, dictionaries=(), takes_punctuation=False, compiled=()):
+        self.name = name
+        self.dictionaries = tuple(dictionaries)
+        self.compiled = tuple(compiled)
+        self.takes_punctuation = takes_punctuation
+
+    def bind(self, plan):
+        method = getattr(plan, self.name)
+        if self.takes_punctuation:
+            return method
+        return lambda text, punctuation_to_keep: method(text)
+
+
+class FunctionStage(Stage):
+    """A custom stage wrapping a plain `func(text) -> text`."""
+    def __init__(self, func, name=None, dictionaries=()):
+        self.func = func
+        self.name = name or getattr(func, "__name__", type(func).__name__)
+        self.dictionaries = tuple(dictionaries)
+
+    def bind(self, plan):
+        func = self.func
+        return lambda text, punctuation_to_keep: func(text)
+
+
+class FoldingStage(Stage):
+    """
+    Folds Ge'ez character variants (e.g. ሠ to ሰ) with the precomputed translate table
+    of a profile in folding.FOLDING_PROFILES. As the first stage of a pipeline, the
+    dictionaries are folded the same way when they are loaded.
+    """
+    name = "fold_characters"
+
+    def __init__(self, profile="homophones"):
+        folding_table(profile)
+        self.profile = profile
+
+    def bind(self, plan):
+        table = folding_table(self.profile)
+        return lambda text, punctuation_to_keep: text.translate(table)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name} {self.profile}>"
+
+
+# The stages of normalize(), in their default order.
+DEFAULT_STAGES = (
+    "replace_clitic_dictionary", "replace_shortened_words_with_dots", "replace_hyphenated_v1",
+    "normalize_clitic_variation", "replace_improper_abbreviation", "handle_words", "strip_punctuation",
+)
+BUILTIN_STAGES = {stage.name: stage for stage in (
+    FoldingStage(),
+    PlanStage("replace_clitic_dictionary", ["clitic_dict"]),
+    PlanStage("replace_shortened_words_with_dots", ["words_with_dots"]),
+    PlanStage("replace_hyphenated_v1", ["hyphenated_words_v1"]),
+    PlanStage("normalize_clitic_variation", compiled=["clitic_variations"]),
+    PlanStage("replace_improper_abbreviation", ["filtered_space_abbreviations", "filtered_single_abbreviations"],
+              compiled=["space_abbreviations", "single_abbreviations"]),
+    PlanStage("handle_words", ["hyphenated_words_v2", "words_with_fwd_slash", "cliticize_improper_words", "clitic_dict"]),
+    PlanStage("strip_punctuation", takes_punctuation=True),
+)}
+
+
+def import_object(path):
+    module_name, _, attr = path.partition(":")
+    try:
+        obj = importlib.import_module(module_name)
+        for part in attr.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Cannot import stage '{path}': {e}")
+    return obj
+
+
+def resolve_stage(spec):
+    """
+    Turn a stage specification into a Stage: a Stage instance, the name of a
+    built-in stage, a `package.module:attribute` import path (to a Stage, a Stage
+    subclass or a function), or a function `func(text) -> text`.
+    """
+    if isinstance(spec, Stage):
+        return spec
+    if isinstance(spec, str):
+        if spec in BUILTIN_STAGES:
+            return BUILTIN_STAGES[spec]
+        if ":" in spec:
+            obj = import_object(spec)
+            return resolve_stage(obj() if isinstance(obj, type) and issubclass(obj, Stage) else obj)
+        raise ValueError(f"Unknown stage '{spec}'. Built-in stages: {', '.join(DEFAULT_STAGES)}")
+    if callable(spec):
+        return FunctionStage(spec)
+    raise TypeError(f"Cannot use {spec!r} as a normalization stage.")
+
+
+class Pipeline:
+    """
+    An ordered list of stages that normalize() runs.
+
+    `stages` defaults to DEFAULT_STAGES, which reproduces the standard output; names in
+    `disable` are dropped. Stages left out cost nothing: their patterns are never
+    compiled and their dictionaries never loaded. `fold` names a character-folding
+    profile to run first (see FoldingStage); `fold` is the profile in use, or None.
+    `scannable` says whether the single-pass scanner can run the pipeline: the
+    default stages, optionally after folding.
+    `compiled` lists the plan attributes the stages use, for NormalizationPlan.prepare().
+    compile(plan) binds the stages to a NormalizationPlan once and returns a single callable.
+    """
+    def __init__(self, stages=None, disable=(), fold=None):
+        stages = [resolve_stage(spec) for spec in (DEFAULT_STAGES if stages is None else stages)]
+        if fold is not None:
+            if any(isinstance(stage, FoldingStage) for stage in stages):
+                raise ValueError("Pass either fold or a fold_characters stage, not both.")
+            stages.insert(0, FoldingStage(fold))
+        disable = set(disable or ())
+        unknown = disable - {stage.name for stage in stages}
+        if unknown:
+            raise ValueError(f"Cannot disable unknown stages: {', '.join(sorted(unknown))}")
+
+        self.stages = tuple(stage for stage in stages if stage.name not in disable)
+        self.names = tuple(stage.name for stage in self.stages)
+        dictionaries = []
+        for stage in self.stages:
+            dictionaries.extend(name for name in stage.dictionaries if name not in dictionaries)
+        self.dictionaries = tuple(dictionaries)
+        self.compiled = tuple(name for stage in self.stages for name in stage.compiled)
+        # Dictionaries can only be folded if every lookup sees folded text.
+        first = self.stages[0] if self.stages else None
+        self.fold = first.profile if isinstance(first, FoldingStage) else None
+        # The single-pass scanner runs the default stages, after folding each chunk if asked to.
+        rest = self.stages[1:] if self.fold is not None else self.stages
+        self.scannable = tuple(stage.name for stage in rest) == DEFAULT_STAGES and all(
+            stage is BUILTIN_STAGES[stage.name] for stage in rest
+        )
+
+    @classmethod
+    def from_config(cls, path):
+        """
+        Read a pipeline from a JSON file: either a list of stages or an object with
+        optional "stages" and "disable" lists and a "fold" profile. Stages are
+        built-in names or `package.module:attribute` import paths.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if isinstance(config, list):
+            return cls(config)
+        if not isinstance(config, dict):
+            raise ValueError(f"Pipeline config {path} must be a JSON list or object.")
+        return cls(config.get("stages"), config.get("disable", ()), config.get("fold"))
+
+    def compile(self, plan):
+        steps = tuple(stage.bind(plan) for stage in self.stages)
+
+        def run(text, punctuation_to_keep=None):
+            for step in steps:
+                text = step(text, punctuation_to_keep)
+            return text
+        return run
+
+    def __repr__(self):
+        return f"Pipeline({list(self.names)!r})"
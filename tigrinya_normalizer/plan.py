@@ -0,0 +1,206 @@
+# plan.py
+import re
+import threading
+from functools import lru_cache
+from .utils import remove_extra_spaces
+from .cache import TokenCache
+from .pipeline import Pipeline
+from .folding import fold_dictionary
+
+# Patterns that do not depend on the loaded dictionaries are compiled once at import.
+CLITIC_TOKEN_PATTERN = re.compile(r'(^|\s)([\w\u1200-\u137F]+)(?=\s|$)', re.UNICODE)
+DOTTED_TOKEN_PATTERN = re.compile(r'(?<!\S)(?:[\w\u1200-\u137F]+(?:\.[\w\u1200-\u137F]+)*\.?)(?!\S)', re.UNICODE)
+WORD_SPLIT_PATTERN = re.compile(r"(\W+)", re.UNICODE)
+CLITIC_SPLIT_PATTERN = re.compile(r"[`’']")
+DEFAULT_PUNCTUATION_PATTERN = re.compile(r"[^\w\s\u1367\u1362?!]", re.UNICODE)
+
+CLITIC_VARIATIONS = {
+    "ኢየ": "እየ", "እዩ": "ኢዩ", "እያ": "ኢያ", "እየን": "ኢየን",
+    "እዮም": "ኢዮም", "ዓመት ምሕረት": "ዓመት ምህረት", "እውን": "ውን"
+}
+CLITIC_VARIATION_PATTERN = re.compile(r'(' + r'|'.join(map(re.escape, CLITIC_VARIATIONS.keys())) + r')')
+
+PUNCTUATION_CACHE_SIZE = 32
+# Marks a compiled object not built yet; some legitimately are None (an empty alternation).
+_MISSING = object()
+
+
+@lru_cache(maxsize=PUNCTUATION_CACHE_SIZE)
+def punctuation_pattern(punctuation_to_keep=None):
+    """
+    Return the compiled punctuation-stripping pattern for a set of marks to keep.
+    Patterns are cached per keep set, so callers can pass the same string on every call.
+    """
+    if not punctuation_to_keep:
+        return DEFAULT_PUNCTUATION_PATTERN
+    return re.compile(rf"[^\w\s{re.escape(punctuation_to_keep)}]", re.UNICODE)
+
+
+def compile_alternation(keys, prefix='', suffix=''):
+    """
+    Compile `keys` into a single `prefix(?:k1|k2|...)suffix` alternation.
+    Returns None when there are no keys, since an empty alternation matches everywhere.
+    """
+    keys = list(keys)
+    if not keys:
+        return None
+    return re.compile(prefix + r'(?:' + r'|'.join(map(re.escape, keys)) + r')' + suffix)
+
+
+class NormalizationPlan:
+    """
+    The dictionaries and compiled patterns behind a TigrinyaNormalizer, plus the stages that use them.
+
+    Each pattern is compiled on first use and reused for every later call. A plan is
+    never modified once built: reloading dictionaries builds a new plan and the
+    normalizer swaps it in with a single assignment, so a call that is already running
+    finishes on the plan it started with.
+
+    A plan is safe to share between threads. Compiled objects are built under a lock,
+    so threads that first need the same pattern at once all get the one instance;
+    after prepare() every call only reads.
+    """
+    def __init__(self, dictionaries, token_cache_size=0, pipeline=None):
+        self.dictionaries = dictionaries
+        self.pipeline = pipeline or Pipeline()
+        self.token_cache = TokenCache(token_cache_size) if token_cache_size else None
+        self._compiled = {}
+        # Reentrant: a factory may build other objects (the scanner reads the patterns).
+        self._lock = threading.RLock()
+
+    def build(self, name, factory):
+        """Return the object cached under `name`, creating it with `factory()` on first use."""
+        compiled = self._compiled.get(name, _MISSING)
+        if compiled is _MISSING:
+            with self._lock:
+                if name not in self._compiled:
+                    self._compiled[name] = factory()
+                compiled = self._compiled[name]
+        return compiled
+
+    def prepare(self):
+        """Load the pipeline's dictionaries and compile what its stages use, up front."""
+        self.dictionaries.load(self.pipeline.dictionaries)
+        self.run_pipeline
+        for name in self.pipeline.compiled:
+            getattr(self, name)
+        if self.pipeline.scannable:
+            self.scanner
+        return self
+
+    @property
+    def space_abbreviations(self):
+        return self.build("space_abbreviations", lambda: compile_alternation(
+            self.dictionaries.get("filtered_space_abbreviations", {}), r'\b', r'\b'))
+
+    @property
+    def single_abbreviations(self):
+        return self.build("single_abbreviations", lambda: compile_alternation(
+            self.dictionaries.get("filtered_single_abbreviations", {}), r'\b', r'\b'))
+
+    @property
+    def improper_abbreviations(self):
+        def build():
+            abbr_dict = self.dictionaries.get("improper_abbreviations", {})
+            return compile_alternation(sorted(abbr_dict, key=len, reverse=True), r'(', r')')
+        return self.build("improper_abbreviations", build)
+
+    @property
+    def clitic_variations(self):
+        def build():
+            if self.pipeline.fold is None:
+                return CLITIC_VARIATIONS, CLITIC_VARIATION_PATTERN
+            variations = fold_dictionary(CLITIC_VARIATIONS, self.pipeline.fold)
+            return variations, compile_alternation(variations, '(', ')')
+        return self.build("clitic_variations", build)
+
+    @property
+    def scanner(self):
+        from .scanner import SinglePassScanner
+        return self.build("scanner", lambda: SinglePassScanner(self))
+
+    @property
+    def run_pipeline(self):
+        return self.build("pipeline", lambda: self.pipeline.compile(self))
+
+    def normalize_passes(self, text, punctuation_to_keep=None):
+        return self.run_pipeline(text, punctuation_to_keep)
+
+    def handle_words(self, text):
+        return " ".join([self._handle_word(word) for word in text.split()])
+
+    def strip_punctuation(self, text, punctuation_to_keep=None):
+        cleaned_text = punctuation_pattern(punctuation_to_keep).sub(" ", text).strip()
+        return remove_extra_spaces(cleaned_text)
+
+    def _handle_word(self, word):
+        cache = self.token_cache
+        if cache is None:
+            return self._resolve_word(word)
+        result = cache.get(word)
+        if result is None:
+            result = cache[word] = self._resolve_word(word)
+        return result
+
+    def _resolve_word(self, word):
+        if "-" in word:
+            return self._handle_hyphen(word)
+        if "/" in word:
+            return self._handle_forward_slash(word)
+        if any(c in word for c in ["'", "`", "’"]):
+            return self._handle_clitic(word)
+        return word
+
+    def _handle_hyphen(self, word):
+        return self.dictionaries.get("hyphenated_words_v2", {}).get(word, word)
+
+    def _handle_forward_slash(self, word):
+        return self.dictionaries.get("words_with_fwd_slash", {}).get(word, word)
+
+    def _handle_clitic(self, word):
+        token = CLITIC_SPLIT_PATTERN.split(word)
+        bind_token = "".join(token[:2])
+
+        if bind_token in self.dictionaries.get("cliticize_improper_words", {}):
+            return bind_token
+        if len(token) > 1:
+            token[1] = self.dictionaries.get("clitic_dict", {}).get(token[1], token[1])
+
+        return " ".join(token).strip()
+
+    def replace_abbreviations(self, text):
+        abbr_dict = self.dictionaries.get("improper_abbreviations", {})
+        pattern = self.improper_abbreviations
+        if pattern is None:
+            return text
+        return pattern.sub(lambda m: abbr_dict[m.group()], text)
+
+    def replace_shortened_words_with_dots(self, text):
+        short_dict = self.dictionaries.get("words_with_dots", {})
+        return DOTTED_TOKEN_PATTERN.sub(lambda m: short_dict.get(m.group(0), m.group(0)), text)
+
+    def replace_hyphenated_v1(self, text):
+        words = WORD_SPLIT_PATTERN.split(text)
+        hyphen_dict = self.dictionaries.get("hyphenated_words_v1", {})
+        return "".join([hyphen_dict.get(word, word) for word in words])
+
+    def replace_clitic_dictionary(self, text):
+        clitic_dict = self.dictionaries.get("clitic_dict", {})
+        return CLITIC_TOKEN_PATTERN.sub(lambda m: m.group(1) + clitic_dict.get(m.group(2), m.group(2)), text)
+
+    def normalize_clitic_variation(self, text):
+        variations, pattern = self.clitic_variations
+        return pattern.sub(lambda m: variations[m.group()], text)
+
+    def replace_improper_abbreviation(self, text):
+        space_dict = self.dictionaries.get("filtered_space_abbreviations", {})
+        single_dict = self.dictionaries.get("filtered_single_abbreviations", {})
+
+        space_pat = self.space_abbreviations
+        single_pat = self.single_abbreviations
+
+        if space_pat is not None:
+            text = space_pat.sub(lambda m: space_dict[m.group()], text)
+        if single_pat is not None:
+            text = single_pat.sub(lambda m: single_dict[m.group()], text)
+        return text
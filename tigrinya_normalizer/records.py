@@ -0,0 +1,97 @@
+# records.py
+import json
+import time
+from collections import deque
+from .compression import open_text
+
+JSONL_BATCH_SIZE = 512
+# One encoder for every record; json.dumps() builds a new one per call when given options.
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _parse(line, line_number):
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"Line {line_number} is not valid JSON: {e}")
+    if not isinstance(record, dict):
+        raise ValueError(f"Line {line_number} is not a JSON object.")
+    return record
+
+
+def iter_record_batches(lines, fields, batch_size=JSONL_BATCH_SIZE):
+    """
+    Parse JSON lines into batches of `(records, slots, texts)`: `records` holds the
+    parsed objects (None for a blank line), `texts` the string values of `fields`
+    and `slots` the `(record, field)` each text belongs to.
+    """
+    records, slots, texts = [], [], []
+    for line_number, line in enumerate(lines, 1):
+        if line.strip():
+            record = _parse(line, line_number)
+            for field in fields:
+                value = record.get(field)
+                if isinstance(value, str):
+                    slots.append((record, field))
+                    texts.append(value)
+        else:
+            record = None
+        records.append(record)
+        if len(records) >= batch_size:
+            yield records, slots, texts
+            records, slots, texts = [], [], []
+    if records:
+        yield records, slots, texts
+
+
+def _serialize(records, slots, normalized):
+    for (record, field), text in zip(slots, normalized):
+        record[field] = text
+    return ["" if record is None else _encode(record) for record in records]
+
+
+def normalize_records(normalizer, lines, fields, punctuation_to_keep=None, workers=1, batch_size=JSONL_BATCH_SIZE):
+    """
+    Normalize the string values of `fields` in each JSON line of `lines` and yield
+    the re-serialized records (without newline), in order. Other fields, and records
+    lacking a field, pass through unchanged; blank lines stay blank.
+
+    Records are normalized `batch_size` at a time with normalize_batch(), or, with
+    `workers` > 1, by a process pool holding at most two batches per worker.
+    """
+    batches = iter_record_batches(lines, fields, batch_size)
+    if workers <= 1:
+        for records, slots, texts in batches:
+            yield from _serialize(records, slots, normalizer.normalize_batch(texts, punctuation_to_keep))
+        return
+
+    from .parallel import _pool, _normalize_texts
+    with _pool(normalizer, workers) as pool:
+        in_flight = deque()
+        while True:
+            while len(in_flight) < 2 * workers:
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                records, slots, texts = batch
+                in_flight.append((records, slots, pool.apply_async(_normalize_texts, ((texts, punctuation_to_keep),))))
+            if not in_flight:
+                break
+            records, slots, result = in_flight.popleft()
+            yield from _serialize(records, slots, result.get())
+
+
+def normalize_jsonl(normalizer, input_path, output_path, fields, punctuation_to_keep=None, workers=1,
+                    batch_size=JSONL_BATCH_SIZE):
+    """
+    Normalize `fields` of every record of the JSON-lines file `input_path` into
+    `output_path`, streaming (compressed files are handled as by open_text()).
+    Returns the number of lines written and the seconds taken.
+    """
+    start = time.perf_counter()
+    count = 0
+    with open_text(input_path) as src, open_text(output_path, 'w') as dst:
+        for line in normalize_records(normalizer, src, fields, punctuation_to_keep, workers, batch_size):
+            dst.write(line + "\n")
+            count += 1
+    return count, time.perf_counter() - start
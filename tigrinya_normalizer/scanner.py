@@ -0,0 +1,365 @@
+# scanner.py
+import re
+from .plan import WORD_SPLIT_PATTERN, punctuation_pattern
+from .folding import folding_table
+
+TOKEN_PATTERN = re.compile(r"(\s*)(\S+)", re.UNICODE)
+WHITESPACE_PATTERN = re.compile(r"\s", re.UNICODE)
+WHITESPACE_RUN_PATTERN = re.compile(r"\s+", re.UNICODE)
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+NON_WORD_PATTERN = re.compile(r"\W+", re.UNICODE)
+MEMO_LIMIT = 100000
+
+CLITIC_KEY_PATTERN = re.compile(r"[\w\u1200-\u137F]+", re.UNICODE)
+DOTTED_KEY_PATTERN = re.compile(r"[\w\u1200-\u137F]+(?:\.[\w\u1200-\u137F]+)*\.?", re.UNICODE)
+
+
+def phrase_joints(keys):
+    """
+    Collect the (char before, whitespace run, char after) joints of every key that spans whitespace.
+    A match can only cross the gap between two tokens if the gap and its neighbours form one of these.
+    """
+    joints = set()
+    for key in keys:
+        for m in WHITESPACE_RUN_PATTERN.finditer(key):
+            joints.add((key[m.start() - 1], m.group(), key[m.end()]))
+    return joints
+
+
+def trim_memo(memo):
+    # Per-call memos are plain dicts and are emptied when full; a TokenCache bounds itself.
+    if isinstance(memo, dict) and len(memo) >= MEMO_LIMIT:
+        memo.clear()
+
+
+def has_open_edges(text):
+    return not text or text[0].isspace() or text[-1].isspace()
+
+
+class StreamingSub:
+    """
+    `pattern.sub(lambda m: table[m.group()], text)` over text that arrives in pieces.
+
+    The pattern is an alternation of the literal keys of `table`, so whether a match
+    starts at a position depends on at most the longest key and the character after
+    it (for a trailing \\b). feed() replaces what is certain and keeps the rest, so the
+    state stays bounded by the longest key however much text is fed.
+    """
+    __slots__ = ("pattern", "table", "reach", "buffer", "pos")
+
+    def __init__(self, pattern, table):
+        self.pattern = pattern
+        self.table = table
+        self.reach = max(map(len, table)) + 1 if pattern is not None else 0
+        # The unscanned text, after one character kept for a leading \b.
+        self.buffer = ""
+        self.pos = 0
+
+    def _scan(self, buffer, pos, limit):
+        out = []
+        table = self.table
+        for m in self.pattern.finditer(buffer, pos):
+            if m.start() >= limit:
+                break
+            out.append(buffer[pos:m.start()])
+            out.append(table[m.group()])
+            pos = m.end()
+        if limit > pos:
+            out.append(buffer[pos:limit])
+            pos = limit
+        return "".join(out), pos
+
+    def feed(self, text):
+        """Add `text` and return the output that no later text can change."""
+        if self.pattern is None:
+            return text
+        buffer = self.buffer + text
+        out, pos = self._scan(buffer, self.pos, len(buffer) - self.reach)
+        keep = max(pos - 1, 0)
+        self.buffer, self.pos = buffer[keep:], pos - keep
+        return out
+
+    def peek(self, text=""):
+        """The rest of the output if the text ended after `text`, without changing the state."""
+        if self.pattern is None:
+            return text
+        buffer = self.buffer + text
+        return self._scan(buffer, self.pos, len(buffer))[0]
+
+
+class PhraseStream:
+    """
+    The clitic variation and abbreviation stages, and the words they leave, over a run
+    of tokens that may form multi-word keys (see SinglePassScanner._merge). Text is
+    fed in as the run grows and words are returned as soon as they are certain, so
+    a long run costs linear time and bounded memory.
+    """
+    def __init__(self, plan, pattern):
+        variations, variation_pattern = plan.clitic_variations
+        dictionaries = plan.dictionaries
+        self.plan = plan
+        self.pattern = pattern
+        self.subs = (
+            StreamingSub(variation_pattern, variations),
+            StreamingSub(plan.space_abbreviations, dictionaries.get("filtered_space_abbreviations", {})),
+            StreamingSub(plan.single_abbreviations, dictionaries.get("filtered_single_abbreviations", {})),
+        )
+        # First and last character of each stage's output so far.
+        self.edges = [["", ""] for _ in self.subs]
+        # Output after its last whitespace: a word that may still grow.
+        self.partial = ""
+
+    def _words(self, words):
+        plan, pattern = self.plan, self.pattern
+        result = []
+        for word in words:
+            result.extend(pattern.sub(" ", plan._handle_word(word)).split())
+        return result
+
+    def feed(self, text):
+        """Add expanded text; return the normalized words no later text can change."""
+        for sub, edge in zip(self.subs, self.edges):
+            text = sub.feed(text)
+            if text:
+                edge[0] = edge[0] or text[0]
+                edge[1] = text[-1]
+        text = self.partial + text
+        words = text.split()
+        self.partial = words.pop() if words and not text[-1].isspace() else ""
+        return self._words(words)
+
+    def peek(self):
+        """
+        The variation and abbreviation stage texts as they would end now (only their
+        edge characters are kept), and the words not returned by feed() yet.
+        """
+        text = ""
+        views = []
+        for sub, (first, last) in zip(self.subs, self.edges):
+            text = sub.peek(text)
+            views.append(first + last + text)
+        return views[0], views[1], self._words((self.partial + text).split())
+
+
+class SinglePassScanner:
+    """
+    Alternative engine for TigrinyaNormalizer.normalize() that walks the text once.
+
+    The text is tokenized on whitespace in a single left-to-right scan. The whole-token
+    stages (clitic dictionary, dotted words, hyphenated_words_v1) become hash lookups,
+    and the remaining stages run on the token alone, so each distinct token is processed
+    once per call (or once per batch with normalize_many()). Tokens are only merged back together when a multi-word key (such as
+    "ዓመት ምሕረት" or a space abbreviation) could match across the gap between them, which
+    keeps the output byte-identical to the regex pipeline. A run of such tokens is
+    streamed through a PhraseStream, so however long it gets, each token is handled once.
+
+    With a folding pipeline the text is folded before it is scanned (folding maps
+    single characters, so chunks can be folded one by one) and the dictionaries and
+    clitic variations the scanner reads are the folded ones.
+    """
+    def __init__(self, plan):
+        self.plan = plan
+        dictionaries = plan.dictionaries
+        fold = plan.pipeline.fold
+        self.fold_table = folding_table(fold) if fold is not None else None
+        variations = plan.clitic_variations[0]
+
+        # Only keys the stage patterns can actually match take part in the lookups.
+        self.clitic_dict = {k: v for k, v in dictionaries.get("clitic_dict", {}).items()
+                            if CLITIC_KEY_PATTERN.fullmatch(k)}
+        self.dots_dict = {k: v for k, v in dictionaries.get("words_with_dots", {}).items()
+                          if DOTTED_KEY_PATTERN.fullmatch(k)}
+        self.hyphen_dict = dictionaries.get("hyphenated_words_v1", {})
+
+        space_keys = list(dictionaries.get("filtered_space_abbreviations", {}))
+        single_keys = list(dictionaries.get("filtered_single_abbreviations", {}))
+        stage_keys = [list(variations), space_keys, single_keys]
+        self.joints = [phrase_joints(keys) for keys in stage_keys]
+        self.joint_tails = [{joint[0] for joint in joints} for joints in self.joints]
+        self.joint_heads = [{joint[2] for joint in joints} for joints in self.joints]
+
+        # The scan assumes no key matches whitespace on its own; otherwise fall back to the regex passes.
+        self.supported = not any(
+            not key or key[0].isspace() or key[-1].isspace()
+            for keys in stage_keys for key in keys
+        ) and not any(not key or NON_WORD_PATTERN.fullmatch(key) for key in self.hyphen_dict)
+
+        # Text split at line breaks normalizes to the same words as the whole, unless a key
+        # spans a line break or a replacement can leave a token empty or whitespace-edged.
+        values = [dictionaries.get(name, {}).values() for name in (
+            "clitic_dict", "words_with_dots", "hyphenated_words_v1",
+            "filtered_space_abbreviations", "filtered_single_abbreviations")]
+        values.append(variations.values())
+        self.line_safe = self.supported and not any(
+            "\n" in gap for joints in self.joints for _, gap, _ in joints
+        ) and not any(has_open_edges(value) for group in values for value in group)
+
+    def normalize(self, text, punctuation_to_keep=None):
+        if not self.supported:
+            return self.plan.normalize_passes(text, punctuation_to_keep)
+        pattern = punctuation_pattern(punctuation_to_keep)
+        return self._normalize_text(self._fold(text), pattern, self._memo(pattern))
+
+    def _fold(self, text):
+        return text if self.fold_table is None else text.translate(self.fold_table)
+
+    def _memo(self, pattern):
+        # Units depend on the punctuation pattern, so the shared token cache is scoped by it.
+        cache = self.plan.token_cache
+        return {} if cache is None else cache.scoped(pattern)
+
+    def normalize_many(self, texts, punctuation_to_keep=None):
+        """
+        Lazily normalize each text in `texts`, sharing the punctuation pattern and the
+        per-token memo across the whole batch, so a token seen in any earlier text is
+        not processed again.
+        """
+        if not self.supported:
+            for text in texts:
+                yield self.plan.normalize_passes(text, punctuation_to_keep)
+            return
+
+        pattern = punctuation_pattern(punctuation_to_keep)
+        memo = self._memo(pattern)
+        for text in texts:
+            trim_memo(memo)
+            yield self._normalize_text(self._fold(text), pattern, memo)
+
+    def _normalize_text(self, text, pattern, memo):
+        words = []
+        pending = None
+        for gap, token in TOKEN_PATTERN.findall(text):
+            unit = memo.get(token)
+            if unit is None:
+                unit = memo[token] = self._process(self._expand(token), pattern)
+            if pending is None:
+                pending = unit
+            elif pending[4] and unit[5] and self._joins(pending, gap, unit):
+                pending, done = self._merge(pending, gap, unit, pattern)
+                words.extend(done)
+            else:
+                words.extend(pending[3])
+                pending = unit
+        if pending is not None:
+            words.extend(pending[3])
+        return " ".join(words)
+
+    def iter_words(self, chunks, punctuation_to_keep=None):
+        """
+        Yield the normalized words of the concatenation of `chunks`, in order.
+
+        A token or whitespace gap cut by a chunk boundary is carried over to the next
+        chunk, and a token is only emitted once the following token shows it cannot join
+        a multi-word key, so the words equal `normalize("".join(chunks)).split(" ")`.
+        Tokens that keep joining are streamed (see PhraseStream) and their words yielded
+        as they become final. Memory is bounded by the longest token and dictionary key,
+        plus the per-token memo, which is cleared once it holds MEMO_LIMIT entries (or
+        by the plan's token cache).
+        """
+        pattern = punctuation_pattern(punctuation_to_keep)
+        memo = self._memo(pattern)
+        pending = None
+
+        def step(gap, token):
+            nonlocal pending
+            unit = memo.get(token)
+            if unit is None:
+                trim_memo(memo)
+                unit = memo[token] = self._process(self._expand(token), pattern)
+            if pending is None:
+                pending = unit
+            elif pending[4] and unit[5] and self._joins(pending, gap, unit):
+                pending, done = self._merge(pending, gap, unit, pattern)
+                return done
+            else:
+                done, pending = pending, unit
+                return done[3]
+            return ()
+
+        carry = ""
+        for chunk in chunks:
+            buffer = carry + self._fold(chunk)
+            last = None
+            for m in TOKEN_PATTERN.finditer(buffer):
+                if last is not None:
+                    yield from step(*last.groups())
+                last = m
+            if last is None:
+                carry = buffer
+            elif last.end() == len(buffer):
+                carry = buffer[last.start():]
+            else:
+                yield from step(*last.groups())
+                carry = buffer[last.end():]
+        for m in TOKEN_PATTERN.finditer(carry):
+            yield from step(*m.groups())
+        if pending is not None:
+            yield from pending[3]
+
+    def _expand(self, token):
+        # clitic dictionary, dotted words and hyphenated_words_v1 on a single token
+        text = self.clitic_dict.get(token, token)
+        if WHITESPACE_PATTERN.search(text):
+            text = self.plan.replace_shortened_words_with_dots(text)
+        else:
+            text = self.dots_dict.get(text, text)
+        if WORD_PATTERN.fullmatch(text):
+            return self.hyphen_dict.get(text, text)
+        return "".join([self.hyphen_dict.get(w, w) for w in WORD_SPLIT_PATTERN.split(text)])
+
+    def _process(self, expanded, pattern):
+        plan = self.plan
+        varied = plan.normalize_clitic_variation(expanded)
+        space_pat = plan.space_abbreviations
+        if space_pat is not None:
+            space_dict = plan.dictionaries["filtered_space_abbreviations"]
+            spaced = space_pat.sub(lambda m: space_dict[m.group()], varied)
+        else:
+            spaced = varied
+        single_pat = plan.single_abbreviations
+        if single_pat is not None:
+            single_dict = plan.dictionaries["filtered_single_abbreviations"]
+            final = single_pat.sub(lambda m: single_dict[m.group()], spaced)
+        else:
+            final = spaced
+
+        words = []
+        for word in final.split():
+            words.extend(pattern.sub(" ", plan._handle_word(word)).split())
+
+        # Whether this unit could join a multi-word key with the unit after / before it.
+        stages = (expanded, varied, spaced)
+        if any(has_open_edges(text) for text in stages):
+            return expanded, varied, spaced, words, True, True
+        tail = any(text[-1] in tails for text, tails in zip(stages, self.joint_tails))
+        head = any(text[0] in heads for text, heads in zip(stages, self.joint_heads))
+        return expanded, varied, spaced, words, tail, head
+
+    def _merge(self, pending, gap, unit, pattern):
+        """
+        Join `unit` to `pending`, a unit or a run of units a multi-word key could span.
+        Returns the run, shaped like a unit whose stage texts keep only their edge
+        characters, and the words of its start that are final already. The run is
+        streamed through a PhraseStream, so its length does not matter.
+        """
+        if len(pending) > 6:
+            stream = pending[6]
+            done = stream.feed(gap + unit[0])
+        else:
+            stream = PhraseStream(self.plan, pattern)
+            done = stream.feed(pending[0] + gap + unit[0])
+        varied, spaced, words = stream.peek()
+        stages = (pending[0][:1] + gap + unit[0], varied, spaced)
+        if any(has_open_edges(text) for text in stages):
+            tail = True
+        else:
+            tail = any(text[-1] in tails for text, tails in zip(stages, self.joint_tails))
+        return stages + (words, tail, True, stream), done
+
+    def _joins(self, left, gap, right):
+        for stage in range(3):
+            if has_open_edges(left[stage]) or has_open_edges(right[stage]):
+                return True
+            if (left[stage][-1], gap, right[stage][0]) in self.joints[stage]:
+                return True
+        return False
@@ -0,0 +1,136 @@
+# script.py
+import re
+from collections import deque
+from .utils import clean_text
+from .compression import open_text
+
+# Ge'ez letters and numerals: the Ethiopic block without its punctuation and
+# combining marks, plus the Ethiopic Supplement, Extended and Extended-A blocks.
+GEEZ_LETTERS = "ሀ-ፚ፩-፼ᎀ-ᎏⶀ-ⷞꬁ-ꬮ"
+GEEZ_RUN_PATTERN = re.compile(f"[{GEEZ_LETTERS}]+")
+LETTER_RUN_PATTERN = re.compile(r"[^\W\d_]+")
+
+DEFAULT_SCRIPT_THRESHOLD = 0.5
+SCRIPT_ACTIONS = ("passthrough", "drop", "clean")
+ROUTE_BATCH_SIZE = 512
+
+
+def script_ratio(text):
+    """
+    Return the share of the letters in `text` that are Ge'ez, from 0.0 to 1.0
+    (0.0 when it has no letters). Text without any Ge'ez letter is rejected by a
+    single regex search before letters are counted.
+    """
+    if GEEZ_RUN_PATTERN.search(text) is None:
+        return 0.0
+    letters = sum(map(len, LETTER_RUN_PATTERN.findall(text)))
+    if not letters:
+        return 0.0
+    return min(1.0, sum(map(len, GEEZ_RUN_PATTERN.findall(text))) / letters)
+
+
+class ScriptFilter:
+    """
+    Routes lines around the normalizer by script: lines whose Ge'ez letter ratio
+    (script_ratio) is at least `threshold` are normalized, the others are passed
+    through unchanged, dropped, or cheaply cleaned with utils.clean_text, as
+    `action` says. `counts` accumulates how many lines went each way.
+    """
+    def __init__(self, threshold=DEFAULT_SCRIPT_THRESHOLD, action="passthrough"):
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError("The script threshold must be between 0 and 1.")
+        if action not in SCRIPT_ACTIONS:
+            raise ValueError(f"Unknown action '{action}'. Expected one of: {', '.join(SCRIPT_ACTIONS)}")
+        self.threshold = threshold
+        self.action = action
+        self.counts = self.empty_counts()
+
+    @staticmethod
+    def empty_counts():
+        return {"normalized": 0, "passthrough": 0, "dropped": 0, "cleaned": 0}
+
+    def accepts(self, text):
+        return script_ratio(text) >= self.threshold
+
+    def merge(self, counts):
+        for key, value in counts.items():
+            self.counts[key] += value
+
+    def _bypass(self, line, counts):
+        """Output for a line below the threshold, or None to drop it."""
+        if self.action == "drop":
+            counts["dropped"] += 1
+            return None
+        if self.action == "clean":
+            counts["cleaned"] += 1
+            return clean_text(line)
+        counts["passthrough"] += 1
+        return line
+
+    def _batches(self, lines, counts, batch_size):
+        """Yield `(outputs, slots, texts)`: the outputs so far and the lines still to normalize."""
+        outputs, slots, texts = [], [], []
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if self.accepts(line):
+                counts["normalized"] += 1
+                slots.append(len(outputs))
+                texts.append(line)
+                outputs.append(None)
+            else:
+                output = self._bypass(line, counts)
+                if output is not None:
+                    outputs.append(output)
+            if len(outputs) >= batch_size:
+                yield outputs, slots, texts
+                outputs, slots, texts = [], [], []
+        if outputs:
+            yield outputs, slots, texts
+
+    def route(self, normalizer, lines, punctuation_to_keep=None, workers=1, counts=None,
+              batch_size=ROUTE_BATCH_SIZE):
+        """
+        Yield the output for each of `lines` in order (without newline): normalized
+        with normalizer.normalize_batch() if it is Tigrinya, per `action` otherwise.
+        With `workers` > 1 only the Tigrinya lines are sent to the process pool.
+        Counts go to `counts` if given, else to self.counts.
+        """
+        counts = self.counts if counts is None else counts
+        batches = self._batches(lines, counts, batch_size)
+
+        def fill(outputs, slots, normalized):
+            for slot, text in zip(slots, normalized):
+                outputs[slot] = text
+            return outputs
+
+        if workers <= 1:
+            for outputs, slots, texts in batches:
+                yield from fill(outputs, slots, normalizer.normalize_batch(texts, punctuation_to_keep))
+            return
+
+        from .parallel import _pool, _normalize_texts
+        with _pool(normalizer, workers) as pool:
+            in_flight = deque()
+            while True:
+                while len(in_flight) < 2 * workers:
+                    batch = next(batches, None)
+                    if batch is None:
+                        break
+                    outputs, slots, texts = batch
+                    task = pool.apply_async(_normalize_texts, ((texts, punctuation_to_keep),))
+                    in_flight.append((outputs, slots, task))
+                if not in_flight:
+                    break
+                outputs, slots, task = in_flight.popleft()
+                yield from fill(outputs, slots, task.get())
+
+    def route_file(self, normalizer, input_path, output_path, punctuation_to_keep=None, workers=1, counts=None):
+        """Route every line of `input_path` into `output_path`, one output line per kept line."""
+        with open_text(input_path) as src, open_text(output_path, 'w') as dst:
+            for line in self.route(normalizer, src, punctuation_to_keep, workers, counts):
+                dst.write(line + "\n")
+
+    def report(self):
+        total = sum(self.counts.values())
+        parts = ", ".join(f"{value} {key}" for key, value in self.counts.items() if value or key == "normalized")
+        return f"{total} lines: {parts}"
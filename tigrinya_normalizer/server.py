@@ -0,0 +1,318 @@
+# server.py
+import json
+import time
+import asyncio
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from .parallel import _pool, _normalize_texts
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 2.0
+MAX_BODY_SIZE = 16 << 20
+
+# Upper bounds (milliseconds) of the latency histogram buckets; a final bucket catches the rest.
+LATENCY_BUCKETS_MS = (0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+HTTP_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles (bucket upper bounds)."""
+    def __init__(self, bounds=LATENCY_BUCKETS_MS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, ms):
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, q):
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        buckets = {f"<={bound}": n for bound, n in zip(self.bounds, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else None,
+            "p50_ms": self.percentile(0.5), "p90_ms": self.percentile(0.9), "p99_ms": self.percentile(0.99),
+            "max_ms": self.max,
+            "buckets": buckets,
+        }
+
+
+def _resolve(future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+def _reject(future, error):
+    if not future.done():
+        future.set_exception(error)
+
+
+class NormalizationServer:
+    """
+    Local HTTP/JSON server around one shared TigrinyaNormalizer.
+
+    Concurrent requests are queued and collected into micro-batches of at most
+    `max_batch_size` texts, waiting no longer than `max_wait_ms` for a batch to fill.
+    Each batch runs through normalize_batch() off the event loop: in a worker thread
+    when `workers` is 1, otherwise in a pool of `workers` processes sharing the
+    normalizer's dictionaries. While every worker is busy new requests keep queueing,
+    so batches grow with load.
+
+    Endpoints:
+        POST /normalize  {"text": str} or {"texts": [str, ...]}, optional "punctuation"
+        GET  /stats      request, queue and batch latency histograms and batch sizes
+        GET  /health
+    """
+    def __init__(self, normalizer, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait_ms=DEFAULT_MAX_WAIT_MS, workers=1):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative.")
+        self.normalizer = normalizer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.workers = max(workers, 1)
+        self.address = None
+
+        self.latency = {"request": LatencyHistogram(), "queue": LatencyHistogram(), "batch": LatencyHistogram()}
+        self.requests = 0
+        self.texts = 0
+        self.batches = 0
+        self.max_batch_seen = 0
+
+        self._server = None
+        self._collector = None
+        self._queue = None
+        self._slots = None
+        self._executor = None
+        self._pool = None
+
+    async def start(self, host="127.0.0.1", port=8080, unix_path=None):
+        """Start listening on `host:port`, or on the Unix socket `unix_path` if given."""
+        if self.workers > 1:
+            self._pool = _pool(self.normalizer, self.workers)
+        else:
+            self.normalizer.load_dictionaries()
+            self._executor = ThreadPoolExecutor(1)
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._collector = asyncio.ensure_future(self._collect())
+
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle, path=unix_path)
+            self.address = unix_path
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+        return self.address
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def normalize(self, texts, punctuation_to_keep=None):
+        """Queue `texts` for the next micro-batch and return their normalized forms."""
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((texts, punctuation_to_keep, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+            while size < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    item = self._queue.get_nowait()
+                batch.append(item)
+                size += len(item[0])
+            await self._slots.acquire()
+            asyncio.ensure_future(self._run(batch))
+
+    def _offload(self, texts, punctuation_to_keep):
+        loop = asyncio.get_event_loop()
+        if self._pool is None:
+            return loop.run_in_executor(self._executor, self.normalizer.normalize_batch, texts, punctuation_to_keep)
+        future = loop.create_future()
+        self._pool.apply_async(
+            _normalize_texts, ((texts, punctuation_to_keep),),
+            callback=lambda result: loop.call_soon_threadsafe(_resolve, future, result),
+            error_callback=lambda error: loop.call_soon_threadsafe(_reject, future, error),
+        )
+        return future
+
+    async def _run(self, batch):
+        try:
+            started = time.perf_counter()
+            groups = {}
+            for item in batch:
+                self.latency["queue"].observe((started - item[3]) * 1000)
+                groups.setdefault(item[1], []).append(item)
+
+            for punctuation_to_keep, items in groups.items():
+                texts = [text for item in items for text in item[0]]
+                start = time.perf_counter()
+                try:
+                    results = await self._offload(texts, punctuation_to_keep)
+                except Exception as e:
+                    for item in items:
+                        _reject(item[2], e)
+                    continue
+                self.latency["batch"].observe((time.perf_counter() - start) * 1000)
+                self.batches += 1
+                self.max_batch_seen = max(self.max_batch_seen, len(texts))
+
+                offset = 0
+                for item in items:
+                    _resolve(item[2], results[offset:offset + len(item[0])])
+                    offset += len(item[0])
+        finally:
+            self._slots.release()
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "texts": self.texts,
+            "batches": self.batches,
+            "mean_batch_size": self.texts / self.batches if self.batches else None,
+            "max_batch_size": self.max_batch_seen,
+            "latency": {name: histogram.snapshot() for name, histogram in self.latency.items()},
+            "token_cache": self.normalizer.token_cache_stats(),
+        }
+
+    async def _dispatch(self, method, path, body):
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/stats":
+            return 200, self.stats()
+        if path != "/normalize":
+            return 404, {"error": f"Unknown path '{path}'."}
+        if method != "POST":
+            return 405, {"error": "Use POST for /normalize."}
+
+        try:
+            request = json.loads(body.decode("utf-8"))
+        except ValueError as e:
+            return 400, {"error": f"Invalid JSON: {e}"}
+        if not isinstance(request, dict):
+            return 400, {"error": "Expected a JSON object."}
+        single = "text" in request
+        texts = [request["text"]] if single else request.get("texts")
+        punctuation_to_keep = request.get("punctuation")
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            return 400, {"error": "Expected 'text' (a string) or 'texts' (a list of strings)."}
+        if punctuation_to_keep is not None and not isinstance(punctuation_to_keep, str):
+            return 400, {"error": "'punctuation' must be a string."}
+
+        start = time.perf_counter()
+        self.requests += 1
+        self.texts += len(texts)
+        results = await self.normalize(texts, punctuation_to_keep) if texts else []
+        self.latency["request"].observe((time.perf_counter() - start) * 1000)
+        return 200, {"normalized": results[0] if single else results}
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                keep_alive = len(parts) == 3 and parts[2] == "HTTP/1.1" \
+                    and headers.get("connection", "").lower() != "close"
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if len(parts) != 3 or length < 0:
+                    status, payload, keep_alive = 400, {"error": "Malformed request."}, False
+                elif length > MAX_BODY_SIZE:
+                    status, payload, keep_alive = 413, {"error": f"Body exceeds {MAX_BODY_SIZE} bytes."}, False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    try:
+                        status, payload = await self._dispatch(parts[0], parts[1], body)
+                    except Exception as e:
+                        status, payload = 500, {"error": str(e)}
+
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+def serve(server, host="127.0.0.1", port=8080, unix_path=None):
+    """Run `server` on the current event loop until interrupted."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    address = loop.run_until_complete(server.start(host, port, unix_path))
+    location = address if unix_path else f"http://{address[0]}:{address[1]}"
+    print(f"Serving Tigrinya normalization on {location} (Ctrl+C to stop)")
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(server.close())
+        loop.close()
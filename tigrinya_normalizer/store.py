@@ -0,0 +1,199 @@
+# store.py
+import os
+import sys
+import threading
+from types import MappingProxyType
+from collections.abc import MutableMapping
+from .utils import load_json
+from .artifact import open_artifact, source_stamp
+from .folding import fold_dictionary
+
+# Tables shared by every store in the process: (resolved path, fold) -> [stamp, table, source, bytes].
+# The size is measured the first time a report asks for it, since walking a table costs more than loading it.
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def table_size(table):
+    """Approximate memory held by a loaded dictionary, including its keys and values."""
+    return sys.getsizeof(table) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in table.items())
+
+
+def current_stamp(file_path):
+    try:
+        return source_stamp(file_path)
+    except OSError:
+        return None
+
+
+def clear_registry():
+    """Drop every shared table; stores created afterwards read their dictionaries from disk again."""
+    with _registry_lock:
+        _registry.clear()
+
+
+class DictionaryStore(MutableMapping):
+    """
+    Normalization dictionaries keyed by name, each loaded the first time it is accessed.
+
+    A dictionary is read from the compiled artifact when that table is fresh and from
+    its JSON file otherwise, so dictionaries no stage touches are never read at all.
+
+    Loaded tables are read-only and shared through a process-wide registry keyed by
+    the file's resolved path, mtime and size: every store that asks for an unchanged
+    file gets the same table instead of its own copy. Assigning a name replaces (or
+    adds) a dictionary for this store only.
+
+    With a folding profile `fold`, every table's keys and values are folded as it is loaded
+    (see folding.fold_dictionary); folded tables are shared separately from plain ones.
+    """
+    def __init__(self, dict_root_path, dict_files, fold=None):
+        self.dict_root_path = dict_root_path
+        self.dict_files = dict(dict_files)
+        self.fold = fold
+        self.sources = {}
+        self._loaded = {}
+        self._stamps = {}
+        self._entries = {}
+        self._artifact = None
+        self._artifact_opened = False
+        # Serializes loads, so concurrent first accesses read a file once and never race the artifact's close.
+        self._lock = threading.Lock()
+
+    def _open_artifact(self):
+        if not self._artifact_opened:
+            self._artifact = open_artifact(self.dict_root_path)
+            self._artifact_opened = True
+        return self._artifact
+
+    def _read(self, name):
+        filename = self.dict_files[name]
+        artifact = self._open_artifact()
+        if artifact is not None and artifact.is_fresh(name, filename, self.dict_root_path):
+            return artifact.load(name), "artifact"
+        return load_json(os.path.join(self.dict_root_path, filename)), "json"
+
+    def _load(self, name):
+        with self._lock:
+            table = self._loaded.get(name)
+            if table is not None:
+                return table
+            return self._load_locked(name)
+
+    def _load_locked(self, name):
+        file_path = os.path.realpath(os.path.join(self.dict_root_path, self.dict_files[name]))
+        stamp = current_stamp(file_path)
+        key = (file_path, self.fold)
+        with _registry_lock:
+            entry = _registry.get(key)
+        if stamp is None or entry is None or entry[0] != stamp:
+            raw, source = self._read(name)
+            if self.fold is not None:
+                raw = fold_dictionary(raw, self.fold)
+            entry = [stamp, MappingProxyType(raw), source, None]
+            if stamp is not None:
+                with _registry_lock:
+                    current = _registry.get(key)
+                    if current is not None and current[0] == stamp:
+                        entry = current
+                    else:
+                        _registry[key] = entry
+
+        _, table, source, _ = entry
+        self._loaded[name] = table
+        self._stamps[name] = stamp
+        self._entries[name] = entry
+        self.sources[name] = source
+        artifact = self._artifact
+        if artifact is not None and all(n in self._loaded for n in self.dict_files):
+            artifact.close()
+            self._artifact = None
+        return table
+
+    def __getitem__(self, name):
+        table = self._loaded.get(name)
+        if table is not None:
+            return table
+        if name not in self.dict_files:
+            raise KeyError(name)
+        return self._load(name)
+
+    def get(self, name, default=None):
+        table = self._loaded.get(name)
+        if table is not None:
+            return table
+        if name not in self.dict_files:
+            return default
+        return self._load(name)
+
+    def __setitem__(self, name, table):
+        self._loaded[name] = table
+        self._stamps.pop(name, None)
+        self._entries.pop(name, None)
+        self.sources[name] = "assigned"
+
+    def __delitem__(self, name):
+        if name not in self._loaded and name not in self.dict_files:
+            raise KeyError(name)
+        self._loaded.pop(name, None)
+        self._stamps.pop(name, None)
+        self._entries.pop(name, None)
+        self.sources.pop(name, None)
+        self.dict_files.pop(name, None)
+
+    def __iter__(self):
+        yield from self.dict_files
+        yield from (name for name in self._loaded if name not in self.dict_files)
+
+    def __len__(self):
+        return len(self.dict_files) + sum(1 for name in self._loaded if name not in self.dict_files)
+
+    def is_loaded(self, name):
+        return name in self._loaded
+
+    def loaded(self):
+        """Names of the dictionaries loaded from disk so far."""
+        return [name for name in self._loaded if name in self._stamps]
+
+    def assigned(self):
+        """Names of the dictionaries assigned in memory rather than loaded from disk."""
+        return [name for name in self._loaded if self.sources.get(name) == "assigned"]
+
+    def changed(self):
+        """Names of loaded dictionaries whose file was modified, replaced or removed since it was read."""
+        return [
+            name for name, stamp in self._stamps.items()
+            if current_stamp(os.path.realpath(os.path.join(self.dict_root_path, self.dict_files[name]))) != stamp
+        ]
+
+    def load(self, names=None):
+        """Load `names` (default: every dictionary) now instead of on first access."""
+        for name in self.dict_files if names is None else names:
+            self.get(name)
+
+    def report(self):
+        """
+        Describe every known dictionary: whether it is loaded, where it came from,
+        its entry count and approximate memory cost in bytes (None if not loaded).
+        """
+        rows = []
+        for name in self:
+            table = self._loaded.get(name)
+            rows.append({
+                "name": name,
+                "file": self.dict_files.get(name),
+                "loaded": table is not None,
+                "source": self.sources.get(name),
+                "entries": len(table) if table is not None else None,
+                "bytes": None if table is None else self._size(name, table),
+            })
+        return rows
+
+    def _size(self, name, table):
+        entry = self._entries.get(name)
+        if entry is None:
+            return table_size(table)
+        # Shared with every store using this table; measuring it twice in a race gives the same number.
+        if entry[3] is None:
+            entry[3] = table_size(table)
+        return entry[3]
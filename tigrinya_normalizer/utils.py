@@ -2,6 +2,7 @@
 import re
 import unicodedata
 import json
+import hashlib
 
 def normalize_unicode(text):
     """
@@ -62,4 +63,15 @@ def remove_extra_spaces(text):
     """
     Removes extra spaces: collapses multiple spaces and strips leading/trailing spaces.
     """
-    return re.sub(r'\s+', ' ', text).strip()
\ No newline at end of file
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def file_digest(path):
+    """
+    Return the SHA-256 hex digest of the file at `path`, read in blocks.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for data in iter(lambda: f.read(1 << 20), b""):
+            digest.update(data)
+    return digest.hexdigest()